@@ -0,0 +1,195 @@
+import ast
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
+
+import click
+
+from .parse_cache import DEFAULT_CACHE_DIR, hash_file
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("ADVENT_ANSWER_CACHE", "") not in {"", "0"}
+
+
+def get_cache_path() -> Path:
+    return (
+        Path(os.environ.get("ADVENT_CACHE_DIR", DEFAULT_CACHE_DIR)) / "answers.sqlite3"
+    )
+
+
+def get_max_entries() -> int:
+    return int(os.environ.get("ADVENT_ANSWER_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+
+
+def _get_imported_modules(module_name: str) -> Iterator[str]:
+    """Modules of the package imported (relatively) by the module."""
+    spec = importlib.util.find_spec(module_name)
+    assert spec is not None and spec.origin is not None, module_name
+    tree = ast.parse(Path(spec.origin).read_text())
+    package = (
+        module_name
+        if spec.submodule_search_locations is not None
+        else module_name.rpartition(".")[0]
+    )
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom) or not node.level:
+            continue
+        base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+        if node.module is not None:
+            yield f"{base}.{node.module}"
+        else:
+            # `from . import module`
+            for alias in node.names:
+                if importlib.util.find_spec(f"{base}.{alias.name}") is not None:
+                    yield f"{base}.{alias.name}"
+
+
+@functools.cache
+def get_solver_version(module_name: str) -> str:
+    """Hash of the sources of the solver and of every module it relies on."""
+    seen: set[str] = set()
+    to_visit = [module_name]
+    while to_visit:
+        name = to_visit.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        to_visit.extend(_get_imported_modules(name))
+    digest = hashlib.sha256()
+    for name in sorted(seen):
+        spec = importlib.util.find_spec(name)
+        assert spec is not None and spec.origin is not None, name
+        digest.update(name.encode())
+        digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+class Key(NamedTuple):
+    day: int
+    task: int
+    input_hash: str
+    parameters: str
+    solver_version: str
+
+
+class AnswerCache:
+    """
+    Answers of solvers keyed by the day and task, the content of the input file,
+    the extra arguments and the sources of the solver.
+
+    Kept in an SQLite database, so that the worker processes of a run can share it.
+    Least recently used answers are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, path: Path, max_entries: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "day INTEGER, task INTEGER, input_hash TEXT, parameters TEXT, "
+            "solver_version TEXT, answer TEXT, duration REAL, "
+            "last_used REAL, hits INTEGER DEFAULT 0, "
+            "PRIMARY KEY (day, task, input_hash, parameters, solver_version))"
+        )
+        self.max_entries = max_entries
+
+    @staticmethod
+    def get_key(
+        day: int, task: int, module_name: str, filename: Path, arguments: dict[str, Any]
+    ) -> Key:
+        return Key(
+            day=day,
+            task=task,
+            input_hash=hash_file(filename),
+            parameters=json.dumps(arguments, sort_keys=True, default=repr),
+            solver_version=get_solver_version(module_name),
+        )
+
+    def load(self, key: Key) -> str | None:
+        row = self.connection.execute(
+            "UPDATE answers SET last_used = ?, hits = hits + 1 WHERE day = ? "
+            "AND task = ? AND input_hash = ? AND parameters = ? "
+            "AND solver_version = ? RETURNING answer",
+            (time.time(), *key),
+        ).fetchone()
+        return None if row is None else str(row[0])
+
+    def store(self, key: Key, answer: str, duration: float) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO answers (day, task, input_hash, parameters, "
+            "solver_version, answer, duration, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (*key, answer, duration, time.time()),
+        )
+        self.evict()
+
+    def evict(self) -> None:
+        self.connection.execute(
+            "DELETE FROM answers WHERE rowid NOT IN "
+            "(SELECT rowid FROM answers ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def invalidate(self, day: int | None = None, task: int | None = None) -> int:
+        """Drop the answers of the day and task, all of them by default."""
+        cursor = self.connection.execute(
+            "DELETE FROM answers "
+            "WHERE (? IS NULL OR day = ?) AND (? IS NULL OR task = ?)",
+            (day, day, task, task),
+        )
+        return cursor.rowcount
+
+    def get_stats(self) -> list[tuple[int, int, int, int, float]]:
+        """Entries, hits and the solving time saved by them, per day and task."""
+        return self.connection.execute(
+            "SELECT day, task, COUNT(*), SUM(hits), SUM(hits * duration) "
+            "FROM answers GROUP BY day, task ORDER BY day, task"
+        ).fetchall()
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def get_cache() -> AnswerCache:
+    return AnswerCache(get_cache_path(), get_max_entries())
+
+
+@click.group()
+def main() -> None:
+    """Inspect or invalidate the cached answers of the solvers."""
+
+
+@main.command()
+def stats() -> None:
+    """Show the cached answers and their hits per day and task."""
+    cache = get_cache()
+    for day, task, entries, hits, saved in cache.get_stats():
+        click.echo(
+            f"day {day:02d} task {task}: {entries} answers, {hits} hits, "
+            f"{saved:.3f}s saved"
+        )
+    cache.close()
+
+
+@main.command()
+@click.option("--day", "-d", type=int, help="Only the answers of this day")
+@click.option("--task", "-t", type=int, help="Only the answers of this task")
+def clear(day: int | None, task: int | None) -> None:
+    """Drop cached answers, all of them by default."""
+    cache = get_cache()
+    click.echo(f"Dropped {cache.invalidate(day, task)} answers")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import glob
+import importlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+import click
+
+from . import progress
+from .cli_utils import get_solver
+from .parallel import get_map_chunksize
+from .runner import Job, Result, Task, run_job, select_tasks
+
+
+def expand_inputs(inputs: Iterable[str]) -> list[Path]:
+    """Files of the directories and matches of the globs, plain paths as given."""
+    filenames: list[Path] = []
+    for spec in inputs:
+        path = Path(spec)
+        if path.is_dir():
+            filenames.extend(
+                sorted(
+                    child
+                    for child in path.iterdir()
+                    if child.is_file() and not child.name.startswith(".")
+                )
+            )
+        elif any(char in spec for char in "*?["):
+            filenames.extend(sorted(map(Path, glob.glob(spec, recursive=True))))
+        else:
+            filenames.append(path)
+    return filenames
+
+
+def parse_arguments(task: Task, arguments: Iterable[str]) -> dict[str, Any]:
+    """`NAME=VALUE` pairs converted by the click parameters of the solver."""
+    command: click.Command = importlib.import_module(task.module_name).main
+    # only the parameters of the solver itself, not the ones added by `wrap_main`
+    solver_parameters = list(inspect.signature(get_solver(command)).parameters)[1:]
+    params = {
+        param.name: param for param in command.params if param.name in solver_parameters
+    }
+    result: dict[str, Any] = {}
+    for argument in arguments:
+        name, sep, value = argument.partition("=")
+        name = name.replace("-", "_")
+        if not sep or name not in params:
+            raise click.BadParameter(
+                f"{argument!r} is not NAME=VALUE of any of {', '.join(params)}",
+                param_hint="--arg",
+            )
+        result[name] = params[name].type_cast_value(click.Context(command), value)
+    return result
+
+
+def _warm_up(task: Task) -> None:
+    # imported once per worker, instead of once per input file
+    importlib.import_module(task.module_name)
+
+
+def solve_batch(
+    task: Task,
+    filenames: Iterable[Path],
+    arguments: dict[str, Any],
+    *,
+    workers: int,
+) -> Iterator[Result]:
+    """Results of solving every file, in order, by a pool of warmed up workers."""
+    jobs = [
+        Job(task=task, filename=filename, arguments=arguments) for filename in filenames
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_warm_up, initargs=(task,)
+    ) as executor:
+        yield from executor.map(
+            run_job, jobs, chunksize=get_map_chunksize(len(jobs), workers)
+        )
+
+
+def format_record(result: Result) -> str:
+    return json.dumps(
+        {
+            "day": result.job.task.day,
+            "task": result.job.task.task,
+            "variant": result.job.task.variant,
+            "filename": str(result.job.filename),
+            "answer": result.answer,
+            "error": result.error,
+            "duration": round(result.duration, 6),
+            "cached": result.cached,
+        }
+    )
+
+
+@click.command()
+@click.argument("day", type=int)
+@click.argument("task", type=int)
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "--arg",
+    "arguments",
+    multiple=True,
+    metavar="NAME=VALUE",
+    help="Extra solver argument, e.g. target_y=2000000",
+)
+@click.option(
+    "--variant",
+    default="",
+    help="Variant of the solver to run, e.g. vectorized for task_1_vectorized",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Size of the process pool",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the JSON lines of results (stdout by default)",
+)
+def main(
+    day: int,
+    task: int,
+    inputs: tuple[str, ...],
+    arguments: tuple[str, ...],
+    variant: str,
+    workers: int,
+    output: TextIO,
+) -> None:
+    """Solve a task for every input file of the directories or globs in INPUTS."""
+    # nobody watches the progress of the solvers, unless asked for explicitly
+    os.environ.setdefault(progress.BACKEND_VARIABLE, "none")
+    selected = Task(day=day, task=task, variant=variant)
+    if selected not in select_tasks([day], [task]):
+        raise click.UsageError(f"There is no {selected}")
+    extra_arguments = parse_arguments(selected, arguments)
+    filenames = expand_inputs(inputs)
+    start = time.perf_counter()
+    failures = 0
+    for result in solve_batch(selected, filenames, extra_arguments, workers=workers):
+        output.write(format_record(result) + "\n")
+        output.flush()
+        failures += result.error is not None
+    wall_clock = time.perf_counter() - start
+    click.echo(
+        f"Solved {len(filenames)} inputs ({failures} failed) "
+        f"on {workers} workers in {wall_clock:.3f}s",
+        file=sys.stderr,
+    )
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
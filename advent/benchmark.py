@@ -0,0 +1,248 @@
+import contextlib
+import importlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import click
+
+from . import parsing, progress
+from .cli_utils import get_solver
+from .generators import GENERATED_ARGUMENTS, check_size, write_input
+from .runner import Job, Task, get_jobs, select_tasks
+
+PHASES = ("parse", "solve", "total")
+
+
+class Timing(NamedTuple):
+    median: float
+    p95: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "Timing":
+        if len(samples) == 1:
+            (sample,) = samples
+            return cls(median=sample, p95=sample)
+        return cls(
+            median=statistics.median(samples),
+            p95=statistics.quantiles(samples, n=20, method="inclusive")[-1],
+        )
+
+
+class Measurement(NamedTuple):
+    job: Job
+    size: int
+    answer: str
+    timings: dict[str, Timing]
+
+    @property
+    def key(self) -> str:
+        _, _, name = self.job.task.module_name.partition(".")
+        return f"{name}:{self.job.filename.name}"
+
+
+def get_generated_jobs(
+    tasks: Iterable[Task], sizes: Iterable[int], seed: int, directory: Path
+) -> Iterable[Job]:
+    for task in tasks:
+        for size in sizes:
+            filename = write_input(task.day, size, directory, seed=seed)
+            arguments_factory = GENERATED_ARGUMENTS.get((task.day, task.task))
+            arguments = {} if arguments_factory is None else arguments_factory(size)
+            yield Job(task=task, filename=filename, arguments=arguments)
+
+
+def measure(job: Job, *, repeat: int, warmup: int) -> Measurement:
+    module = importlib.import_module(job.task.module_name)
+    solver = get_solver(module.main)
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    answer = ""
+    for run in range(warmup + repeat):
+        parsing.stats.reset()
+        # some solvers print visualizations, keep them out of the report, and lazy
+        # parsers are read whole so that the parse phase is timed on its own
+        with contextlib.redirect_stdout(io.StringIO()), parsing.lazy_parses("drain"):
+            start = time.perf_counter()
+            answer = solver(job.filename, **job.arguments)
+            total = time.perf_counter() - start
+        if run < warmup:
+            continue
+        samples["parse"].append(parsing.stats.duration)
+        samples["solve"].append(total - parsing.stats.duration)
+        samples["total"].append(total)
+    return Measurement(
+        job=job,
+        size=job.filename.stat().st_size,
+        answer=answer,
+        timings={phase: Timing.from_samples(samples[phase]) for phase in PHASES},
+    )
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:7.1f}µs"
+    elif seconds < 1:
+        return f"{seconds * 1e3:7.1f}ms"
+    else:
+        return f"{seconds:7.2f}s "
+
+
+def format_measurement(measurement: Measurement) -> str:
+    phases = "  ".join(
+        f"{phase} {format_duration(timing.median)} "
+        f"(p95 {format_duration(timing.p95)})"
+        for phase, timing in measurement.timings.items()
+    )
+    return f"{measurement.key:44} {measurement.size:>10}B  {phases}"
+
+
+def read_baseline(path: Path) -> dict[str, dict[str, Timing]]:
+    with path.open() as f:
+        raw: dict[str, dict[str, list[float]]] = json.load(f)
+    return {
+        key: {phase: Timing(*timing) for phase, timing in timings.items()}
+        for key, timings in raw.items()
+    }
+
+
+def write_baseline(path: Path, measurements: Iterable[Measurement]) -> None:
+    raw = {
+        measurement.key: {
+            phase: list(timing) for phase, timing in measurement.timings.items()
+        }
+        for measurement in measurements
+    }
+    with path.open("w") as f:
+        json.dump(raw, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(
+    measurements: Iterable[Measurement],
+    baseline: dict[str, dict[str, Timing]],
+    *,
+    threshold: float,
+    noise_floor: float,
+) -> Iterable[str]:
+    for measurement in measurements:
+        if measurement.key not in baseline:
+            continue
+        for phase, timing in measurement.timings.items():
+            previous = baseline[measurement.key][phase].median
+            slowdown = timing.median - previous
+            if slowdown > noise_floor and slowdown > previous * threshold:
+                yield (
+                    f"{measurement.key} {phase} regressed from "
+                    f"{format_duration(previous).strip()} to "
+                    f"{format_duration(timing.median).strip()}"
+                )
+
+
+@click.command()
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Days to run")
+@click.option("--task", "-t", "tasks", type=int, multiple=True, help="Tasks to run")
+@click.option(
+    "--data", default="*.txt", show_default=True, help="Glob for the data files"
+)
+@click.option(
+    "--generate",
+    "-g",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="Benchmark generated inputs of these sizes instead of the data files",
+)
+@click.option(
+    "--seed", type=int, default=0, show_default=True, help="Seed of generated inputs"
+)
+@click.option(
+    "--repeat", "-r", type=click.IntRange(min=1), default=5, show_default=True
+)
+@click.option("--warmup", type=click.IntRange(min=0), default=1, show_default=True)
+@click.option(
+    "--save-baseline",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write the measured timings to this JSON file",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Fail if any timing regressed compared to this JSON file",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Relative slowdown of the median that counts as a regression",
+)
+@click.option(
+    "--noise-floor",
+    type=float,
+    default=0.001,
+    show_default=True,
+    help="Slowdowns below this many seconds are never regressions",
+)
+def main(
+    days: tuple[int, ...],
+    tasks: tuple[int, ...],
+    data: str,
+    sizes: tuple[int, ...],
+    seed: int,
+    repeat: int,
+    warmup: int,
+    save_baseline: Path | None,
+    baseline: Path | None,
+    threshold: float,
+    noise_floor: float,
+) -> None:
+    # nobody watches the progress of the solvers, unless asked for explicitly
+    os.environ.setdefault(progress.BACKEND_VARIABLE, "none")
+    measurements: list[Measurement] = []
+    failures = 0
+    for task in select_tasks(days, tasks) if sizes else []:
+        for size in sizes:
+            check_size(task.day, size, param_hint="--generate")
+    with tempfile.TemporaryDirectory() as generated_dir:
+        if sizes:
+            jobs = get_generated_jobs(
+                select_tasks(days, tasks), sizes, seed, Path(generated_dir)
+            )
+        else:
+            jobs = get_jobs(select_tasks(days, tasks), data)
+        for job in jobs:
+            try:
+                measurement = measure(job, repeat=repeat, warmup=warmup)
+            except Exception as ex:
+                click.echo(f"{job.task} {job.filename.name} FAILED {ex!r}", err=True)
+                failures += 1
+                continue
+            click.echo(format_measurement(measurement))
+            measurements.append(measurement)
+
+    if save_baseline is not None:
+        write_baseline(save_baseline, measurements)
+    if baseline is not None:
+        regressions = list(
+            find_regressions(
+                measurements,
+                read_baseline(baseline),
+                threshold=threshold,
+                noise_floor=noise_floor,
+            )
+        )
+        for regression in regressions:
+            click.echo(regression, err=True)
+        if regressions:
+            raise click.ClickException(f"{len(regressions)} timings regressed")
+    if failures:
+        raise click.ClickException(f"{failures} benchmarks failed")
+
+
+if __name__ == "__main__":
+    main()
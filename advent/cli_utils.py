@@ -1,25 +1,107 @@
+import contextlib
 import functools
+import sys
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Concatenate, ParamSpec, cast
 
 import click
 
+if TYPE_CHECKING:
+    from .profiling import Profiler
 
-def wrap_main(main: Callable[[Path], str]) -> Callable[[], None]:
+P = ParamSpec("P")
+
+INPUT_PATH = click.Path(
+    exists=True,
+    file_okay=True,
+    dir_okay=False,
+    readable=True,
+    # `-` stands for the standard input, see `io_utils.open_input`
+    allow_dash=True,
+    path_type=Path,
+)
+
+
+def wrap_main(main: Callable[Concatenate[Path, P], str]) -> click.Command:
     @functools.wraps(main)
-    def main_wrapper(filename: Path) -> None:
-        click.echo(main(filename))
-
-    return click.command()(
-        click.argument(
-            "filename",
-            type=click.Path(
-                exists=True,
-                file_okay=True,
-                dir_okay=False,
-                readable=True,
-                path_type=Path,
-            ),
-            required=True,
-        )(main_wrapper)
+    def main_wrapper(filename: Path, *args: P.args, **kwargs: P.kwargs) -> None:
+        profile = cast(bool, kwargs.pop("profile"))
+        profile_stacks = cast(Path | None, kwargs.pop("profile_stacks"))
+        memory = kwargs.pop("memory")
+        record = cast(Path | None, kwargs.pop("record"))
+        if not (profile or profile_stacks or memory or record):
+            click.echo(main(filename, *args, **kwargs))
+            return
+        # only instrumented runs pay for importing the instrumentation
+        run: Callable[..., str] = main
+        with contextlib.ExitStack() as stack:
+            if memory:
+                from .memory import MemoryReport
+
+                report = MemoryReport()
+                # written once the report has been collected on exit
+                stack.callback(report.write, sys.stderr)
+                stack.enter_context(report)
+            if profile or profile_stacks:
+                from .profiling import Profiler
+
+                profiler = Profiler()
+                stack.callback(_write_profile, profiler, profile, profile_stacks)
+                run = functools.partial(profiler.run, run)
+            if record:
+                from .records import RunRecorder
+
+                recorder = RunRecorder(
+                    main,
+                    record,
+                    instrumented=bool(profile or profile_stacks or memory),
+                )
+                run = functools.partial(recorder.run, run)
+            click.echo(run(filename, *args, **kwargs))
+
+    # extra click parameters declared on `main` come after the filename
+    command = click.command()(main_wrapper)
+    command.params.insert(
+        0, click.Argument(["filename"], type=INPUT_PATH, required=True)
     )
+    command.params += [
+        click.Option(
+            ["--profile"],
+            is_flag=True,
+            help="Report the functions with the highest cumulative time on stderr",
+        ),
+        click.Option(
+            ["--profile-stacks"],
+            type=click.Path(dir_okay=False, writable=True, path_type=Path),
+            help="Write the profiled call stacks in collapsed (flame graph) format",
+        ),
+        click.Option(
+            ["--memory"],
+            is_flag=True,
+            help="Report peak memory, top allocation sites and solver cache sizes "
+            "on stderr",
+        ),
+        click.Option(
+            ["--record"],
+            type=click.Path(dir_okay=False, writable=True, path_type=Path),
+            help="Append a JSON record of the run (answer, input hash, durations, "
+            "peak memory, versions) to this JSON lines file",
+        ),
+    ]
+    return command
+
+
+def _write_profile(
+    profiler: "Profiler", profile: bool, profile_stacks: Path | None
+) -> None:
+    if profile:
+        profiler.write_table(sys.stderr)
+    if profile_stacks:
+        with profile_stacks.open("w") as f:
+            profiler.write_collapsed_stacks(f)
+
+
+def get_solver(command: click.Command) -> Callable[..., str]:
+    """Recover the plain `main(filename, ...) -> str` function of a command."""
+    solver: Callable[..., str] = getattr(command.callback, "__wrapped__")
+    return solver
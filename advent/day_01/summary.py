@@ -0,0 +1,78 @@
+import heapq
+import math
+from typing import Iterable
+
+from ..io_utils import split_lines
+from .task_1 import group_snacks
+
+
+class CalorieSummary:
+    """
+    Running summary of the calories per elf of an inventory that streams in.
+
+    Lines (see `add_lines`) or arbitrary byte chunks (see `add_bytes`) are
+    consumed incrementally, and split into elves by `group_snacks` like `read_data`
+    does. Only the `k` best totals, the elf in progress and the last incomplete
+    line are kept, so memory does not grow with the input. The summary can be
+    queried at any point, it covers the elves completed so far; `finish` completes
+    the last one.
+    """
+
+    def __init__(self, k: int = 3) -> None:
+        assert k >= 1
+        self.k = k
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        # sum of squared differences from the mean (Welford)
+        self.squared_deviations = 0.0
+        # min-heap of the best totals
+        self.best: list[int] = []
+        self.current = 0
+        self.pending = b""
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the totals per elf."""
+        return self.squared_deviations / self.count if self.count else math.nan
+
+    @property
+    def top(self) -> list[int]:
+        """The `k` highest totals so far, highest first."""
+        return sorted(self.best, reverse=True)
+
+    def add_elf(self, calories: int) -> None:
+        self.count += 1
+        self.total += calories
+        delta = calories - self.mean
+        self.mean += delta / self.count
+        self.squared_deviations += delta * (calories - self.mean)
+        if len(self.best) < self.k:
+            heapq.heappush(self.best, calories)
+        elif calories > self.best[0]:
+            heapq.heapreplace(self.best, calories)
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        # split like `read_data` does, the first elf continues the one in progress
+        # and the last one is in progress until a blank line ends it
+        elves = map(sum, group_snacks(lines))
+        self.current += next(elves)
+        for calories in elves:
+            self.add_elf(self.current)
+            self.current = calories
+
+    def add_bytes(self, chunk: bytes | memoryview) -> None:
+        data = self.pending + bytes(chunk)
+        # the last line may continue in the next chunk
+        stop = data.rfind(b"\n") + 1
+        self.pending = data[stop:]
+        if stop:
+            self.add_lines(split_lines(data[:stop]))
+
+    def finish(self) -> None:
+        """Complete the last elf, at the end of the input."""
+        if self.pending:
+            self.add_lines(split_lines(self.pending))
+            self.pending = b""
+        self.add_elf(self.current)
+        self.current = 0
@@ -1,34 +1,35 @@
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
-import click
+from ..cli_utils import wrap_main
+from ..io_utils import get_stripped_lines
+from ..parsing import parser
 
 
-def read_data(filename: Path) -> Iterable[list[int]]:
-    with open(filename, "r", encoding="utf-8") as f:
-        buf: list[int] = []
-        for line in f:
-            line = line.strip()
-            if not line:
-                yield buf
-                buf = []
-            else:
-                buf.append(int(line))
+def group_snacks(lines: Iterable[str]) -> Iterator[list[int]]:
+    """Snacks of every elf, the elves being separated by blank lines."""
+    buf: list[int] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            yield buf
+            buf = []
+        else:
+            buf.append(int(line))
     yield buf
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True, file_okay=True, dir_okay=False, readable=True, path_type=Path
-    ),
-)
-def main(filename: Path) -> None:
+@parser
+def read_data(filename: Path) -> Iterable[list[int]]:
+    return group_snacks(get_stripped_lines(filename))
+
+
+@wrap_main
+def main(filename: Path) -> str:
     snacks_per_elf = read_data(filename)
     calories_per_elf = map(sum, snacks_per_elf)
     max_calories = max(calories_per_elf)
-    click.echo(max_calories)
+    return str(max_calories)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+import mmap
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import map_file, normalize_line_breaks, parse_ints
+from ..parsing import parser
+
+
+def sum_calories(data: bytes | memoryview | mmap.mmap) -> npt.NDArray[np.int64]:
+    """Total calories of every elf of the inventory, in order."""
+    data = normalize_line_breaks(data)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    calories = parse_ints(data)
+    line_ends = np.flatnonzero(raw == ord("\n"))
+    if len(raw) and raw[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(raw))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    is_blank = line_starts == line_ends
+    # every other line holds a single number
+    assert len(calories) == len(line_ends) - np.count_nonzero(is_blank)
+    # elves are separated by blank lines, so the snacks of an elf are the numbers
+    # between the counts of numbers before two consecutive blank lines
+    numbers_before = np.cumsum(~is_blank)[is_blank]
+    bounds = np.concatenate(([0], numbers_before, [len(calories)]))
+    running_total = np.concatenate(([0], np.cumsum(calories)))
+    totals: npt.NDArray[np.int64] = (
+        running_total[bounds[1:]] - running_total[bounds[:-1]]
+    )
+    return totals
+
+
+@parser
+def read_calories(filename: Path) -> npt.NDArray[np.int64]:
+    with map_file(filename) as mapped:
+        return sum_calories(mapped)
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    calories_per_elf = read_calories(filename)
+    return str(calories_per_elf.max())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import heapq
+import itertools as it
+import os
+from pathlib import Path
+from typing import Iterable
+
+import click
+import numpy as np
+
+from ..cli_utils import wrap_main
+from ..io_utils import (
+    DEFAULT_CHUNK_SIZE,
+    is_stream,
+    iter_chunk_bounds,
+    iter_chunks,
+    map_file,
+    normalize_line_breaks,
+)
+from ..parallel import map_file_chunks, map_stream_chunks
+from .task_1_vectorized import sum_calories
+
+# elves are separated by blank lines, so chunks must end with one (the chunks of
+# files with Windows line breaks end with `\r\n\r\n`, see `iter_chunk_bounds`)
+ELF_DELIMITER = b"\n\n"
+
+
+def top_calories(chunk: bytes | memoryview, k: int) -> list[int]:
+    """The `k` highest totals of the elves of the chunk, highest first."""
+    data = normalize_line_breaks(chunk)
+    if bytes(data[-2:]) == ELF_DELIMITER:
+        # the blank line ends the last elf of the chunk and does not start another
+        data = data[:-1]
+    totals = sum_calories(data)
+    kth = max(len(totals) - k, 0)
+    best = np.partition(totals, kth)[kth:]
+    return sorted(best.tolist(), reverse=True)
+
+
+def iter_top_calories(
+    filename: Path, k: int, *, workers: int, chunk_size: int
+) -> Iterable[list[int]]:
+    if is_stream(filename):
+        chunks = iter_chunks(filename, chunk_size, ELF_DELIMITER)
+        return map_stream_chunks(top_calories, chunks, k, workers=workers)
+    with map_file(filename) as mapped:
+        bounds = list(iter_chunk_bounds(mapped, chunk_size, ELF_DELIMITER))
+    return map_file_chunks(top_calories, filename, bounds, k, workers=workers)
+
+
+@wrap_main
+@click.option("--top", "-k", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Number of processes summing the chunks",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Bytes of input per chunk, rounded to whole elves",
+)
+def main(
+    filename: Path,
+    top: int = 3,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    best_per_chunk = iter_top_calories(
+        filename, top, workers=workers, chunk_size=chunk_size
+    )
+    # keep only the best of the chunks so far, as they come in
+    best: list[int] = []
+    for chunk_best in best_per_chunk:
+        best = list(it.islice(heapq.merge(best, chunk_best, reverse=True), top))
+    return str(sum(best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import logging
+from pathlib import Path
+
+import click
+
+from ..cli_utils import wrap_main
+from ..io_utils import iter_chunks
+from ..logs import setup_logging
+from .summary import CalorieSummary
+
+logger = logging.getLogger(__name__)
+
+
+@wrap_main
+@click.option("--top", "-k", type=click.IntRange(min=1), default=3, show_default=True)
+def main(filename: Path, top: int = 3) -> str:
+    summary = CalorieSummary(top)
+    for chunk in iter_chunks(filename):
+        summary.add_bytes(chunk)
+        logger.debug(
+            "%d elves so far, best %s, mean %.1f",
+            summary.count,
+            summary.top,
+            summary.mean,
+        )
+    summary.finish()
+    logger.info(
+        "%d elves, best %s, mean %.1f, variance %.1f",
+        summary.count,
+        summary.top,
+        summary.mean,
+        summary.variance,
+    )
+    return str(sum(summary.top))
+
+
+if __name__ == "__main__":
+    setup_logging(logging.INFO)
+    main()
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import numpy as np
+
+from ..cli_utils import wrap_main
+from .task_1_vectorized import read_calories
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    calories_per_elf = read_calories(filename)
+    # no full sort, only the three best have to be at the end
+    kth = max(len(calories_per_elf) - 3, 0)
+    three_best = np.partition(calories_per_elf, kth)[kth:]
+    return str(three_best.sum())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ..generators import write_input
+from .summary import CalorieSummary
+from .task_1 import read_data
+
+
+@pytest.fixture
+def inventory(tmp_path: Path) -> Path:
+    return write_input(1, 100, tmp_path)
+
+
+def check_summary(summary: CalorieSummary, inventory: Path) -> None:
+    totals = np.array(list(map(sum, read_data(inventory))))
+    assert summary.count == len(totals)
+    assert summary.total == totals.sum()
+    assert summary.mean == pytest.approx(totals.mean())
+    assert summary.variance == pytest.approx(totals.var())
+    assert summary.top == sorted(totals, reverse=True)[: summary.k]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+@pytest.mark.parametrize("k", [1, 3])
+def test_add_bytes(inventory: Path, chunk_size: int, k: int) -> None:
+    data = inventory.read_bytes()
+    summary = CalorieSummary(k)
+    for start in range(0, len(data), chunk_size):
+        summary.add_bytes(data[start : start + chunk_size])
+    summary.finish()
+    check_summary(summary, inventory)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4096])
+def test_windows_line_breaks(inventory: Path, chunk_size: int) -> None:
+    data = inventory.read_bytes().replace(b"\n", b"\r\n")
+    crlf_inventory = inventory.with_name("crlf.txt")
+    crlf_inventory.write_bytes(data)
+    summary = CalorieSummary()
+    for start in range(0, len(data), chunk_size):
+        summary.add_bytes(data[start : start + chunk_size])
+    summary.finish()
+    check_summary(summary, crlf_inventory)
+    check_summary(summary, inventory)
+
+
+def test_add_lines(inventory: Path) -> None:
+    summary = CalorieSummary()
+    lines = inventory.read_text().removesuffix("\n").split("\n")
+    # an elf in progress continues in the next call
+    summary.add_lines(lines[:3])
+    summary.add_lines(lines[3:])
+    summary.finish()
+    check_summary(summary, inventory)
+
+
+def test_query_while_streaming() -> None:
+    summary = CalorieSummary(2)
+    summary.add_bytes(b"1\n2\n\n10\n\n4")
+    assert (summary.count, summary.top, summary.mean) == (2, [10, 3], 6.5)
+    summary.add_bytes(b"0\n")
+    summary.finish()
+    assert (summary.count, summary.top) == (3, [40, 10])
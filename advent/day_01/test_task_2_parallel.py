@@ -0,0 +1,81 @@
+import gzip
+import heapq
+import io
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from ..cli_utils import get_solver
+from ..generators import write_input
+from ..io_utils import STDIN, iter_chunks
+from . import task_2_parallel
+from .task_1 import read_data
+from .task_2_parallel import iter_top_calories, main
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+@pytest.mark.parametrize("workers, chunk_size", [(1, 10_000), (2, 10_000), (2, 1)])
+def test_top_calories(tmp_path: Path, k: int, workers: int, chunk_size: int) -> None:
+    filename = write_input(1, 200, tmp_path)
+    expected = sum(heapq.nlargest(k, map(sum, read_data(filename))))
+    answer = get_solver(main)(filename, top=k, workers=workers, chunk_size=chunk_size)
+    assert answer == str(expected)
+
+
+def test_more_elves_asked_for_than_there_are(tmp_path: Path) -> None:
+    filename = tmp_path / "input.txt"
+    filename.write_text("1\n2\n\n3\n")
+    assert get_solver(main)(filename, top=5, chunk_size=2) == "6"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streams(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: int) -> None:
+    filename = write_input(1, 200, tmp_path)
+    expected = get_solver(main)(filename, workers=1)
+    compressed = tmp_path / "input.txt.gz"
+    compressed.write_bytes(gzip.compress(filename.read_bytes()))
+    solver = get_solver(main)
+    assert solver(compressed, workers=workers, chunk_size=1000) == expected
+    monkeypatch.setattr(
+        sys, "stdin", io.TextIOWrapper(io.BytesIO(filename.read_bytes()))
+    )
+    assert solver(STDIN, workers=workers, chunk_size=1000) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_windows_line_breaks(tmp_path: Path, workers: int) -> None:
+    filename = write_input(1, 200, tmp_path)
+    expected = get_solver(main)(filename, workers=1)
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(filename.read_bytes().replace(b"\n", b"\r\n"))
+    compressed = tmp_path / "crlf.txt.gz"
+    compressed.write_bytes(gzip.compress(crlf.read_bytes()))
+    for path in (crlf, compressed):
+        # split into many chunks, not read as a single one
+        assert len(list(iter_top_calories(path, 3, workers=1, chunk_size=100))) > 10
+        assert get_solver(main)(path, workers=workers, chunk_size=100) == expected
+
+
+def test_streams_are_read_as_the_workers_go(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compressed = tmp_path / "input.txt.gz"
+    compressed.write_bytes(gzip.compress(write_input(1, 200, tmp_path).read_bytes()))
+    chunks_read = 0
+
+    def counted_chunks(
+        filename: Path, chunk_size: int, delimiter: bytes
+    ) -> Iterator[memoryview]:
+        nonlocal chunks_read
+        for chunk in iter_chunks(filename, chunk_size, delimiter):
+            chunks_read += 1
+            yield chunk
+
+    monkeypatch.setattr(task_2_parallel, "iter_chunks", counted_chunks)
+    best = iter(iter_top_calories(compressed, 3, workers=2, chunk_size=100))
+    next(best)
+    # at most two chunks per worker in flight, and the one to be submitted next
+    assert chunks_read == 5
+    assert len(list(best)) > 10
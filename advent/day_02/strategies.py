@@ -0,0 +1,117 @@
+import itertools as it
+import mmap
+from pathlib import Path
+from typing import Sequence
+
+import click
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import map_file
+from ..parsing import parser
+from .task_1 import OPPONENT_SHAPE_TO_SHAPE, RESULTS, SHAPE_SCORES, Shape
+from .task_1_vectorized import OPPONENT_LETTERS, PLAYER_LETTERS, iter_round_blocks
+from .task_2 import PLAYS, RESULT_SCORES, Result
+
+# A strategy tells what the player's letters `X`, `Y` and `Z` stand for, either a
+# shape to play or a result to aim for. On the command line it is written as the
+# initials of the shapes (`RPS`) or results (`LDW`) the three letters stand for.
+SHAPE_INITIALS = {shape.name[0]: shape for shape in Shape}
+RESULT_INITIALS = {result.name[0]: result for result in Result}
+
+Strategy = dict[str, Shape] | dict[str, Result]
+
+
+def get_strategy_table(strategy: Strategy) -> npt.NDArray[np.uint8]:
+    """3x3 score table of a strategy, by the indices of the two letters."""
+    assert sorted(strategy) == PLAYER_LETTERS, strategy
+    table = np.zeros((len(OPPONENT_LETTERS), len(PLAYER_LETTERS)), dtype=np.uint8)
+    for (i, opponent), (j, letter) in it.product(
+        enumerate(OPPONENT_LETTERS), enumerate(PLAYER_LETTERS)
+    ):
+        opponent_shape = OPPONENT_SHAPE_TO_SHAPE[opponent]
+        meaning = strategy[letter]
+        if isinstance(meaning, Result):
+            player_shape = PLAYS[opponent_shape, meaning]
+            table[i, j] = SHAPE_SCORES[player_shape] + RESULT_SCORES[meaning]
+        else:
+            table[i, j] = SHAPE_SCORES[meaning] + RESULTS[opponent_shape, meaning]
+    return table
+
+
+def parse_strategy(initials: str) -> Strategy:
+    if sorted(initials) == sorted(SHAPE_INITIALS):
+        return {
+            letter: SHAPE_INITIALS[initial]
+            for letter, initial in zip(PLAYER_LETTERS, initials)
+        }
+    if sorted(initials) != sorted(RESULT_INITIALS):
+        raise click.BadParameter(
+            f"{initials!r} is not the initials of the shapes (RPS) or of the "
+            "results (LDW) in some order",
+            param_hint="--strategy",
+        )
+    return {
+        letter: RESULT_INITIALS[initial]
+        for letter, initial in zip(PLAYER_LETTERS, initials)
+    }
+
+
+def count_rounds(data: bytes | memoryview | mmap.mmap) -> npt.NDArray[np.int64]:
+    """How many times every pair of letters is played, by the flattened index."""
+    counts = np.zeros(len(OPPONENT_LETTERS) * len(PLAYER_LETTERS), dtype=np.int64)
+    for block in iter_round_blocks(data):
+        counts += np.bincount(block, minlength=len(counts))
+    return counts
+
+
+def check_strategies(
+    ctx: click.Context, param: click.Parameter, value: tuple[str, ...]
+) -> tuple[str, ...]:
+    for initials in value:
+        parse_strategy(initials)
+    return value
+
+
+@parser
+def read_round_counts(filename: Path) -> npt.NDArray[np.int64]:
+    with map_file(filename) as mapped:
+        return count_rounds(mapped)
+
+
+def score_strategies(
+    counts: npt.NDArray[np.int64], tables: Sequence[npt.NDArray[np.uint8]]
+) -> list[int]:
+    """
+    Total score of the rounds under each of the strategy tables.
+
+    Only the 9 pair counts get weighted, so a strategy costs the same whatever
+    the number of rounds.
+    """
+    weights = np.stack(tables).reshape(len(tables), -1).astype(np.int64)
+    return [int(score) for score in weights @ counts]
+
+
+@wrap_main
+@click.option(
+    "--strategy",
+    "-s",
+    "strategies",
+    multiple=True,
+    default=("RPS", "LDW"),
+    show_default=True,
+    callback=check_strategies,
+    help="Shapes (RPS) or results (LDW) that X, Y and Z stand for, repeatable",
+)
+def main(filename: Path, strategies: Sequence[str] = ("RPS", "LDW")) -> str:
+    counts = read_round_counts(filename)
+    tables = [get_strategy_table(parse_strategy(initials)) for initials in strategies]
+    scores = score_strategies(counts, tables)
+    return "\n".join(
+        f"{initials} {score}" for initials, score in zip(strategies, scores)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ from __future__ import annotations
 from enum import Enum
 from pathlib import Path
 
-import click
+from ..cli_utils import wrap_main
+from ..io_utils import get_stripped_lines
 
 
 class Shape(str, Enum):
@@ -45,24 +46,17 @@ RESULTS: dict[tuple[Shape, Shape], Result] = {
 }
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True, file_okay=True, dir_okay=False, readable=True, path_type=Path
-    ),
-)
-def main(filename: Path) -> None:
+@wrap_main
+def main(filename: Path) -> str:
     total_score = 0
-    with filename.open() as f:
-        for line in f:
-            line = line.strip()
-            opponent, player = line.split(" ")
-            opponent_shape = OPPONENT_SHAPE_TO_SHAPE[opponent]
-            player_shape = Shape(player)
-            total_score += SHAPE_SCORES[player_shape]
-            total_score += RESULTS[opponent_shape, player_shape]
-    click.echo(total_score)
+    for line in get_stripped_lines(filename):
+        line = line.strip()
+        opponent, player = line.split(" ")
+        opponent_shape = OPPONENT_SHAPE_TO_SHAPE[opponent]
+        player_shape = Shape(player)
+        total_score += SHAPE_SCORES[player_shape]
+        total_score += RESULTS[opponent_shape, player_shape]
+    return str(total_score)
 
 
 if __name__ == "__main__":
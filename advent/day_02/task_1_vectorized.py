@@ -0,0 +1,95 @@
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import map_file, normalize_line_breaks
+from ..parsing import parser
+from .task_1 import OPPONENT_SHAPE_TO_SHAPE, RESULTS, SHAPE_SCORES, Shape
+
+OPPONENT_LETTERS = sorted(OPPONENT_SHAPE_TO_SHAPE)
+PLAYER_LETTERS = sorted(shape.value for shape in Shape)
+
+# score of a round by the index of the opponent's and the player's letter
+SCORE_TABLE = np.array(
+    [
+        [
+            SHAPE_SCORES[Shape(player)]
+            + RESULTS[OPPONENT_SHAPE_TO_SHAPE[opponent], Shape(player)]
+            for player in PLAYER_LETTERS
+        ]
+        for opponent in OPPONENT_LETTERS
+    ],
+    dtype=np.uint8,
+)
+
+# A round is a 4 byte record, `A X\n` read as a little endian uint32 is the
+# lowest valid one. Subtracting it leaves just the two letter indices in the first
+# and third byte, any other byte (or a letter before `A` or `X`) shows up in the
+# bits outside of `LETTER_BITS`.
+RECORD = np.dtype("<u4")
+FIRST_RECORD = int.from_bytes(
+    f"{OPPONENT_LETTERS[0]} {PLAYER_LETTERS[0]}\n".encode(), "little"
+)
+LETTER_BITS = 0x00030003
+
+# rounds converted at a time, so that the temporaries stay in the CPU caches
+BLOCK_SIZE = 2**16
+
+
+def iter_round_blocks(
+    data: bytes | memoryview | mmap.mmap,
+) -> Iterator[npt.NDArray[np.uint8]]:
+    """Indices into the flattened 3x3 score tables of the rounds, a block at a time."""
+    # rounds are 4 byte records with `\n` line breaks only
+    data = normalize_line_breaks(data)
+    if len(data) % RECORD.itemsize == 3:
+        # no line break after the last round
+        data = bytes(data) + b"\n"
+    assert len(data) % RECORD.itemsize == 0, "every round is a line of two letters"
+    records = np.frombuffer(data, dtype=RECORD)
+    first_record = np.uint32(FIRST_RECORD)
+    other_bits = np.uint32(~LETTER_BITS & 0xFFFFFFFF)
+    for start in range(0, len(records), BLOCK_SIZE):
+        block = records[start : start + BLOCK_SIZE] - first_record
+        assert not (block & other_bits).any(), "bad round"
+        opponent = block.astype(np.uint8)
+        player = (block >> np.uint32(16)).astype(np.uint8)
+        assert opponent.max() < 3 and player.max() < 3, "bad letter"
+        np.multiply(opponent, np.uint8(3), out=opponent)
+        np.add(opponent, player, out=opponent)
+        yield opponent
+
+
+def parse_rounds(data: bytes | memoryview | mmap.mmap) -> npt.NDArray[np.uint8]:
+    """Index into the flattened 3x3 score tables of every `A X` round."""
+    rounds = np.empty(len(data) // RECORD.itemsize + 1, dtype=np.uint8)
+    size = 0
+    for block in iter_round_blocks(data):
+        rounds[size : size + len(block)] = block
+        size += len(block)
+    return rounds[:size]
+
+
+@parser
+def read_rounds(filename: Path) -> npt.NDArray[np.uint8]:
+    with map_file(filename) as mapped:
+        return parse_rounds(mapped)
+
+
+def score_rounds(rounds: npt.NDArray[np.uint8], table: npt.NDArray[np.uint8]) -> int:
+    """Total score of the rounds by a 3x3 score table."""
+    return int(table.reshape(-1)[rounds].sum(dtype=np.int64))
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    rounds = read_rounds(filename)
+    return str(score_rounds(rounds, SCORE_TABLE))
+
+
+if __name__ == "__main__":
+    main()
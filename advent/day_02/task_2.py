@@ -1,8 +1,8 @@
 from enum import Enum
 from pathlib import Path
 
-import click
-
+from ..cli_utils import wrap_main
+from ..io_utils import get_stripped_lines
 from .task_1 import OPPONENT_SHAPE_TO_SHAPE, SHAPE_SCORES, Shape
 
 
@@ -31,25 +31,18 @@ RESULT_SCORES: dict[Result, int] = {
 }
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True, file_okay=True, dir_okay=False, readable=True, path_type=Path
-    ),
-)
-def main(filename: Path) -> None:
+@wrap_main
+def main(filename: Path) -> str:
     total_score = 0
-    with filename.open() as f:
-        for line in f:
-            line = line.strip()
-            opponent, required_result = line.split(" ")
-            opponent_shape = OPPONENT_SHAPE_TO_SHAPE[opponent]
-            result = Result(required_result)
-            player_shape = PLAYS[opponent_shape, result]
-            total_score += SHAPE_SCORES[player_shape]
-            total_score += RESULT_SCORES[result]
-    click.echo(total_score)
+    for line in get_stripped_lines(filename):
+        line = line.strip()
+        opponent, required_result = line.split(" ")
+        opponent_shape = OPPONENT_SHAPE_TO_SHAPE[opponent]
+        result = Result(required_result)
+        player_shape = PLAYS[opponent_shape, result]
+        total_score += SHAPE_SCORES[player_shape]
+        total_score += RESULT_SCORES[result]
+    return str(total_score)
 
 
 if __name__ == "__main__":
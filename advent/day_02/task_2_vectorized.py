@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import numpy as np
+
+from ..cli_utils import wrap_main
+from .task_1 import OPPONENT_SHAPE_TO_SHAPE, SHAPE_SCORES
+from .task_1_vectorized import OPPONENT_LETTERS, read_rounds, score_rounds
+from .task_2 import PLAYS, RESULT_SCORES, Result
+
+RESULT_LETTERS = sorted(result.value for result in Result)
+
+# score of a round by the index of the opponent's letter and the required result
+SCORE_TABLE = np.array(
+    [
+        [
+            SHAPE_SCORES[PLAYS[OPPONENT_SHAPE_TO_SHAPE[opponent], Result(result)]]
+            + RESULT_SCORES[Result(result)]
+            for result in RESULT_LETTERS
+        ]
+        for opponent in OPPONENT_LETTERS
+    ],
+    dtype=np.uint8,
+)
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    rounds = read_rounds(filename)
+    return str(score_rounds(rounds, SCORE_TABLE))
+
+
+if __name__ == "__main__":
+    main()
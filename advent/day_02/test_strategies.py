@@ -0,0 +1,59 @@
+import itertools as it
+from pathlib import Path
+
+import numpy as np
+from click.testing import CliRunner
+
+from ..cli_utils import get_solver
+from ..generators import write_input
+from . import task_1_vectorized, task_2_vectorized
+from .strategies import (
+    SHAPE_INITIALS,
+    get_strategy_table,
+    main,
+    parse_strategy,
+    read_round_counts,
+    score_strategies,
+)
+from .task_1 import OPPONENT_SHAPE_TO_SHAPE, RESULTS, SHAPE_SCORES
+from .task_1_vectorized import PLAYER_LETTERS
+
+
+def test_puzzle_strategies() -> None:
+    assert np.array_equal(
+        get_strategy_table(parse_strategy("RPS")), task_1_vectorized.SCORE_TABLE
+    )
+    assert np.array_equal(
+        get_strategy_table(parse_strategy("LDW")), task_2_vectorized.SCORE_TABLE
+    )
+
+
+def test_all_shape_strategies(tmp_path: Path) -> None:
+    filename = write_input(2, 500, tmp_path)
+    rounds = [line.split() for line in filename.read_text().splitlines()]
+    strategies = ["".join(p) for p in it.permutations(SHAPE_INITIALS)]
+    tables = [get_strategy_table(parse_strategy(initials)) for initials in strategies]
+    scores = score_strategies(read_round_counts(filename), tables)
+    for initials, score in zip(strategies, scores):
+        shapes = dict(zip(PLAYER_LETTERS, map(SHAPE_INITIALS.__getitem__, initials)))
+        assert score == sum(
+            SHAPE_SCORES[shapes[player]]
+            + RESULTS[OPPONENT_SHAPE_TO_SHAPE[opponent], shapes[player]]
+            for opponent, player in rounds
+        )
+
+
+def test_main(tmp_path: Path) -> None:
+    filename = tmp_path / "input.txt"
+    filename.write_text("A Y\nB X\nC Z")
+    assert get_solver(main)(filename) == "RPS 15\nLDW 12"
+    result = CliRunner().invoke(main, [str(filename), "-s", "RPS", "-s", "RPP"])
+    assert result.exit_code == 2
+    assert "Invalid value for --strategy: 'RPP'" in result.output
+
+
+def test_windows_line_breaks(tmp_path: Path) -> None:
+    filename = write_input(2, 100, tmp_path)
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(filename.read_bytes().replace(b"\n", b"\r\n"))
+    assert np.array_equal(read_round_counts(crlf), read_round_counts(filename))
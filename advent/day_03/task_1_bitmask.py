@@ -0,0 +1,76 @@
+import mmap
+import string
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import iter_chunk_bounds, map_file, normalize_line_breaks
+from ..parsing import parser
+from .task_1 import get_priority
+
+# bit of every byte in the masks of items, the bit index is the priority of the item
+# and bytes that are not items get no bit
+ITEM_BITS = np.zeros(256, dtype=np.uint64)
+for item in string.ascii_letters:
+    ITEM_BITS[ord(item)] = 1 << get_priority(item)
+
+# bytes of whole lines parsed at a time, so that the masks of the items (8 bytes
+# per byte of input) stay small
+BLOCK_SIZE = 2**20
+
+
+def parse_block(raw: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint64]:
+    line_ends = np.flatnonzero(raw == ord("\n"))
+    if raw[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(raw))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    lengths = line_ends - line_starts
+    assert (lengths > 0).all(), "rucksacks hold items"
+    assert (lengths % 2 == 0).all(), "compartments hold the same number of items"
+    items = ITEM_BITS[raw]
+    assert ((items != 0) | (raw == ord("\n"))).all(), "unknown items"
+    # the line breaks end up in the second compartments, but without a bit
+    compartment_starts = np.column_stack((line_starts, line_starts + lengths // 2))
+    masks: npt.NDArray[np.uint64] = np.bitwise_or.reduceat(
+        items, compartment_starts.reshape(-1)
+    )
+    return masks.reshape(-1, 2)
+
+
+def parse_rucksacks(data: bytes | mmap.mmap) -> npt.NDArray[np.uint64]:
+    """Mask of the items in each of the two compartments of every rucksack."""
+    # a `\r` would count as an item
+    data = normalize_line_breaks(data)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    blocks = [np.empty((0, 2), dtype=np.uint64)]
+    for start, stop in iter_chunk_bounds(data, BLOCK_SIZE):
+        blocks.append(parse_block(raw[start:stop]))
+    return np.concatenate(blocks)
+
+
+@parser
+def read_rucksacks(filename: Path) -> npt.NDArray[np.uint64]:
+    with map_file(filename) as mapped:
+        return parse_rucksacks(mapped)
+
+
+def get_priorities(masks: npt.NDArray[np.uint64]) -> npt.NDArray[np.int32]:
+    """Priority of the single item of every mask."""
+    assert (masks != 0).all(), "a single common item"
+    assert not (masks & (masks - np.uint64(1))).any(), "a single common item"
+    # powers of two are exact as floats, their exponent is the index of the bit
+    exponents: npt.NDArray[np.int32] = np.frexp(masks.astype(np.float64))[1]
+    return exponents - 1
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    masks = read_rucksacks(filename)
+    common = masks[:, 0] & masks[:, 1]
+    return str(get_priorities(common).sum())
+
+
+if __name__ == "__main__":
+    main()
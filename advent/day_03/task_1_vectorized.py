@@ -0,0 +1,70 @@
+import mmap
+import string
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import map_file, normalize_line_breaks
+from ..parsing import parser
+from .task_1 import get_priority
+
+# priority of every byte, 0 for the bytes that are not items
+PRIORITIES = np.zeros(256, dtype=np.uint8)
+for item in string.ascii_letters:
+    PRIORITIES[ord(item)] = get_priority(item)
+MAX_PRIORITY = int(PRIORITIES.max())
+
+
+def parse_compartments(data: bytes | memoryview | mmap.mmap) -> npt.NDArray[np.bool_]:
+    """
+    Which items every rucksack holds in each of its two compartments, as an
+    `(N, 2, MAX_PRIORITY + 1)` array indexed by the priority of the item.
+    """
+    # a `\r` would count as an item
+    data = normalize_line_breaks(data)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    line_ends = np.flatnonzero(raw == ord("\n"))
+    if len(raw) and raw[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(raw))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    lengths = line_ends - line_starts
+    assert (lengths % 2 == 0).all(), "compartments hold the same number of items"
+    priorities = PRIORITIES[raw]
+    assert ((priorities != 0) | (raw == ord("\n"))).all(), "unknown items"
+    # number the compartments in order, every byte belongs to the one it is in,
+    # line breaks to the compartment before them (as the item of priority 0)
+    boundaries = np.zeros(len(raw), dtype=np.intp)
+    boundaries[line_starts] = 1
+    boundaries[line_starts + lengths // 2] += 1
+    compartments = np.cumsum(boundaries) - 1
+    present = np.zeros((len(lengths), 2, MAX_PRIORITY + 1), dtype=bool)
+    present.reshape(-1)[compartments * (MAX_PRIORITY + 1) + priorities] = True
+    # the line breaks are no items
+    present[:, :, 0] = False
+    return present
+
+
+@parser
+def read_compartments(filename: Path) -> npt.NDArray[np.bool_]:
+    with map_file(filename) as mapped:
+        return parse_compartments(mapped)
+
+
+def find_common_priorities(present: npt.NDArray[np.bool_]) -> npt.NDArray[np.intp]:
+    """Priority of the only item present in all the sets along the second axis."""
+    common = present.all(axis=1)
+    assert (common.sum(axis=1) == 1).all(), "a single common item"
+    priorities: npt.NDArray[np.intp] = common.argmax(axis=1)
+    return priorities
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    present = read_compartments(filename)
+    return str(find_common_priorities(present).sum())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,26 @@ import functools
 import operator
 from pathlib import Path
 
+import click
 import more_itertools as mit
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from .task_1 import get_priority
 
+# rucksacks of the elves of a group follow each other
+GROUP_SIZE = 3
+
+# the option of every task 2 variant
+group_size_option = click.option(
+    "--group-size",
+    "-g",
+    type=click.IntRange(min=1),
+    default=GROUP_SIZE,
+    show_default=True,
+    help="Number of rucksacks per group",
+)
+
 
 def find_common_item(group: list[set[str]]) -> str:
     common_items = functools.reduce(operator.and_, group)
@@ -17,10 +31,11 @@ def find_common_item(group: list[set[str]]) -> str:
 
 
 @wrap_main
-def main(filename: Path) -> str:
+@group_size_option
+def main(filename: Path, group_size: int = GROUP_SIZE) -> str:
     lines = get_stripped_lines(filename)
     sets = map(set, lines)
-    groups = mit.batched(sets, 3)
+    groups = mit.batched(sets, group_size)
     common_items = map(find_common_item, groups)
     priorities = map(get_priority, common_items)
     total_priority = sum(priorities)
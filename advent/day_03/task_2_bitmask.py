@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from .task_1_bitmask import get_priorities, read_rucksacks
+from .task_2 import GROUP_SIZE, group_size_option
+
+
+def find_badges(
+    masks: npt.NDArray[np.uint64], group_size: int = GROUP_SIZE
+) -> npt.NDArray[np.int32]:
+    """Priority of the badge of every group of `group_size` rucksacks."""
+    items = masks[:, 0] | masks[:, 1]
+    assert len(items) % group_size == 0, "rucksacks come in whole groups"
+    badges = np.bitwise_and.reduce(items.reshape(-1, group_size), axis=1)
+    return get_priorities(badges)
+
+
+@wrap_main
+@group_size_option
+def main(filename: Path, group_size: int = GROUP_SIZE) -> str:
+    masks = read_rucksacks(filename)
+    return str(find_badges(masks, group_size).sum())
+
+
+if __name__ == "__main__":
+    main()
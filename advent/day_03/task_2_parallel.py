@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import click
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import (
+    DEFAULT_CHUNK_SIZE,
+    is_stream,
+    iter_line_group_bounds,
+    iter_line_group_chunks,
+    map_file,
+)
+from ..parallel import map_file_chunks, map_stream_chunks
+from .task_1_bitmask import parse_rucksacks
+from .task_2 import GROUP_SIZE, group_size_option
+from .task_2_bitmask import find_badges
+
+
+class BadgeAudit(NamedTuple):
+    # priority of the badge of every group, in order
+    badges: npt.NDArray[np.int32]
+    total: int
+
+
+def find_badges_in_chunk(
+    chunk: bytes | memoryview, group_size: int
+) -> npt.NDArray[np.int32]:
+    return find_badges(parse_rucksacks(bytes(chunk)), group_size)
+
+
+def iter_badges(
+    filename: Path, group_size: int, *, workers: int, chunk_size: int
+) -> Iterable[npt.NDArray[np.int32]]:
+    if is_stream(filename):
+        chunks = iter_line_group_chunks(filename, group_size, chunk_size)
+        return map_stream_chunks(
+            find_badges_in_chunk, chunks, group_size, workers=workers
+        )
+    with map_file(filename) as mapped:
+        bounds = list(iter_line_group_bounds(mapped, group_size, chunk_size))
+    return map_file_chunks(
+        find_badges_in_chunk, filename, bounds, group_size, workers=workers
+    )
+
+
+def audit_badges(
+    filename: Path,
+    group_size: int = GROUP_SIZE,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BadgeAudit:
+    """
+    Badges of all the groups of the file, found in chunks of whole groups that
+    are spread over `workers` processes.
+    """
+    badges = np.concatenate(
+        [
+            np.empty(0, dtype=np.int32),
+            *iter_badges(filename, group_size, workers=workers, chunk_size=chunk_size),
+        ]
+    )
+    return BadgeAudit(badges, int(badges.sum()))
+
+
+@wrap_main
+@group_size_option
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Number of processes finding the badges",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Bytes of input per chunk, rounded to whole groups",
+)
+def main(
+    filename: Path,
+    group_size: int = GROUP_SIZE,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    audit = audit_badges(filename, group_size, workers=workers, chunk_size=chunk_size)
+    return str(audit.total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from ..cli_utils import wrap_main
+from .task_1_vectorized import find_common_priorities, read_compartments
+from .task_2 import GROUP_SIZE, group_size_option
+
+
+@wrap_main
+@group_size_option
+def main(filename: Path, group_size: int = GROUP_SIZE) -> str:
+    present = read_compartments(filename).any(axis=1)
+    assert len(present) % group_size == 0, "rucksacks come in whole groups"
+    groups = present.reshape(-1, group_size, present.shape[1])
+    return str(find_common_priorities(groups).sum())
+
+
+if __name__ == "__main__":
+    main()
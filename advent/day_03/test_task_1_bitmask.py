@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import numpy as np
+
+from ..cli_utils import get_solver
+from ..generators import write_input
+from . import task_1, task_2, task_2_bitmask
+from .task_1_bitmask import main, parse_rucksacks
+
+
+def test_windows_line_breaks(tmp_path: Path) -> None:
+    filename = write_input(3, 300, tmp_path)
+    data = filename.read_bytes()
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(data.replace(b"\n", b"\r\n"))
+    assert np.array_equal(parse_rucksacks(crlf.read_bytes()), parse_rucksacks(data))
+    assert get_solver(main)(crlf) == get_solver(task_1.main)(filename)
+    assert get_solver(task_2_bitmask.main)(crlf) == get_solver(task_2.main)(filename)
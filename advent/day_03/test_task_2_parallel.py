@@ -0,0 +1,89 @@
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from ..cli_utils import get_solver
+from ..generators import write_input
+from ..io_utils import STDIN
+from . import task_2, task_2_bitmask, task_2_vectorized
+from .task_1 import get_priority
+from .task_2_parallel import audit_badges, main
+
+# groups of two and of four rucksacks, with the badges `b`, `Q` and `z`
+GROUPED = "abcd\nbxyz\nPQRS\nQtuv\nzzAB\nCzDE\n"
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 10_000), (2, 10_000), (2, 1)])
+def test_audit_badges(tmp_path: Path, workers: int, chunk_size: int) -> None:
+    filename = write_input(3, 300, tmp_path)
+    expected = get_solver(task_2.main)(filename)
+    answer = get_solver(main)(filename, workers=workers, chunk_size=chunk_size)
+    assert answer == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streams(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: int) -> None:
+    filename = write_input(3, 300, tmp_path)
+    expected = get_solver(task_2.main)(filename)
+    compressed = tmp_path / "input.txt.gz"
+    compressed.write_bytes(gzip.compress(filename.read_bytes()))
+    solver = get_solver(main)
+    assert solver(compressed, workers=workers, chunk_size=100) == expected
+    monkeypatch.setattr(
+        sys, "stdin", io.TextIOWrapper(io.BytesIO(filename.read_bytes()))
+    )
+    assert solver(STDIN, workers=workers, chunk_size=100) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_windows_line_breaks(tmp_path: Path, workers: int) -> None:
+    filename = write_input(3, 300, tmp_path)
+    expected = get_solver(task_2.main)(filename)
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(filename.read_bytes().replace(b"\n", b"\r\n"))
+    compressed = tmp_path / "crlf.txt.gz"
+    compressed.write_bytes(gzip.compress(crlf.read_bytes()))
+    for path in (crlf, compressed):
+        assert get_solver(main)(path, workers=workers, chunk_size=100) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 12, 10_000])
+def test_group_size(tmp_path: Path, chunk_size: int) -> None:
+    filename = tmp_path / "input.txt"
+    filename.write_text(GROUPED)
+    audit = audit_badges(filename, 2, workers=2, chunk_size=chunk_size)
+    assert audit.badges.tolist() == list(map(get_priority, "bQz"))
+    assert audit.total == sum(map(get_priority, "bQz"))
+    for solver in (task_2.main, task_2_bitmask.main, main):
+        assert get_solver(solver)(filename, group_size=2) == str(audit.total)
+
+
+def test_incomplete_group(tmp_path: Path) -> None:
+    filename = tmp_path / "input.txt"
+    filename.write_text(GROUPED)
+    with pytest.raises(AssertionError):
+        audit_badges(filename, 4)
+    for solver in (task_2_bitmask.main, task_2_vectorized.main):
+        with pytest.raises(AssertionError, match="rucksacks come in whole groups"):
+            get_solver(solver)(filename, group_size=4)
+
+
+def test_group_size_options() -> None:
+    commands = (task_2.main, task_2_bitmask.main, task_2_vectorized.main, main)
+    options = [
+        param
+        for command in commands
+        for param in command.params
+        if isinstance(param, click.Option) and param.name == "group_size"
+    ]
+    assert len(options) == len(commands)
+    for option in options:
+        assert option.to_info_dict() == options[0].to_info_dict()
+        assert (option.show_default, option.help) == (
+            True,
+            "Number of rucksacks per group",
+        )
@@ -1,10 +1,11 @@
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 import more_itertools as mit
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
+from ..parsing import parser
 
 
 class Range(NamedTuple):
@@ -21,6 +22,11 @@ def parse_line(line: str) -> tuple[Range, Range]:
     )
 
 
+@parser
+def read_pairs(filename: Path) -> Iterable[tuple[Range, Range]]:
+    return map(parse_line, get_stripped_lines(filename))
+
+
 def is_subset(superset: Range, subset: Range) -> bool:
     return superset.start <= subset.start and subset.end <= superset.end
 
@@ -32,8 +38,7 @@ def is_overlapping(pair: tuple[Range, Range]) -> bool:
 
 @wrap_main
 def main(filename: Path) -> str:
-    lines = get_stripped_lines(filename)
-    ranges = map(parse_line, lines)
+    ranges = read_pairs(filename)
     overlapping_ranges = filter(is_overlapping, ranges)
     count = mit.ilen(overlapping_ranges)
     return str(count)
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from ..io_utils import read_ints
+from ..parsing import parser
+
+
+@parser
+def read_assignments(filename: Path) -> npt.NDArray[np.int64]:
+    """Left start, left end, right start and right end of every pair, `(N, 4)`."""
+    return read_ints(filename, per_line=4)
+
+
+def count_containing(assignments: npt.NDArray[np.int64]) -> int:
+    """Pairs of which one assignment contains the other."""
+    left_start, left_end, right_start, right_end = assignments.T
+    left_contains = (left_start <= right_start) & (right_end <= left_end)
+    right_contains = (right_start <= left_start) & (left_end <= right_end)
+    return int(np.count_nonzero(left_contains | right_contains))
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    assignments = read_assignments(filename)
+    return str(count_containing(assignments))
+
+
+if __name__ == "__main__":
+    main()
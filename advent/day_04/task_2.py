@@ -4,8 +4,7 @@ from typing import NamedTuple
 import more_itertools as mit
 
 from ..cli_utils import wrap_main
-from ..io_utils import get_stripped_lines
-from .task_1 import Range, parse_line
+from .task_1 import Range, read_pairs
 
 
 def is_overlapping(pair: tuple[Range, Range]) -> bool:
@@ -20,8 +19,7 @@ def is_overlapping(pair: tuple[Range, Range]) -> bool:
 
 @wrap_main
 def main(filename: Path) -> str:
-    lines = get_stripped_lines(filename)
-    ranges = map(parse_line, lines)
+    ranges = read_pairs(filename)
     overlapping_ranges = filter(is_overlapping, ranges)
     count = mit.ilen(overlapping_ranges)
     return str(count)
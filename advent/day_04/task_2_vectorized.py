@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import numpy as np
+from numpy import typing as npt
+
+from ..cli_utils import wrap_main
+from .task_1_vectorized import read_assignments
+
+
+def count_overlapping(assignments: npt.NDArray[np.int64]) -> int:
+    """Pairs of assignments that share at least a section."""
+    left_start, left_end, right_start, right_end = assignments.T
+    return int(np.count_nonzero((left_start <= right_end) & (right_start <= left_end)))
+
+
+@wrap_main
+def main(filename: Path) -> str:
+    assignments = read_assignments(filename)
+    return str(count_overlapping(assignments))
+
+
+if __name__ == "__main__":
+    main()
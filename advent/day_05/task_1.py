@@ -5,10 +5,12 @@ from typing import Iterator, NamedTuple
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
+from ..parsing import parser
 
 pattern = re.compile(r"^move (?P<count>\d+) from (?P<from>\d) to (?P<to>\d)$")
 
 
+@parser
 def parse_stacks(input_lines: Iterator[str]) -> list[list[str]]:
     config_lines: list[str] = []
 
@@ -37,6 +39,7 @@ class Instruction(NamedTuple):
     to: int
 
 
+@parser
 def parse_instructions(input_lines: Iterator[str]) -> Iterator[Instruction]:
     for instruction_line in input_lines:
         match = pattern.match(instruction_line)
@@ -1,13 +1,12 @@
 from pathlib import Path
 
 from ..cli_utils import wrap_main
-from .task_1 import find_position
+from .task_1 import find_position, read_text
 
 
 @wrap_main
 def main(filename: Path) -> str:
-    with filename.open() as f:
-        text = f.read().strip()
+    text = read_text(filename)
     position = find_position(text, window_size=14)
     return str(position)
 
@@ -0,0 +1,26 @@
+import pytest
+
+from .task_1 import find_position
+
+TEST_CASES: list[tuple[str, int, int]] = [
+    ("mjqjpqmgbljsphdztnvjfqwrcgsmlb", 4, 7),
+    ("bvwbjplbgvbhsrlpgdmjqwftvncz", 4, 5),
+    ("nppdvjthqldpwncqszvftbrmjlhg", 4, 6),
+    ("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 4, 10),
+    ("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 4, 11),
+    ("mjqjpqmgbljsphdztnvjfqwrcgsmlb", 14, 19),
+    ("bvwbjplbgvbhsrlpgdmjqwftvncz", 14, 23),
+    ("nppdvjthqldpwncqszvftbrmjlhg", 14, 23),
+    ("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 14, 29),
+    ("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 14, 26),
+]
+
+
+@pytest.mark.parametrize("text, window_size, expected", TEST_CASES)
+def test_find_position(text: str, window_size: int, expected: int) -> None:
+    assert find_position(text, window_size) == expected
+
+
+def test_find_position_no_marker() -> None:
+    with pytest.raises(AssertionError, match="Marker not found"):
+        find_position("abcabcabcabc")
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
+from ..parsing import parser
 
 
 @dataclass
@@ -18,9 +20,9 @@ class Dir:
         return sum(self.files.values()) + sum(dir.size for dir in self.subdirs.values())
 
 
-def process_dir(current: Dir, lines: list[str]) -> None:
+def process_dir(current: Dir, lines: deque[str]) -> None:
     while lines:
-        line = lines.pop(0)
+        line = lines.popleft()
         if line == "$ cd ..":
             return
         elif line.startswith("$ cd "):
@@ -30,7 +32,7 @@ def process_dir(current: Dir, lines: list[str]) -> None:
             process_dir(new_dir, lines)
         elif line == "$ ls":
             while lines and not lines[0].startswith("$"):
-                line = lines.pop(0)
+                line = lines.popleft()
                 type_size, name = line.split(" ", 1)
                 if type_size == "dir":
                     continue
@@ -41,11 +43,14 @@ def process_dir(current: Dir, lines: list[str]) -> None:
             raise AssertionError(line)
 
 
+@parser
 def construct_tree(lines: list[str]) -> Dir:
-    first_line = lines.pop(0)
+    # consumed from the front
+    pending = deque(lines)
+    first_line = pending.popleft()
     assert first_line == "$ cd /"
     root = Dir()
-    process_dir(root, lines)
+    process_dir(root, pending)
     return root
 
 
@@ -1,4 +1,3 @@
-from functools import partial
 from pathlib import Path
 from typing import Callable
 
@@ -6,22 +5,13 @@ import numpy as np
 from numpy import typing as npt
 
 from ..cli_utils import wrap_main
-from ..io_utils import get_stripped_lines
+from ..io_utils import read_char_grid
+from ..parsing import parser
 
 
+@parser
 def parse_matrix(filename: Path) -> npt.NDArray[np.uint8]:
-    return np.array(
-        list(
-            map(
-                lambda items: list(items),
-                map(
-                    partial(map, int),
-                    map(lambda items: list(items), get_stripped_lines(filename)),
-                ),
-            )
-        ),
-        dtype=np.uint8,
-    )
+    return read_char_grid(filename) - np.uint8(ord("0"))
 
 
 def map_matrix(
@@ -6,6 +6,8 @@ from typing import Iterable, NamedTuple
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,7 @@ class Position(NamedTuple):
         return f"({self.x}, {self.y})"
 
 
+@parser
 def parse_instructions(filename: Path) -> Iterable[Instruction]:
     for line in get_stripped_lines(filename):
         direction_str, distance_str = line.split(" ")
@@ -44,26 +47,31 @@ def tail_catchup(tail_location: Position, head_location: Position) -> Position:
     x_step = int(math.copysign(1, x_diff))
     y_diff = head_location.y - tail_location.y
     y_step = int(math.copysign(1, y_diff))
-    logger.debug(
-        "head @ %s, tail @ %s, Δx=%s, Δy=%s",
-        head_location,
-        tail_location,
-        x_diff,
-        y_diff,
-    )
+    if TRACING:
+        logger.debug(
+            "head @ %s, tail @ %s, Δx=%s, Δy=%s",
+            head_location,
+            tail_location,
+            x_diff,
+            y_diff,
+        )
 
     new_tail_location: Position
     if abs(x_diff) <= 1 and abs(y_diff) <= 1:
-        logger.debug("Tail is cought up, NOOP")
+        if TRACING:
+            logger.debug("Tail is cought up, NOOP")
         new_tail_location = tail_location
     elif abs(x_diff) == 2 and abs(y_diff) == 0:
-        logger.debug("Tail jumping X")
+        if TRACING:
+            logger.debug("Tail jumping X")
         new_tail_location = Position(tail_location.x + x_step, tail_location.y)
     elif abs(y_diff) == 2 and abs(x_diff) == 0:
-        logger.debug("Tail jumping Y")
+        if TRACING:
+            logger.debug("Tail jumping Y")
         new_tail_location = Position(tail_location.x, tail_location.y + y_step)
     else:
-        logger.debug("Tail moving diagonally")
+        if TRACING:
+            logger.debug("Tail moving diagonally")
         new_tail_location = Position(tail_location.x + x_step, tail_location.y + y_step)
     return new_tail_location
 
@@ -88,17 +96,21 @@ def execute_instructions(instructions: Iterable[Instruction]) -> set[Position]:
     #     tail_visited_locations, head=head_location, tail=tail_location
     # )
     for instruction in instructions:
-        logger.debug("Processing instruction %s", instruction)
+        if TRACING:
+            logger.debug("Processing instruction %s", instruction)
         for step in range(instruction.distance):
-            logger.debug("Step %d of instruction %s", step + 1, instruction)
+            if TRACING:
+                logger.debug("Step %d of instruction %s", step + 1, instruction)
             head_location = apply_instruction(head_location, instruction.direction)
             tail_location = tail_catchup(tail_location, head_location)
-            logger.debug("New tail location: %s", tail_location)
+            if TRACING:
+                logger.debug("New tail location: %s", tail_location)
             tail_visited_locations.add(tail_location)
             # visualize_visited_locations(
             #     tail_visited_locations, head=head_location, tail=tail_location
             # )
-        logger.debug("Finished instruction %s", instruction)
+        if TRACING:
+            logger.debug("Finished instruction %s", instruction)
     return tail_visited_locations
 
 
@@ -149,9 +161,5 @@ def main(filename: Path) -> str:
 
 
 if __name__ == "__main__":
-    logging.basicConfig(
-        level=logging.WARNING,
-        format="[%(asctime)s][%(levelname)8s][%(name)s] %(message)s",
-    )
-    logger.setLevel(logging.DEBUG)
+    setup_logging()
     main()
@@ -2,8 +2,8 @@ import logging
 from pathlib import Path
 from typing import Iterable
 
-from .. import __name__ as package_name
 from ..cli_utils import wrap_main
+from ..logs import TRACING, setup_logging
 from .task_1 import (
     Instruction,
     Position,
@@ -26,9 +26,11 @@ def execute_instructions(
     #     tail_visited_locations, head=head_location, tail=tail_location
     # )
     for instruction in instructions:
-        logger.debug("Processing instruction %s", instruction)
+        if TRACING:
+            logger.debug("Processing instruction %s", instruction)
         for step in range(instruction.distance):
-            logger.debug("Step %d of instruction %s", step + 1, instruction)
+            if TRACING:
+                logger.debug("Step %d of instruction %s", step + 1, instruction)
             head = apply_instruction(head, instruction.direction)
             new_knots: list[Position] = []
             preceeding = head
@@ -42,7 +44,8 @@ def execute_instructions(
             # visualize_visited_locations(
             #     tail_visited_locations, head=head_location, tail=tail_location
             # )
-        logger.debug("Finished instruction %s", instruction)
+        if TRACING:
+            logger.debug("Finished instruction %s", instruction)
     return tail_visited_locations
 
 
@@ -56,10 +59,5 @@ def main(filename: Path) -> str:
 
 
 if __name__ == "__main__":
-    logging.basicConfig(
-        level=logging.WARNING,
-        format="[%(asctime)s][%(levelname)8s][%(name)s] %(message)s",
-    )
-    logging.getLogger(package_name).setLevel(logging.DEBUG)
-    logger.setLevel(logging.DEBUG)
+    setup_logging()
     main()
@@ -7,7 +7,8 @@ from typing import Iterable, Iterator, Protocol
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ def parse_instruction(line: str) -> Instruction:
         raise ValueError(f"Unknown instruction {line}")
 
 
+@parser
 def load_program(filename: Path) -> list[Instruction]:
     return [parse_instruction(line) for line in get_stripped_lines(filename)]
 
@@ -64,22 +66,26 @@ class Interpreter:
     def shift_instruction(self) -> None:
         self.current_instruction = next(self.instructions)
         self.current_op = iter(self.current_instruction(self.state))
-        logger.info("Shifted to instruction %s", self.current_instruction)
+        if TRACING:
+            logger.info("Shifted to instruction %s", self.current_instruction)
 
     def step(self) -> None:
-        logger.debug(
-            "Stepping with state %s @ %s", self.state, self.current_instruction
-        )
+        if TRACING:
+            logger.debug(
+                "Stepping with state %s @ %s", self.state, self.current_instruction
+            )
         try:
             next(self.current_op)
         except StopIteration:
-            logger.debug("Instruction %s finished", self.current_instruction)
+            if TRACING:
+                logger.debug("Instruction %s finished", self.current_instruction)
             self.shift_instruction()
             next(self.current_op)
         else:
-            logger.debug(
-                "Stepped with state %s @ %s", self.state, self.current_instruction
-            )
+            if TRACING:
+                logger.debug(
+                    "Stepped with state %s @ %s", self.state, self.current_instruction
+                )
 
     def run(self, cycles: int) -> Iterable[int]:
         for _ in range(cycles):
@@ -8,12 +8,13 @@ from pathlib import Path
 from typing import Callable, NewType, Protocol
 
 import numpy as np
-import tqdm
 from numpy import typing as npt
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
+from ..progress import track
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +114,7 @@ def parse_target_false(line: str) -> MonkeyId:
     return MonkeyId(int(match.group("monkey_id")))
 
 
+@parser
 def parse_monkeys(filename: Path) -> dict[MonkeyId, Monkey]:
     monkeys: dict[MonkeyId, Monkey] = {}
     lines = iter(get_stripped_lines(filename))
@@ -169,7 +171,7 @@ def play_rounds(
     normalization: Callable[[npt.NDArray[np.int64]], npt.NDArray[np.int64]],
     n_rounds: int
 ) -> None:
-    for round in tqdm.trange(n_rounds):
+    for round in track(range(n_rounds)):
         play_round(monkeys, normalization=normalization)
 
 
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 def main(filename: Path) -> str:
     board = parse_board(filename)
     cost = find_path(
-        board.tiles,
+        board.grid,
         start_position=board.end_position,
         can_climb_callback=(
             lambda current_elevation, neighbor_elevation: (
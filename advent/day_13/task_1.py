@@ -6,11 +6,13 @@ from typing import Any, Iterable
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
 
+@parser
 def read_pairs(filename: Path) -> Iterable[tuple[list[Any], list[Any]]]:
     lines = iter(get_stripped_lines(filename))
     while True:
@@ -30,27 +32,34 @@ def read_pairs(filename: Path) -> Iterable[tuple[list[Any], list[Any]]]:
 def values_have_correct_order(
     left: int | list[Any], right: int | list[Any]
 ) -> bool | None:
-    logger.debug("Comparing %s and %s", left, right)
+    if TRACING:
+        logger.debug("Comparing %s and %s", left, right)
     if isinstance(left, int) and isinstance(right, int):
-        logger.debug("Both items are ints: %s and %s", left, right)
+        if TRACING:
+            logger.debug("Both items are ints: %s and %s", left, right)
         if left < right:
-            logger.debug("Left is less than right: %s < %s", left, right)
+            if TRACING:
+                logger.debug("Left is less than right: %s < %s", left, right)
             return True
         elif left > right:
-            logger.debug("Left is greater than right: %s > %s", left, right)
+            if TRACING:
+                logger.debug("Left is greater than right: %s > %s", left, right)
             return False
         else:
             assert left == right
-            logger.debug("Left is equal to right: %s == %s", left, right)
+            if TRACING:
+                logger.debug("Left is equal to right: %s == %s", left, right)
             return None
     elif isinstance(left, list) and isinstance(right, list):
         return lists_have_correct_order(left, right)
     elif isinstance(left, int):
-        logger.debug("Left is an int, wrapping: %s", left)
+        if TRACING:
+            logger.debug("Left is an int, wrapping: %s", left)
         return values_have_correct_order([left], right)
     else:
         assert isinstance(right, int)
-        logger.debug("Right is an int, wrapping: %s", right)
+        if TRACING:
+            logger.debug("Right is an int, wrapping: %s", right)
         return values_have_correct_order(left, [right])
 
 
@@ -58,7 +67,8 @@ missing = object()
 
 
 def lists_have_correct_order(left: list[Any], right: list[Any]) -> bool | None:
-    logger.debug("Comparing lists %s and %s", left, right)
+    if TRACING:
+        logger.debug("Comparing lists %s and %s", left, right)
 
     for left_item, right_item in zip_longest(left, right, fillvalue=missing):
         if left_item is missing:
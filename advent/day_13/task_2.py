@@ -1,12 +1,9 @@
-import collections
-import graphlib
+import functools
 import itertools as it
 import logging
-import math
 import operator
 from pathlib import Path
-
-import tqdm
+from typing import Any
 
 from ..cli_utils import wrap_main
 from ..logs import setup_logging
@@ -15,33 +12,23 @@ from .task_1 import have_correct_order, read_pairs
 logger = logging.getLogger(__name__)
 
 
+def compare_packets(a: list[Any], b: list[Any]) -> int:
+    return -1 if have_correct_order(a, b) else 1
+
+
 @wrap_main
 def main(filename: Path) -> str:
     logger.debug("Reading pairs from %s", filename)
     pairs = read_pairs(filename)
     divider_packets = [[[2]], [[6]]]
-    packets = it.chain(divider_packets, it.chain.from_iterable(pairs))
-    nodes = dict(enumerate(packets))
-    logger.debug("Constructing graph from %d nodes", len(nodes))
-    graph: dict[int, set[int]] = collections.defaultdict(set)
-    a_key: int
-    b_key: int
-    for a_key, b_key in tqdm.tqdm(
-        it.combinations(nodes, 2), total=math.comb(len(nodes), 2)
-    ):
-        a = nodes[a_key]
-        b = nodes[b_key]
-        if have_correct_order(a, b):
-            graph[b_key].add(a_key)
-        else:
-            graph[a_key].add(b_key)
-
-    logger.debug("Sorting graph")
-    sorter = graphlib.TopologicalSorter(graph=graph)
-    divider_indicies: list[int] = []
-    for idx, key in enumerate(sorter.static_order(), 1):
-        if key in {0, 1}:  # the divider packets were top of the list
-            divider_indicies.append(idx)
+    packets = [*divider_packets, *it.chain.from_iterable(pairs)]
+    logger.debug("Sorting %d packets", len(packets))
+    ordered = sorted(packets, key=functools.cmp_to_key(compare_packets))
+    divider_indicies = [
+        idx
+        for idx, packet in enumerate(ordered, 1)
+        if any(packet is divider_packet for divider_packet in divider_packets)
+    ]
     assert len(divider_indicies) == 2
     return str(operator.mul(*divider_indicies))
 
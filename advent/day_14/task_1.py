@@ -9,8 +9,10 @@ import numpy as np
 from numpy import typing as npt
 
 from ..cli_utils import wrap_main
+from ..grid import SOUTH, SOUTH_EAST, SOUTH_WEST, Grid
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,7 @@ class Position(NamedTuple):
     x: int
 
 
+@parser
 def get_lines(filename: Path) -> Iterable[list[Position]]:
     for line in get_stripped_lines(filename):
         segments = line.split(" -> ")
@@ -62,12 +65,6 @@ def get_board(
     return board, scaled_starting_point
 
 
-def get_next_positions(position: Position) -> Iterable[Position]:
-    yield Position(y=position.y + 1, x=position.x)
-    yield Position(y=position.y + 1, x=position.x - 1)
-    yield Position(y=position.y + 1, x=position.x + 1)
-
-
 class SandOutOfBoundsException(Exception):
     def __init__(self, units: int):
         self.units = units
@@ -78,30 +75,24 @@ class StartPointBlockedException(Exception):
         self.units = units
 
 
-def simulate(board: npt.NDArray[np.uint8], starting_point: Position) -> NoReturn:
-    height, width = board.shape
-
-    def is_out_of_bounds(position: Position) -> bool:
-        return (
-            position.x < 0
-            or position.x >= width
-            or position.y < 0
-            or position.y >= height
-        )
+def simulate(board: Grid[np.uint8], starting_point: int) -> NoReturn:
+    cells = board.flat
+    next_offsets = board.offsets((SOUTH, SOUTH_WEST, SOUTH_EAST))
 
     units = 0
     while True:
         # new grain of sand
         current = starting_point
-        if board[current]:
+        if cells[current]:
             # starting point is blocked, simulation is over
             raise StartPointBlockedException(units)
         while True:
-            for position in get_next_positions(current):
-                if is_out_of_bounds(position):
+            for offset in next_offsets:
+                position = current + offset
+                if not board.inside[position]:
                     # sand fell out of the map, step simulation
                     raise SandOutOfBoundsException(units)
-                elif not board[position]:
+                elif not cells[position]:
                     # position is empty, can move
                     current = position
                     break
@@ -110,7 +101,7 @@ def simulate(board: npt.NDArray[np.uint8], starting_point: Position) -> NoReturn
                     continue
             else:
                 # node of the positions were empty, sand will rest here
-                board[current] = 2
+                cells[current] = 2
                 units += 1
                 break
 
@@ -120,8 +111,9 @@ def main(filename: Path) -> str:
     lines = list(get_lines(filename))
     starting_point = Position(y=0, x=500)
     board, scaled_starting_point = get_board(starting_point, lines)
+    grid = Grid(board)
     try:
-        simulate(board, scaled_starting_point)
+        simulate(grid, grid.index(*scaled_starting_point))
     except SandOutOfBoundsException as e:
         units_of_sand = e.units
         return str(units_of_sand)
@@ -5,6 +5,7 @@ import numpy as np
 from numpy import typing as npt
 
 from ..cli_utils import wrap_main
+from ..grid import Grid
 from ..logs import setup_logging
 from .task_1 import Position, SandOutOfBoundsException, StartPointBlockedException
 from .task_1 import get_board as original_get_board
@@ -42,13 +43,14 @@ def main(filename: Path) -> str:
     starting_point = Position(y=0, x=500)
     board, scaled_starting_point = get_board(starting_point, lines)
     print(visualize_board(board))
+    grid = Grid(board)
     try:
-        simulate(board, scaled_starting_point)
+        simulate(grid, grid.index(*scaled_starting_point))
     except SandOutOfBoundsException as ex:
         raise AssertionError() from ex
     except StartPointBlockedException as ex:
         units_of_sand = ex.units
-        print(visualize_board(board))
+        print(visualize_board(grid.cells))
         return str(units_of_sand)
     else:
         raise AssertionError("Expected StartPointBlockedException")
@@ -7,10 +7,12 @@ from typing import Iterable, NamedTuple
 
 import click
 import more_itertools as mit
-import tqdm
 
+from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
+from ..progress import track
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,7 @@ pattern = re.compile(
 )
 
 
+@parser
 def parse_sensors(filename: Path) -> Iterable[Sensor]:
     for line in get_stripped_lines(filename):
         match = pattern.match(line)
@@ -71,20 +74,9 @@ def get_highest_distance_between_sensor_and_beacon(sensors: Iterable[Sensor]) ->
     )
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
-        readable=True,
-        path_type=Path,
-    ),
-    required=True,
-)
+@wrap_main
 @click.argument("target_y", type=int, required=True)
-def main(filename: Path, target_y: int) -> None:
+def main(filename: Path, target_y: int) -> str:
     sensors = list(parse_sensors(filename))
 
     highest_distance_between_sensor_and_beacon = (
@@ -108,12 +100,12 @@ def main(filename: Path, target_y: int) -> None:
     max_y += highest_distance_between_sensor_and_beacon
 
     points_in_range = 0
-    for x in tqdm.trange(min_x, max_x + 1):
+    for x in track(range(min_x, max_x + 1)):
         point = Position(y=target_y, x=x)
         if not can_have_beacon(sensors, point):
             points_in_range += 1
 
-    click.echo(str(points_in_range))
+    return str(points_in_range)
 
 
 def can_have_beacon(sensors: Iterable[Sensor], point: Position) -> bool:
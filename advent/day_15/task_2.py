@@ -7,14 +7,13 @@ from pathlib import Path
 from typing import Iterable, NamedTuple
 
 import click
-import matplotlib.pyplot as plt
 import more_itertools as mit
 import numpy as np
-import tqdm
-from matplotlib.patches import Ellipse, Rectangle
 from numpy import typing as npt
 
+from ..cli_utils import wrap_main
 from ..logs import setup_logging
+from ..progress import track
 from .task_1 import (
     Position,
     Sensor,
@@ -56,6 +55,8 @@ def get_closest_sensor_by_y(sensors_by_y: list[Sensor], y: int) -> Sensor:
 def visualize_sensors(
     sensors: Iterable[Sensor], range_max_x: int, range_max_y: int
 ) -> None:
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Ellipse, Rectangle
 
     fig, ax = plt.subplots(subplot_kw={"aspect": "equal"})
     for sensor in sensors:
@@ -94,6 +95,7 @@ def visualize_sensors(
 
     # draw a dot at x=14, y=11
     ax.plot(14, 11, "ro", markersize=1)
+    plt.savefig("sensors.png")
 
 
 def find_points(
@@ -118,21 +120,13 @@ def find_points(
     return None
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
-        readable=True,
-        path_type=Path,
-    ),
-    required=True,
-)
+@wrap_main
 @click.argument("max_x", type=int, required=True)
 @click.argument("max_y", type=int, required=True)
-def main(filename: Path, max_x: int, max_y: int) -> None:
+@click.option(
+    "--visualize/--no-visualize", default=False, help="Plot the sensors to sensors.png"
+)
+def main(filename: Path, max_x: int, max_y: int, visualize: bool = False) -> str:
     sensors = list(parse_sensors(filename))
 
     highest_distance_between_sensor_and_beacon = (
@@ -142,8 +136,8 @@ def main(filename: Path, max_x: int, max_y: int) -> None:
         "Highest distance between sensor and beacon: %d",
         highest_distance_between_sensor_and_beacon,
     )
-    visualize_sensors(sensors, max_x, max_y)
-    plt.savefig("sensors.png")
+    if visualize:
+        visualize_sensors(sensors, max_x, max_y)
 
     sensors_x = np.array([s.position.x for s in sensors], np.int32)
     sensors_y = np.array([s.position.y for s in sensors], np.int32)
@@ -158,15 +152,14 @@ def main(filename: Path, max_x: int, max_y: int) -> None:
         else:
             return None
 
-    for y in tqdm.trange(max_y + 1, desc="y"):
+    for y in track(range(max_y + 1), desc="y"):
         y_dist = np.abs(sensors_y - y)
         x = 0
         while x <= max_x + 1:
             sector = find_intersecting_sector(x=x, y_dist=y_dist)
             if sector is None:
                 logger.debug("Point %s can have a beacon", (x, y))
-                click.echo(str(x * 4000000 + y))
-                return
+                return str(x * 4000000 + y)
             # find where the sector stops intersecting with
             # current y and jump past that point
             x = sector.position.x + sector.r - abs(sector.position.y - y) + 1
@@ -1,4 +1,3 @@
-import itertools as it
 import logging
 import re
 from collections import defaultdict
@@ -7,11 +6,14 @@ from functools import partial
 from pathlib import Path
 from typing import Iterable, NamedTuple
 
-import tqdm
+import click
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
+from ..progress import track
+from ..search import bfs_distances
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ pattern = re.compile(
 )
 
 
+@parser
 def parse_graph(filename: Path) -> Graph:
     graph = Graph()
     for line in get_stripped_lines(filename):
@@ -46,27 +49,14 @@ def parse_graph(filename: Path) -> Graph:
 
 
 def calculate_distances(graph: Graph) -> dict[str, dict[str, int]]:
-    distances: dict[str, dict[str, int]] = {}
-
-    all_nodes = set(graph.nodes)
-
-    def _calculate_distances(node: str) -> dict[str, int]:
-        visited: set[str] = set()
-        costs: dict[str, int] = {node: 0}
-
-        while len(visited) != len(all_nodes):
-            lowest_unvisited_node = min(
-                it.filterfalse(visited.__contains__, costs), key=costs.__getitem__
-            )
-            unvisited_neighbours = set(graph.edges[lowest_unvisited_node]) - visited
-            for neighbour in unvisited_neighbours:
-                costs[neighbour] = costs[lowest_unvisited_node] + 1
-            visited.add(lowest_unvisited_node)
-
-        return costs
+    names = list(graph.nodes)
+    ids = {name: node_id for node_id, name in enumerate(names)}
+    adjacency = [[ids[neighbour] for neighbour in graph.edges[name]] for name in names]
 
-    for node in tqdm.tqdm(all_nodes, desc="Calculating distances"):
-        distances[node] = _calculate_distances(node)
+    distances: dict[str, dict[str, int]] = {}
+    for node in track(names, desc="Calculating distances"):
+        costs = bfs_distances([ids[node]], adjacency.__getitem__)
+        distances[node] = {names[node_id]: cost for node_id, cost in costs.items()}
     return distances
 
 
@@ -153,9 +143,13 @@ def visualize_graph(graph: Graph) -> None:
 
 
 @wrap_main
-def main(filename: Path) -> str:
+@click.option(
+    "--visualize/--no-visualize", default=False, help="Draw the graph to graph.png"
+)
+def main(filename: Path, visualize: bool = False) -> str:
     graph = parse_graph(filename)
-    visualize_graph(graph)
+    if visualize:
+        visualize_graph(graph)
     best_score = dfs(graph, time=30)
     return str(best_score)
 
@@ -1,6 +1,8 @@
 import logging
 from pathlib import Path
 
+import click
+
 from ..cli_utils import wrap_main
 from ..logs import setup_logging
 from .task_1 import (
@@ -94,9 +96,13 @@ def dfs(graph: Graph, *, time: int) -> int:
 
 
 @wrap_main
-def main(filename: Path) -> str:
+@click.option(
+    "--visualize/--no-visualize", default=False, help="Draw the graph to graph.png"
+)
+def main(filename: Path, visualize: bool = False) -> str:
     graph = parse_graph(filename)
-    visualize_graph(graph)
+    if visualize:
+        visualize_graph(graph)
     best_score = dfs(graph, time=26)
 
     return str(best_score)
@@ -8,11 +8,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Sequence
 
-import tqdm
-
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..logs import TRACING, setup_logging
+from ..memory import record_cache
+from ..parsing import parser
+from ..progress import progress
 
 
 class Direction(str, enum.Enum):
@@ -100,7 +101,7 @@ class Simulator:
         return self.get_board_signature(), self.rock_idx, self.jet_idx
 
     def visualize_board(self) -> None:
-        if logger.isEnabledFor(logging.DEBUG):
+        if TRACING:
             logger.debug("Board:\n%s", _visualize_board(self.board))
 
     def find_top_index(self) -> int:
@@ -126,21 +127,26 @@ class Simulator:
             self.board[top - idx] |= row
 
     def simulate_step(self) -> None:
-        logger.debug("Simulating step of rock %s", self.rock_idx)
+        if TRACING:
+            logger.debug("Simulating step of rock %s", self.rock_idx)
         rock = ROCKS[self.rock_idx]
         rock_height = len(rock)
         # spawn new rock
         current_top_idx = self.find_top_index()
-        logger.debug("Current top index: %s", current_top_idx)
+        if TRACING:
+            logger.debug("Current top index: %s", current_top_idx)
         bottom_spawn_idx = current_top_idx + 3
-        logger.debug("Bottom spawn index: %s", bottom_spawn_idx)
+        if TRACING:
+            logger.debug("Bottom spawn index: %s", bottom_spawn_idx)
         top_spawn_idx = bottom_spawn_idx + rock_height
-        logger.debug("Needed spawn top index: %s", top_spawn_idx)
+        if TRACING:
+            logger.debug("Needed spawn top index: %s", top_spawn_idx)
         # intitial spawn positions
         top = top_spawn_idx
         # expand board if neecessary
         while len(self.board) <= top_spawn_idx:
-            logger.debug("Adding new row to board")
+            if TRACING:
+                logger.debug("Adding new row to board")
             self.board.append(TUNNEL)
         # visualize_board(board)
 
@@ -149,16 +155,20 @@ class Simulator:
             self.jet_idx = (self.jet_idx + 1) % len(self.directions)
             moved_rock = move_rock(rock, direction)
             if self.clashes(moved_rock, top):
-                logger.debug("Jet stream cannot move rock")
+                if TRACING:
+                    logger.debug("Jet stream cannot move rock")
             else:
-                logger.debug("Jet stream moves rock %s", direction.name)
+                if TRACING:
+                    logger.debug("Jet stream moves rock %s", direction.name)
                 rock = moved_rock
 
             if self.clashes(rock, top - 1):
-                logger.debug("Rock cannot fall anymore")
+                if TRACING:
+                    logger.debug("Rock cannot fall anymore")
                 break
             else:
-                logger.debug("Rock falls")
+                if TRACING:
+                    logger.debug("Rock falls")
                 top -= 1
 
         self.materialize_rock(rock, top)
@@ -169,7 +179,7 @@ class Simulator:
         step = 0
         extra_height = 0
         board_at_step: dict[int, str] = {}
-        with tqdm.tqdm(total=steps) as pbar:
+        with progress(total=steps) as pbar:
             while step < steps:
                 self.simulate_step()
                 self.visualize_board()
@@ -212,6 +222,7 @@ class Simulator:
                 board_at_step[step] = _visualize_board(self.board)
                 cache[signature] = step, current_height
 
+        record_cache("day_17 board_at_step", board_at_step)
         return self.find_top_index() + extra_height
 
 
@@ -227,6 +238,7 @@ def main(filename: Path) -> str:
     return str(height)
 
 
+@parser
 def get_directions(filename: Path) -> list[Direction]:
     (jet_pattern,) = get_stripped_lines(filename)
     directions = list(map(Direction, jet_pattern))
@@ -5,10 +5,12 @@ from typing import Iterable, cast
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
 
+@parser
 def read_voxels(filename: Path) -> Iterable[tuple[int, int, int]]:
     for line in get_stripped_lines(filename):
         parts = line.split(",")
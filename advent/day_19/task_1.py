@@ -8,12 +8,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, NewType
 
-import tqdm
 from returns.curry import partial
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..memory import record_cache
+from ..parsing import parser
+from ..progress import track
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,7 @@ pattern = re.compile(
 )
 
 
+@parser
 def parse_blueprints(filename: Path) -> Iterable[BluePrint]:
     for line in get_stripped_lines(filename):
         match = pattern.match(line)
@@ -262,6 +265,7 @@ def score_blueprint(blueprint: BluePrint, time_left: int) -> int:
     state = State(time_left=time_left)
 
     best_state = _score_blueprint(cache, global_state, blueprint, state)
+    record_cache("day_19 cache", cache)
     best_score = best_state.score()
     logger.info(
         "Blueprint %d scored %d with states %s", blueprint.id, best_score, best_state
@@ -298,7 +302,7 @@ def score_and_multiply(blueprint: BluePrint) -> int:
 def main(filename: Path) -> str:
     blueprints = list(parse_blueprints(filename))
     with mp.Pool(4) as pool:
-        scores = tqdm.tqdm(
+        scores = track(
             pool.imap(score_and_multiply, blueprints, chunksize=1),
             total=len(blueprints),
         )
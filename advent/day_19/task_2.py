@@ -4,11 +4,11 @@ import operator
 from functools import reduce
 from pathlib import Path
 
-import tqdm as tqdm
 from returns.curry import partial
 
 from ..cli_utils import wrap_main
 from ..logs import setup_logging
+from ..progress import track
 from .task_1 import parse_blueprints, score_blueprint
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ def main(filename: Path) -> str:
     blueprints = list(parse_blueprints(filename))[:3]
     score_callback = partial(score_blueprint, time_left=32)
     with mp.Pool(len(blueprints)) as pool:
-        scores = tqdm.tqdm(
+        scores = track(
             pool.imap(score_callback, blueprints, chunksize=1), total=len(blueprints)
         )
         total = reduce(operator.mul, scores)
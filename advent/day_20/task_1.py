@@ -8,7 +8,8 @@ from typing import Iterable, TypeVar
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +114,7 @@ def move_left(node: Node, steps: int, total_nodes: int) -> None:
     insert_in_between(prev_node=prev_node, next_node=next_node, node=node)
 
 
+@parser
 def read_numbers(filename: Path) -> Iterable[int]:
     return map(int, get_stripped_lines(filename))
 
@@ -120,7 +122,8 @@ def read_numbers(filename: Path) -> Iterable[int]:
 def mix(nodes_in_order: list[Node]) -> None:
     total_nodes = len(nodes_in_order)
     for node in nodes_in_order:
-        logger.debug("Before mixing %r", node)
+        if TRACING:
+            logger.debug("Before mixing %r", node)
         offset = node.value
         if offset % total_nodes == 0:
             continue
@@ -128,7 +131,8 @@ def mix(nodes_in_order: list[Node]) -> None:
             move_right(node, offset, total_nodes)
         else:
             move_left(node, -offset, total_nodes)
-        logger.debug("After mixing %r", node)
+        if TRACING:
+            logger.debug("After mixing %r", node)
 
 
 def to_linked_list(numbers: Iterable[int]) -> list[Node]:
@@ -1,10 +1,9 @@
 import logging
 from pathlib import Path
 
-import tqdm
-
 from ..cli_utils import wrap_main
 from ..logs import setup_logging
+from ..progress import track
 from .task_1 import fast_forward, find_value, mix, read_numbers, to_linked_list
 
 logger = logging.getLogger(__name__)
@@ -17,7 +16,7 @@ def main(filename: Path) -> str:
     numbers = map(lambda n: n * decryption_key, numbers)
     nodes_in_order = to_linked_list(numbers)
 
-    for _ in tqdm.trange(10):
+    for _ in track(range(10)):
         mix(nodes_in_order)
 
     zero_node = find_value(nodes_in_order[0], 0)
@@ -10,6 +10,7 @@ from typing import Callable, Iterable, NewType, Protocol
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
 from ..logs import setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 MonkeyId = NewType("MonkeyId", str)
@@ -110,6 +111,7 @@ SYMBOL_TO_INVERSE_OPERATOR: dict[str, InverseOperatorType] = {
 }
 
 
+@parser
 def parse_monkeys(filename: Path) -> dict[MonkeyId, Monkey]:
     monkeys = {}
     for line in get_stripped_lines(filename):
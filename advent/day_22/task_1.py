@@ -10,7 +10,8 @@ from numpy import typing as npt
 
 from ..cli_utils import wrap_main
 from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,7 @@ class Position(NamedTuple):
     x: int
 
 
+@parser
 def read_data(filename: Path) -> tuple[BoardType, InstructionsType]:
     lines = iter(get_stripped_lines(filename))
     board: list[list[Tile]] = []
@@ -103,23 +105,28 @@ def execute_instructions(
                 direction = Direction((direction + 1) % 4)
             else:
                 direction = Direction((direction - 1) % 4)
-            logger.debug(
-                "Rotated %s from %s to %s\n%s",
-                instruction.name,
-                prev_direction.name,
-                direction.name,
-                BoardVisualization(board, current_point, direction),
-            )
+            if TRACING:
+                logger.debug(
+                    "Rotated %s from %s to %s\n%s",
+                    instruction.name,
+                    prev_direction.name,
+                    direction.name,
+                    BoardVisualization(board, current_point, direction),
+                )
         else:
             assert isinstance(instruction, int)
-            logger.debug("Moving %d steps in direction %s", instruction, direction.name)
-            for step in range(1, instruction + 1):
+            if TRACING:
                 logger.debug(
-                    "Making step %d from %r\n%s",
-                    step,
-                    current_point,
-                    BoardVisualization(board, current_point, direction),
+                    "Moving %d steps in direction %s", instruction, direction.name
                 )
+            for step in range(1, instruction + 1):
+                if TRACING:
+                    logger.debug(
+                        "Making step %d from %r\n%s",
+                        step,
+                        current_point,
+                        BoardVisualization(board, current_point, direction),
+                    )
                 if direction == Direction.UP:
                     current_point = move(board, current_point, dx=0, dy=-1)
                 elif direction == Direction.RIGHT:
@@ -129,11 +136,12 @@ def execute_instructions(
                 else:
                     assert direction == Direction.LEFT
                     current_point = move(board, current_point, dx=-1, dy=0)
-            logger.debug(
-                "Movement finished at %r\n%s",
-                current_point,
-                BoardVisualization(board, current_point, direction),
-            )
+            if TRACING:
+                logger.debug(
+                    "Movement finished at %r\n%s",
+                    current_point,
+                    BoardVisualization(board, current_point, direction),
+                )
     return current_point, direction
 
 
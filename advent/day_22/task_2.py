@@ -7,7 +7,8 @@ import click
 import numpy as np
 from numpy import typing as npt
 
-from ..logs import setup_logging
+from ..cli_utils import wrap_main
+from ..logs import TRACING, setup_logging
 from .task_1 import (
     BoardVisualization,
     Direction,
@@ -272,43 +273,51 @@ def execute_instructions(
                 direction = Direction((direction + 1) % 4)
             else:
                 direction = Direction((direction - 1) % 4)
-            logger.debug(
-                "Rotated %s from %s to %s\n%s",
-                instruction.name,
-                prev_direction.name,
-                direction.name,
-                BoardVisualization(superboard[board].tiles, point, direction),
-            )
+            if TRACING:
+                logger.debug(
+                    "Rotated %s from %s to %s\n%s",
+                    instruction.name,
+                    prev_direction.name,
+                    direction.name,
+                    BoardVisualization(superboard[board].tiles, point, direction),
+                )
         else:
             assert isinstance(instruction, int)
-            logger.debug("Moving %d steps in direction %s", instruction, direction.name)
-            for step in range(1, instruction + 1):
+            if TRACING:
                 logger.debug(
-                    "Making step %d from %r\n%s",
-                    step,
-                    point,
-                    BoardVisualization(superboard[board].tiles, point, direction),
+                    "Moving %d steps in direction %s", instruction, direction.name
                 )
+            for step in range(1, instruction + 1):
+                if TRACING:
+                    logger.debug(
+                        "Making step %d from %r\n%s",
+                        step,
+                        point,
+                        BoardVisualization(superboard[board].tiles, point, direction),
+                    )
                 new_board, new_point, new_direction = get_next_point(
                     transitions, superboard, board, point, direction
                 )
                 new_value = superboard[new_board].tiles[new_point]
                 if new_value == Tile.EMPTY:
-                    logger.debug("Can move into an empty space")
+                    if TRACING:
+                        logger.debug("Can move into an empty space")
                     point = new_point
                     board = new_board
                     direction = new_direction
                 else:
                     assert new_value == Tile.WALL
-                    logger.debug("Hit a wall")
+                    if TRACING:
+                        logger.debug("Hit a wall")
                     break
-            logger.debug(
-                "Movement finished at %s %r %s\n%s",
-                board,
-                point,
-                direction,
-                BoardVisualization(superboard[board].tiles, point, direction),
-            )
+            if TRACING:
+                logger.debug(
+                    "Movement finished at %s %r %s\n%s",
+                    board,
+                    point,
+                    direction,
+                    BoardVisualization(superboard[board].tiles, point, direction),
+                )
     return board, point, direction
 
 
@@ -393,20 +402,9 @@ def apply_transition(
     return new_board, Position(y=y, x=x), new_direction
 
 
-@click.command()
-@click.argument(
-    "filename",
-    type=click.Path(
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
-        readable=True,
-        path_type=Path,
-    ),
-    required=True,
-)
+@wrap_main
 @click.option("--is-input/--is-sample", help="Is input or sample", required=True)
-def main(filename: Path, is_input: bool) -> None:
+def main(filename: Path, is_input: bool) -> str:
     logger.debug("Reading data")
     board, instructions = read_data(filename)
     superboard = get_superboard(
@@ -432,7 +430,7 @@ def main(filename: Path, is_input: bool) -> None:
     )
     recovered_point = recover_point(superboard, end_board, end_point)
     logger.debug("Recovered point %r", recovered_point)
-    click.echo(str(hash_position(recovered_point, end_direction)))
+    return str(hash_position(recovered_point, end_direction))
 
 
 if __name__ == "__main__":
@@ -1,120 +1,93 @@
+import functools
 import io
 import itertools as it
 import logging
 import operator
-from collections import defaultdict
 from pathlib import Path
-from typing import Iterable, NamedTuple, Protocol
+from typing import Iterable
 
-import more_itertools as mit
+import numpy as np
+from numpy import typing as npt
 
 from ..cli_utils import wrap_main
-from ..io_utils import get_stripped_lines
-from ..logs import setup_logging
+from ..grid import (
+    ALL_DIRECTIONS,
+    EAST,
+    NORTH,
+    NORTH_EAST,
+    NORTH_WEST,
+    SOUTH,
+    SOUTH_EAST,
+    SOUTH_WEST,
+    WEST,
+    Direction,
+    neighbour_mask,
+    shift,
+)
+from ..io_utils import read_char_grid
+from ..logs import TRACING, setup_logging
+from ..parsing import parser
 
 logger = logging.getLogger(__name__)
 
 
-class Point(NamedTuple):
-    y: int
-    x: int
-
-
-def read_board(filename: Path) -> Iterable[Point]:
-    for row_idx, line in enumerate(get_stripped_lines(filename)):
-        for col_idx, c in enumerate(line):
-            if c == "#":
-                yield Point(y=row_idx, x=col_idx)
-
-
-class Check(Protocol):
-    def __call__(self, elf: Point, elves: set[Point]) -> Point | None:
-        ...
-
-
-def top_check(elf: Point, elves: set[Point]) -> Point | None:
-    n = Point(elf.y - 1, elf.x)
-    nw = Point(elf.y - 1, elf.x - 1)
-    ne = Point(elf.y - 1, elf.x + 1)
-    if (n not in elves) and (nw not in elves) and (ne not in elves):
-        return n
-    else:
-        return None
-
-
-def left_check(elf: Point, elves: set[Point]) -> Point | None:
-    w = Point(elf.y, elf.x - 1)
-    nw = Point(elf.y - 1, elf.x - 1)
-    sw = Point(elf.y + 1, elf.x - 1)
-    if (w not in elves) and (nw not in elves) and (sw not in elves):
-        return w
-    else:
-        return None
-
-
-def right_check(elf: Point, elves: set[Point]) -> Point | None:
-    e = Point(elf.y, elf.x + 1)
-    ne = Point(elf.y - 1, elf.x + 1)
-    se = Point(elf.y + 1, elf.x + 1)
-    if (e not in elves) and (ne not in elves) and (se not in elves):
-        return e
-    else:
-        return None
-
-
-def bottom_check(elf: Point, elves: set[Point]) -> Point | None:
-    s = Point(elf.y + 1, elf.x)
-    sw = Point(elf.y + 1, elf.x - 1)
-    se = Point(elf.y + 1, elf.x + 1)
-    if (s not in elves) and (sw not in elves) and (se not in elves):
-        return s
-    else:
-        return None
-
-
-def plan_position(elf: Point, elves: set[Point], checks: list[Check]) -> Point:
-    positions = [check(elf, elves) for check in checks]
-    if all(positions) or not any(positions):
-        return elf
-    else:
-        first = mit.first_true(positions)
-        assert first is not None
-        return first
-
-
-def simulate(elves: set[Point], checks: list[Check]) -> set[Point]:
-    plan: dict[Point, set[Point]] = defaultdict(set)
-    for elf in elves:
-        new_position = plan_position(elf, elves, checks)
-        plan[new_position].add(elf)
-    execution: set[Point] = set()
-    for new_position, elves_that_want_to_move_there in plan.items():
-        if len(elves_that_want_to_move_there) == 1:
-            # this was the only elf that wanted to move there.
-            execution.add(new_position)
-        else:
-            # there were multiple elves that wanted to move there.
-            # they all go back to their original positions.
-            execution |= elves_that_want_to_move_there
-    return execution
-
-
-def visualize(elves: set[Point]) -> str:
-    min_y, max_y = mit.minmax(map(operator.attrgetter("y"), elves))
-    min_x, max_x = mit.minmax(map(operator.attrgetter("x"), elves))
+# the direction to move in and the neighbours that have to be free to do so
+Check = tuple[Direction, tuple[Direction, ...]]
+
+top_check: Check = (NORTH, (NORTH, NORTH_WEST, NORTH_EAST))
+left_check: Check = (WEST, (WEST, NORTH_WEST, SOUTH_WEST))
+right_check: Check = (EAST, (EAST, NORTH_EAST, SOUTH_EAST))
+bottom_check: Check = (SOUTH, (SOUTH, SOUTH_WEST, SOUTH_EAST))
+
+
+@parser(version=2)
+def read_board(filename: Path) -> npt.NDArray[np.bool_]:
+    elves: npt.NDArray[np.bool_] = read_char_grid(filename) == ord("#")
+    return elves
+
+
+def simulate(
+    elves: npt.NDArray[np.bool_], checks: list[Check]
+) -> tuple[npt.NDArray[np.bool_], int]:
+    """The elves after a round and the number of elves that moved."""
+    if elves[[0, -1]].any() or elves[:, [0, -1]].any():
+        # make room for the elves to move outwards
+        elves = np.pad(elves, 1)
+    neighbours = {
+        direction: neighbour_mask(elves, direction) for direction in ALL_DIRECTIONS
+    }
+    # elves without any neighbours do not move
+    undecided = elves & functools.reduce(operator.or_, neighbours.values())
+    arrivals: list[tuple[Direction, npt.NDArray[np.bool_]]] = []
+    for direction, looks in checks:
+        free = ~functools.reduce(operator.or_, (neighbours[look] for look in looks))
+        moving = undecided & free
+        undecided &= ~moving
+        arrivals.append((direction, shift(moving, direction)))
+    # if multiple elves want to move to the same position, none of them do
+    arriving_count = np.sum([arriving for _, arriving in arrivals], axis=0)
+    contested = arriving_count > 1
+    new_elves = elves.copy()
+    moved = 0
+    for direction, arriving in arrivals:
+        arriving &= ~contested
+        new_elves &= ~neighbour_mask(arriving, direction)
+        new_elves |= arriving
+        moved += int(arriving.sum())
+    return new_elves, moved
+
+
+def get_bounds(elves: npt.NDArray[np.bool_]) -> tuple[slice, slice]:
+    rows = np.flatnonzero(elves.any(axis=1))
+    cols = np.flatnonzero(elves.any(axis=0))
+    return slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1)
+
+
+def visualize(elves: npt.NDArray[np.bool_]) -> str:
+    bounded = elves[get_bounds(elves)]
     buf = io.StringIO()
-    buf.write("  ")
-    for x in range(min_x, max_x + 1):
-        buf.write(f"{x%10}")
-    buf.write("\n")
-    for y in range(min_y, max_y + 1):
-        buf.write(f"{y%10} ")
-        for x in range(min_x, max_x + 1):
-            if Point(y=y, x=x) in elves:
-                char = "#"
-            else:
-                char = "."
-            buf.write(char)
+    for row in bounded:
+        buf.write("".join("#" if elf else "." for elf in row))
         buf.write("\n")
     return buf.getvalue()
 
@@ -129,22 +102,22 @@ def get_checks() -> Iterable[list[Check]]:
 
 @wrap_main
 def main(filename: Path) -> str:
-    elves = set(read_board(filename))
+    elves = read_board(filename)
     checks = iter(get_checks())
-    logger.debug("Before\n%s", visualize(elves))
+    if TRACING:
+        logger.debug("Before\n%s", visualize(elves))
     for round in range(10):
         round_checks = next(checks)
-        logger.debug(
-            "Round %d checks %s",
-            round + 1,
-            " ".join(map(operator.attrgetter("__name__"), round_checks)),
-        )
-        elves = simulate(elves, round_checks)
-        logger.debug("After round %d\n%s", round + 1, visualize(elves))
-    min_y, max_y = mit.minmax(map(operator.attrgetter("y"), elves))
-    min_x, max_x = mit.minmax(map(operator.attrgetter("x"), elves))
-    area = (max_x - min_x + 1) * (max_y - min_y + 1)
-    count = area - len(elves)
+        if TRACING:
+            logger.debug(
+                "Round %d checks %s",
+                round + 1,
+                " ".join(str(direction) for direction, _ in round_checks),
+            )
+        elves, _ = simulate(elves, round_checks)
+        if TRACING:
+            logger.debug("After round %d\n%s", round + 1, visualize(elves))
+    count = np.count_nonzero(~elves[get_bounds(elves)])
     return str(count)
 
 
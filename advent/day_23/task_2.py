@@ -11,14 +11,13 @@ logger = logging.getLogger(__name__)
 
 @wrap_main
 def main(filename: Path) -> str:
-    elves = set(read_board(filename))
+    elves = read_board(filename)
     checks = iter(get_checks())
     for round in it.count(1):
         round_checks = next(checks)
-        new_elves = simulate(elves, round_checks)
-        if new_elves == elves:
+        elves, moved = simulate(elves, round_checks)
+        if not moved:
             break
-        elves = new_elves
     return str(round)
 
 
@@ -0,0 +1,606 @@
+"""
+Seeded generators of arbitrarily large puzzle inputs.
+
+Every generator takes a `random.Random` and a single `size` that controls how big
+the input gets (number of lines, grid side, number of valves etc., see the
+individual generators) and returns the text of an input that the solvers of that
+day accept.
+"""
+
+import io
+import itertools as it
+import operator
+import os
+import random
+import string
+from pathlib import Path
+from typing import Any, Callable
+
+import click
+
+Generator = Callable[[random.Random, int], str]
+
+
+def _render(lines: list[str]) -> str:
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_01(rng: random.Random, size: int) -> str:
+    """`size` elves with 1-15 snacks each."""
+    elves = (
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(size)
+    )
+    return "\n\n".join(elves) + "\n"
+
+
+def generate_day_02(rng: random.Random, size: int) -> str:
+    """`size` rounds."""
+    return _render([f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)])
+
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def _generate_rucksack(rng: random.Random, pool: list[str], badge: str) -> str:
+    common, *rest = rng.sample(pool, len(pool))
+    split = rng.randint(1, len(rest) - 1)
+    left_items = [common, badge, *rest[:split]]
+    right_items = [common, *rest[split:]]
+    half = rng.randint(max(len(left_items), len(right_items)), 24)
+    left = left_items + rng.choices(left_items, k=half - len(left_items))
+    right = right_items + rng.choices(right_items, k=half - len(right_items))
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+def generate_day_03(rng: random.Random, size: int) -> str:
+    """`size` groups of three rucksacks."""
+    lines: list[str] = []
+    for _ in range(size):
+        badge, *others = rng.sample(ITEMS, len(ITEMS))
+        # disjoint item pools make the badge the only item shared by the group
+        pools = [others[idx::3][:8] for idx in range(3)]
+        lines.extend(_generate_rucksack(rng, pool, badge) for pool in pools)
+    return _render(lines)
+
+
+def generate_day_04(rng: random.Random, size: int) -> str:
+    """`size` pairs of section assignments."""
+
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return _render([f"{assignment()},{assignment()}" for _ in range(size)])
+
+
+def generate_day_05(rng: random.Random, size: int) -> str:
+    """`size` rearrangement instructions over 9 stacks."""
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(9)
+    ]
+    height = max(map(len, stacks))
+    lines = [
+        " ".join(
+            f"[{stack[row]}]" if row < len(stack) else "   " for stack in stacks
+        ).rstrip()
+        for row in reversed(range(height))
+    ]
+    lines.append(" ".join(f" {idx} " for idx in range(1, 10)))
+    lines.append("")
+    for _ in range(size):
+        # never empty a stack, the answer is made of the tops of all of them
+        from_ = rng.choice([idx for idx, stack in enumerate(stacks) if len(stack) > 1])
+        to = rng.choice([idx for idx in range(9) if idx != from_])
+        count = rng.randint(1, len(stacks[from_]) - 1)
+        moved = stacks[from_][-count:]
+        del stacks[from_][-count:]
+        stacks[to].extend(moved)
+        lines.append(f"move {count} from {from_ + 1} to {to + 1}")
+    return _render(lines)
+
+
+def generate_day_06(rng: random.Random, size: int) -> str:
+    """A datastream of `size` characters with the only markers at its very end."""
+    filler = rng.sample(string.ascii_lowercase, 3)
+    marker = rng.sample([c for c in string.ascii_lowercase if c not in filler], 14)
+    body = rng.choices(filler, k=max(0, size - len(marker)))
+    return "".join(body + marker) + "\n"
+
+
+def generate_day_07(rng: random.Random, size: int) -> str:
+    """A terminal session listing `size` directories."""
+    children: dict[int, list[int]] = {0: []}
+    for directory in range(1, size):
+        children[directory] = []
+        children[rng.randrange(directory)].append(directory)
+
+    # fill about 45M of the 70M disk, so that task 2 has to free up some space
+    max_file_size = 36_000_000 // size
+    lines = ["$ cd /"]
+
+    def visit(directory: int) -> None:
+        lines.append("$ ls")
+        subdirs = children[directory]
+        entries = [f"dir d{subdir}" for subdir in subdirs] + [
+            f"{rng.randint(1000, max_file_size)} f{idx}.txt"
+            for idx in range(rng.randint(0, 5))
+        ]
+        rng.shuffle(entries)
+        lines.extend(entries)
+        for subdir in subdirs:
+            lines.append(f"$ cd d{subdir}")
+            visit(subdir)
+            lines.append("$ cd ..")
+
+    visit(0)
+    return _render(lines)
+
+
+def generate_day_08(rng: random.Random, size: int) -> str:
+    """A `size` x `size` grid of tree heights."""
+    return _render(["".join(rng.choices(string.digits, k=size)) for _ in range(size)])
+
+
+def generate_day_09(rng: random.Random, size: int) -> str:
+    """`size` head motions."""
+    return _render([f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(size)])
+
+
+def generate_day_10(rng: random.Random, size: int) -> str:
+    """A program of `size` instructions."""
+    return _render(
+        [
+            "noop" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20) or 1}"
+            for _ in range(size)
+        ]
+    )
+
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19]
+
+
+def generate_day_11(rng: random.Random, size: int) -> str:
+    """Eight monkeys holding `size` (at least 8) items between them."""
+    n_monkeys = len(PRIMES)
+    # the product of all the tests must stay small enough for `old * old` to fit
+    # in an int64 after normalization
+    divisors = rng.sample(PRIMES, n_monkeys)
+    # every monkey starts with at least one item
+    items = [[rng.randint(50, 99)] for _ in range(n_monkeys)]
+    for _ in range(size - n_monkeys):
+        items[rng.randrange(n_monkeys)].append(rng.randint(50, 99))
+    operations = ["old * old"] + [
+        rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        for _ in range(n_monkeys - 1)
+    ]
+    rng.shuffle(operations)
+    blocks: list[str] = []
+    for monkey_id in range(n_monkeys):
+        others = [idx for idx in range(n_monkeys) if idx != monkey_id]
+        target_true, target_false = rng.sample(others, 2)
+        starting_items = ", ".join(map(str, items[monkey_id]))
+        blocks.append(
+            f"Monkey {monkey_id}:\n"
+            f"  Starting items: {starting_items}\n"
+            f"  Operation: new = {operations[monkey_id]}\n"
+            f"  Test: divisible by {divisors[monkey_id]}\n"
+            f"    If true: throw to monkey {target_true}\n"
+            f"    If false: throw to monkey {target_false}\n"
+        )
+    return "\n".join(blocks)
+
+
+def generate_day_12(rng: random.Random, size: int) -> str:
+    """A `size` x `2 * size` heightmap, `size` has to be at least 12."""
+    height, width = size, 2 * size
+    assert size >= 12, "the map needs room to climb from a to z"
+
+    def distance(a: tuple[int, int], b: tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    cells = list(it.product(range(height), range(width)))
+    start = (rng.randrange(height), 0)
+    end = rng.choice([cell for cell in cells if distance(cell, start) >= 25])
+    # minima and maxima of 1-Lipschitz cones are 1-Lipschitz, so neighbouring
+    # elevations never differ by more than one and every cell is reachable
+    valleys = [(start, 0)] + [
+        (rng.choice(cells), rng.randint(0, 10)) for _ in range(round(size**0.5))
+    ]
+    lines: list[str] = []
+    for y in range(height):
+        buf = io.StringIO()
+        for x in range(width):
+            cell = (y, x)
+            elevation = min(depth + distance(cell, valley) for valley, depth in valleys)
+            elevation = max(min(elevation, 25), 25 - distance(cell, end))
+            if cell == start:
+                buf.write("S")
+            elif cell == end:
+                buf.write("E")
+            else:
+                buf.write(string.ascii_lowercase[elevation])
+        lines.append(buf.getvalue())
+    return _render(lines)
+
+
+Packet = int | list["Packet"]
+PacketKey = int | tuple["PacketKey", ...]
+
+
+def _packet_key(packet: Packet) -> PacketKey:
+    """Packets with the same key are in neither the right nor the wrong order."""
+    if isinstance(packet, int):
+        return packet
+    items = tuple(map(_packet_key, packet))
+    if len(items) == 1 and isinstance(items[0], int):
+        return items[0]
+    return items
+
+
+def _generate_packet(rng: random.Random, depth: int) -> list[Packet]:
+    packet: list[Packet] = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_generate_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def generate_day_13(rng: random.Random, size: int) -> str:
+    """`size` pairs of distinct packets."""
+    seen: set[PacketKey] = {_packet_key([[2]]), _packet_key([[6]])}
+    packets: list[str] = []
+    while len(packets) < 2 * size:
+        packet = _generate_packet(rng, 0)
+        key = _packet_key(packet)
+        if key in seen:
+            continue
+        seen.add(key)
+        packets.append(str(packet).replace(" ", ""))
+    pairs = (f"{left}\n{right}\n" for left, right in zip(packets[::2], packets[1::2]))
+    return "\n".join(pairs)
+
+
+def generate_day_14(rng: random.Random, size: int) -> str:
+    """`size` rock paths below the sand source."""
+    spread = 10 + size
+    # a shelf under all the other rocks keeps the first units of sand from falling
+    # into the abyss
+    lines = [f"495,{3 + spread} -> 505,{3 + spread}"]
+    for _ in range(size - 1):
+        x = rng.randint(500 - spread, 500 + spread)
+        y = rng.randint(2, 2 + spread)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 4)):
+            if segment % 2:
+                y = min(max(1, y + rng.randint(-5, 5)), 2 + spread)
+            else:
+                x += rng.randint(-5, 5)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return _render(lines)
+
+
+def _sensor_line(rng: random.Random, x: int, y: int, reach: int) -> str:
+    beacon_x = x + rng.randint(-reach, reach)
+    beacon_y = y + rng.choice([-1, 1]) * (reach - abs(beacon_x - x))
+    return f"Sensor at x={x}, y={y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+
+
+def generate_day_15(rng: random.Random, size: int) -> str:
+    """
+    `size` (at least 4) sensors in a `100 * size` square.
+
+    Task 1 should look at row `50 * size`, task 2 at the square up to `100 * size`.
+    """
+    extent = 100 * size
+    hidden_x, hidden_y = rng.randint(0, extent), rng.randint(0, extent)
+    # four sensors on the diagonals of the hidden beacon, each reaching just short
+    # of it, cover everything else in the square
+    lines = [
+        _sensor_line(rng, hidden_x + dx, hidden_y + dy, 2 * extent - 1)
+        for dx, dy in it.product([-extent, extent], repeat=2)
+    ]
+    for _ in range(size - 4):
+        x, y = rng.randint(0, extent), rng.randint(0, extent)
+        distance = abs(x - hidden_x) + abs(y - hidden_y)
+        if distance > 1:
+            lines.append(_sensor_line(rng, x, y, rng.randint(1, distance - 1)))
+    rng.shuffle(lines)
+    return _render(lines)
+
+
+def generate_day_16(rng: random.Random, size: int) -> str:
+    """`size` valves, up to 8 of them working."""
+    names = ["AA"] + rng.sample(
+        [
+            "".join(pair)
+            for pair in it.product(string.ascii_uppercase, repeat=2)
+            if pair != ("A", "A")
+        ],
+        size - 1,
+    )
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+    for idx, name in enumerate(names[1:], 1):
+        other = names[rng.randrange(idx)]
+        tunnels[name].add(other)
+        tunnels[other].add(name)
+    for _ in range(size // 2):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    working = set(rng.sample(names[1:], min(8, size - 1)))
+    lines: list[str] = []
+    for name in names:
+        flow_rate = rng.randint(2, 25) if name in working else 0
+        targets = sorted(tunnels[name])
+        if len(targets) == 1:
+            description = f"tunnel leads to valve {targets[0]}"
+        else:
+            description = f"tunnels lead to valves {', '.join(targets)}"
+        lines.append(f"Valve {name} has flow rate={flow_rate}; {description}")
+    return _render(lines)
+
+
+def generate_day_17(rng: random.Random, size: int) -> str:
+    """A jet pattern of `size` pushes."""
+    return "".join(rng.choices("<>", k=size)) + "\n"
+
+
+def generate_day_18(rng: random.Random, size: int) -> str:
+    """`size` cubes of a random lava blob."""
+    side = max(3, round(size ** (1 / 3) * 1.5))
+    cells = list(it.product(range(side), repeat=3))
+    voxels = set(rng.sample(cells, min(size, len(cells) - 1)))
+    # the exterior search starts from the minimal corner, which has to be air
+    while (corner := tuple(min(axis) for axis in zip(*voxels))) in voxels:
+        voxels.remove(corner)
+    return _render([f"{x},{y},{z}" for x, y, z in voxels])
+
+
+def generate_day_19(rng: random.Random, size: int) -> str:
+    """`size` blueprints."""
+    return _render(
+        [
+            f"Blueprint {blueprint_id}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+            for blueprint_id in range(1, size + 1)
+        ]
+    )
+
+
+def generate_day_20(rng: random.Random, size: int) -> str:
+    """An encrypted file of `size` numbers with a single zero."""
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, size - 1), 0)
+    return _render(list(map(str, numbers)))
+
+
+OPERATIONS: dict[str, Callable[[int, int], int]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+}
+
+
+def generate_day_21(rng: random.Random, size: int) -> str:
+    """
+    About `size` monkeys.
+
+    Both sides of `root` are equal for the original value of `humn`, and all the
+    divisions are exact, so that task 2 recovers that value.
+    """
+    names = iter(
+        rng.sample(
+            [
+                name
+                for name in map("".join, it.product(string.ascii_lowercase, repeat=4))
+                if name not in {"root", "humn"}
+            ],
+            size + 4,
+        )
+    )
+    lines: list[str] = []
+
+    def build(n_monkeys: int, with_human: bool) -> tuple[str, int]:
+        if n_monkeys == 1:
+            name = "humn" if with_human else next(names)
+            value = rng.randint(1, 20)
+            lines.append(f"{name}: {value}")
+            return name, value
+        # every monkey that yells an operation waits for two others
+        n_left = rng.randrange(1, n_monkeys - 1, 2)
+        human_left = rng.random() < 0.5
+        left_name, left = build(n_left, with_human and human_left)
+        right_name, right = build(n_monkeys - 1 - n_left, with_human and not human_left)
+        results = {
+            symbol: operation(left, right)
+            for symbol, operation in OPERATIONS.items()
+            if (symbol != "*" or abs(left * right) < 10**9)
+            and (symbol != "/" or left % right == 0)
+        }
+        # zeros would make the inverse operations on the path to humn ambiguous
+        symbol = rng.choice([symbol for symbol, result in results.items() if result])
+        name = next(names)
+        lines.append(f"{name}: {left_name} {symbol} {right_name}")
+        return name, results[symbol]
+
+    # root and the two monkeys balancing the other side come on top of two odd trees,
+    # humn is never right below root, like in the puzzle inputs
+    n_monkeys = max(size, 7) - 3
+    n_monkeys += n_monkeys % 2
+    n_human_side = rng.randrange(3, n_monkeys, 2)
+    human_name, human_side = build(n_human_side, True)
+    other_name, other_side = build(n_monkeys - n_human_side, False)
+    balance_name, balanced_name = next(names), next(names)
+    lines.append(f"{balance_name}: {abs(human_side - other_side)}")
+    symbol = "+" if human_side >= other_side else "-"
+    lines.append(f"{balanced_name}: {other_name} {symbol} {balance_name}")
+    lines.append(f"root: {human_name} + {balanced_name}")
+    rng.shuffle(lines)
+    return _render(lines)
+
+
+def generate_day_22(rng: random.Random, size: int) -> str:
+    """A cube net with faces of `size` x `size` tiles, laid out like the input."""
+    from .day_22.task_2 import INPUT_SUPER_TILES
+
+    lines: list[str] = []
+    for super_row in INPUT_SUPER_TILES:
+        for _ in range(size):
+            buf = io.StringIO()
+            for super_tile in super_row:
+                if super_tile is None:
+                    buf.write(" " * size)
+                else:
+                    buf.write("".join(rng.choices(".#", weights=[9, 1], k=size)))
+            lines.append(buf.getvalue().rstrip())
+    # the starting tile has to be open
+    lines[0] = lines[0][:size] + "." + lines[0][size + 1 :]
+    path = "".join(
+        f"{rng.randint(1, 2 * size)}{rng.choice('LR')}" for _ in range(4 * size)
+    )
+    lines.extend(["", f"{path}{rng.randint(1, 2 * size)}"])
+    return _render(lines)
+
+
+def generate_day_23(rng: random.Random, size: int) -> str:
+    """A `size` x `size` grove, half of it full of elves."""
+    return _render(["".join(rng.choices(".#", k=size)) for _ in range(size)])
+
+
+def generate_day_24(rng: random.Random, size: int) -> str:
+    """A `size` x `2 * size` valley with blizzards on a quarter of the tiles."""
+    height, width = size, 2 * size
+
+    def tile(x: int) -> str:
+        if rng.random() >= 0.25:
+            return "."
+        # no vertical blizzards in the columns of the entrance and the exit
+        return rng.choice("<>" if x in {0, width - 1} else "<>^v")
+
+    lines = ["#." + "#" * width]
+    lines.extend("#" + "".join(map(tile, range(width))) + "#" for _ in range(height))
+    lines.append("#" * width + ".#")
+    return _render(lines)
+
+
+SNAFU_DIGITS = "=-012"
+
+
+def generate_day_25(rng: random.Random, size: int) -> str:
+    """`size` SNAFU numbers."""
+    return _render(
+        [
+            rng.choice("12") + "".join(rng.choices(SNAFU_DIGITS, k=rng.randint(0, 19)))
+            for _ in range(size)
+        ]
+    )
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day_01,
+    2: generate_day_02,
+    3: generate_day_03,
+    4: generate_day_04,
+    5: generate_day_05,
+    6: generate_day_06,
+    7: generate_day_07,
+    8: generate_day_08,
+    9: generate_day_09,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    20: generate_day_20,
+    21: generate_day_21,
+    22: generate_day_22,
+    23: generate_day_23,
+    24: generate_day_24,
+    25: generate_day_25,
+}
+
+# Inclusive bounds of the sizes that make valid inputs, where the default of at
+# least one does not do.
+SIZE_LIMITS: dict[int, tuple[int, int | None]] = {
+    # a starting item per monkey
+    11: (8, None),
+    # room to climb from a to z
+    12: (12, None),
+    # the four sensors hiding the distress beacon
+    15: (4, None),
+    # valves have two letter names
+    16: (1, len(string.ascii_uppercase) ** 2),
+    # monkeys have four letter names, but for root, humn and the monkeys on top
+    21: (1, len(string.ascii_lowercase) ** 4 - 6),
+}
+
+
+def check_size(day: int, size: int, param_hint: str = "SIZE") -> None:
+    low, high = SIZE_LIMITS.get(day, (1, None))
+    if size < low or (high is not None and size > high):
+        bounds = f"at least {low}" if high is None else f"from {low} to {high}"
+        raise click.BadParameter(
+            f"day {day} needs a size {bounds}, got {size}", param_hint=param_hint
+        )
+
+
+# Extra solver arguments that match the generated inputs.
+GENERATED_ARGUMENTS: dict[tuple[int, int], Callable[[int], dict[str, Any]]] = {
+    (15, 1): lambda size: {"target_y": 50 * size},
+    (15, 2): lambda size: {"max_x": 100 * size, "max_y": 100 * size},
+    (22, 2): lambda size: {"is_input": True},
+}
+
+
+def generate(day: int, size: int, *, seed: int = 0) -> str:
+    return GENERATORS[day](random.Random(f"{day}:{size}:{seed}"), size)
+
+
+def write_input(day: int, size: int, directory: Path, *, seed: int = 0) -> Path:
+    path = directory / f"day_{day:02d}" / f"generated_{size}_{seed}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written aside and moved in place, so that concurrent runs sharing the
+        # directory never read a partly written input
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        tmp_path.write_text(generate(day, size, seed=seed))
+        os.replace(tmp_path, path)
+    return path
+
+
+@click.command()
+@click.argument("day", type=click.IntRange(min=1, max=25))
+@click.argument("size", type=click.IntRange(min=1))
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the generated input (stdout by default)",
+)
+def main(day: int, size: int, seed: int, output: io.TextIOBase) -> None:
+    check_size(day, size)
+    output.write(generate(day, size, seed=seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from numpy import typing as npt
+
+ScalarT = TypeVar("ScalarT", bound=np.generic)
+
+# (dy, dx) of a single step, y grows southwards
+Direction = tuple[int, int]
+
+NORTH: Direction = (-1, 0)
+SOUTH: Direction = (1, 0)
+WEST: Direction = (0, -1)
+EAST: Direction = (0, 1)
+NORTH_WEST: Direction = (-1, -1)
+NORTH_EAST: Direction = (-1, 1)
+SOUTH_WEST: Direction = (1, -1)
+SOUTH_EAST: Direction = (1, 1)
+
+ORTHOGONAL: tuple[Direction, ...] = (NORTH, SOUTH, WEST, EAST)
+ALL_DIRECTIONS: tuple[Direction, ...] = (
+    NORTH_WEST,
+    NORTH,
+    NORTH_EAST,
+    WEST,
+    EAST,
+    SOUTH_WEST,
+    SOUTH,
+    SOUTH_EAST,
+)
+
+
+def _slices(direction: Direction) -> tuple[tuple[slice, slice], tuple[slice, slice]]:
+    """Target and source slices of moving a whole array a step in `direction`."""
+
+    def axis(delta: int) -> tuple[slice, slice]:
+        if delta > 0:
+            return slice(delta, None), slice(None, -delta)
+        if delta < 0:
+            return slice(None, delta), slice(-delta, None)
+        return slice(None), slice(None)
+
+    (target_y, source_y), (target_x, source_x) = map(axis, direction)
+    return (target_y, target_x), (source_y, source_x)
+
+
+def shift(
+    cells: npt.NDArray[ScalarT], direction: Direction, fill: Any = 0
+) -> npt.NDArray[ScalarT]:
+    """The cells moved a step in `direction`, the vacated edge set to `fill`."""
+    result = np.full_like(cells, fill)
+    target, source = _slices(direction)
+    result[target] = cells[source]
+    return result
+
+
+def neighbour_mask(
+    cells: npt.NDArray[ScalarT], direction: Direction, fill: Any = 0
+) -> npt.NDArray[ScalarT]:
+    """The neighbour of every cell in `direction`, `fill` past the edges."""
+    dy, dx = direction
+    return shift(cells, (-dy, -dx), fill)
+
+
+class Grid(Generic[ScalarT]):
+    """
+    A 2D board stored in a flat NumPy array, with a border around it.
+
+    Cells are addressed by their flat index, so that a neighbour is a single
+    addition of an offset away. The border keeps the neighbours of every cell of
+    the board within the array, `inside` tells the board and the border apart.
+    """
+
+    def __init__(
+        self, cells: npt.NDArray[ScalarT], *, border: int = 1, fill: Any = 0
+    ) -> None:
+        self.height, self.width = cells.shape
+        self.border = border
+        self.stride = self.width + 2 * border
+        self.padded: npt.NDArray[ScalarT] = np.pad(cells, border, constant_values=fill)
+        self.flat: npt.NDArray[ScalarT] = self.padded.reshape(-1)
+        self.inside: npt.NDArray[np.bool_] = np.pad(
+            np.ones(cells.shape, dtype=bool), border, constant_values=False
+        ).reshape(-1)
+
+    @property
+    def cells(self) -> npt.NDArray[ScalarT]:
+        """View of the board without the border."""
+        border = self.border
+        return self.padded[border : border + self.height, border : border + self.width]
+
+    @property
+    def size(self) -> int:
+        return len(self.flat)
+
+    def index(self, y: int, x: int) -> int:
+        return (y + self.border) * self.stride + x + self.border
+
+    def position(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return y - self.border, x - self.border
+
+    def indices(self, mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.intp]:
+        """Flat indices of the cells of the board selected by `mask`."""
+        ys, xs = np.nonzero(mask)
+        return (ys + self.border) * self.stride + xs + self.border
+
+    def offset(self, direction: Direction) -> int:
+        dy, dx = direction
+        return dy * self.stride + dx
+
+    def offsets(
+        self, directions: tuple[Direction, ...] = ORTHOGONAL
+    ) -> tuple[int, ...]:
+        """Flat index offsets of the neighbours in `directions`."""
+        assert self.border >= max(
+            max(abs(dy), abs(dx)) for dy, dx in directions
+        ), "neighbours do not fit in the border"
+        return tuple(map(self.offset, directions))
+
+    def manhattan_distance(self, a: int, b: int) -> int:
+        (a_y, a_x), (b_y, b_x) = self.position(a), self.position(b)
+        return abs(a_y - b_y) + abs(a_x - b_x)
+
+    def full(self, fill: Any, dtype: npt.DTypeLike = None) -> npt.NDArray[Any]:
+        """A flat array of the same layout, e.g. for costs or visited flags."""
+        return np.full(self.size, fill, dtype=dtype or self.flat.dtype)
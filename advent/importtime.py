@@ -0,0 +1,132 @@
+import collections
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import click
+
+from .runner import Task, select_tasks
+
+line_pattern = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| "
+    r"(?P<indent> *)(?P<name>\S+)$"
+)
+
+
+@dataclass
+class Import:
+    name: str
+    cumulative: int
+    children: list["Import"] = field(default_factory=list)
+
+
+class Report(NamedTuple):
+    task: Task
+    total: int
+    dependencies: dict[str, int]
+
+
+def parse_imports(output: str) -> list[Import]:
+    """Top level imports of `python -X importtime` output with their subimports."""
+    # children are reported before their parent, one level deeper
+    pending: dict[int, list[Import]] = collections.defaultdict(list)
+    for line in output.splitlines():
+        match = line_pattern.match(line)
+        if match is None:
+            continue
+        level = len(match["indent"]) // 2
+        entry = Import(
+            name=match["name"],
+            cumulative=int(match["cumulative"]),
+            children=pending.pop(level + 1, []),
+        )
+        pending[level].append(entry)
+    return pending[0]
+
+
+def get_dependencies(entry: Import) -> Iterable[Import]:
+    """The outermost imports of anything outside of this package."""
+    for child in entry.children:
+        if child.name.split(".")[0] == __package__:
+            yield from get_dependencies(child)
+        else:
+            yield child
+
+
+def measure(task: Task) -> Report:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {task.module_name}"],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = parse_imports(process.stderr)
+    # importing `advent.day_XX.task_N` imports its parent packages first
+    own_entries = [
+        entry for entry in entries if entry.name.split(".")[0] == __package__
+    ]
+    dependencies: dict[str, int] = collections.Counter()
+    for entry in own_entries:
+        for dependency in get_dependencies(entry):
+            dependencies[dependency.name.split(".")[0]] += dependency.cumulative
+    return Report(
+        task=task,
+        total=sum(entry.cumulative for entry in own_entries),
+        dependencies=dependencies,
+    )
+
+
+def format_report(report: Report, top: int) -> str:
+    heaviest = sorted(report.dependencies.items(), key=lambda item: -item[1])[:top]
+    dependencies = ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in heaviest)
+    return f"{report.task}: {report.total / 1000:7.1f}ms  {dependencies}"
+
+
+@click.command()
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Days to run")
+@click.option("--task", "-t", "tasks", type=int, multiple=True, help="Tasks to run")
+@click.option(
+    "--repeat",
+    "-r",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Report the fastest of this many cold starts",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=3,
+    show_default=True,
+    help="Number of heaviest dependencies to list",
+)
+@click.option(
+    "--limit",
+    type=float,
+    help="Fail if importing any entry point takes longer (in milliseconds)",
+)
+def main(
+    days: tuple[int, ...],
+    tasks: tuple[int, ...],
+    repeat: int,
+    top: int,
+    limit: float | None,
+) -> None:
+    """Time the imports of the entry points, measured by `python -X importtime`."""
+    too_slow = 0
+    for task in select_tasks(days, tasks):
+        report = min(
+            (measure(task) for _ in range(repeat)), key=lambda report: report.total
+        )
+        click.echo(format_report(report, top))
+        too_slow += limit is not None and report.total / 1000 > limit
+    if too_slow:
+        raise click.ClickException(f"{too_slow} entry points import too slowly")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,396 @@
+from __future__ import annotations
+
+import codecs
+import contextlib
+import importlib
+import mmap
+import sys
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, cast, overload
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy import typing as npt
+
+# Line-aligned chunks handed out by `iter_chunks` are about this big.
+DEFAULT_CHUNK_SIZE = 16 * 2**20
+
+# `read_ints` parses this many bytes of whole lines at a time. The temporaries of
+# `parse_ints` take several times the size of the input, they are much faster to
+# work through while they fit in the CPU caches.
+PARSE_BLOCK_SIZE = 2**16
+
+# Passed instead of an input file to read the input from the standard input.
+STDIN = Path("-")
+COMPRESSED_SUFFIXES = frozenset({".gz", ".xz", ".zst"})
+
+
+def get_data_dir(day: int) -> Path:
+    return Path(__file__).parent.parent / "data" / f"day_{day:02d}"
 
 
 def get_data_path(day: int, filename: str) -> Path:
-    base_path = Path(__file__).parent.parent / "data"
-    return base_path / f"day{day:02d}" / filename
+    return get_data_dir(day) / filename
+
+
+def is_stream(filename: Path) -> bool:
+    """Whether the input can only be read front to back, and not be mapped."""
+    return filename == STDIN or filename.suffix in COMPRESSED_SUFFIXES
+
+
+def _decompress(filename: Path) -> BinaryIO:
+    if filename.suffix == ".gz":
+        import gzip
+
+        return cast(BinaryIO, gzip.open(filename, "rb"))
+    if filename.suffix == ".xz":
+        import lzma
+
+        return cast(BinaryIO, lzma.open(filename, "rb"))
+    assert filename.suffix == ".zst", filename
+    try:
+        # optional, only needed for .zst inputs
+        zstandard = importlib.import_module("zstandard")
+    except ImportError as ex:
+        raise ImportError("reading .zst inputs requires zstandard") from ex
+    return cast(BinaryIO, zstandard.open(filename, "rb"))
+
+
+@contextlib.contextmanager
+def open_input(filename: Path) -> Iterator[BinaryIO]:
+    """The decompressed bytes of the input file, or of the standard input."""
+    if filename == STDIN:
+        yield sys.stdin.buffer
+    elif filename.suffix in COMPRESSED_SUFFIXES:
+        with _decompress(filename) as f:
+            yield f
+    else:
+        with filename.open("rb") as f:
+            yield f
+
+
+@contextlib.contextmanager
+def map_file(filename: Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Map the file read-only into memory, pages are only read when touched.
+
+    Streams (see `is_stream`) cannot be mapped, they are read whole instead.
+    """
+    if is_stream(filename):
+        with open_input(filename) as f:
+            yield f.read()
+        return
+    with filename.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # slices still held by the caller, unmapped once they are gone
+                pass
+
+
+def iter_line_slices(filename: Path) -> Iterator[memoryview]:
+    """
+    Zero-copy views of the lines of the file, without the line breaks (`\\n` or
+    `\\r\\n`).
+    """
+    if is_stream(filename):
+        with open_input(filename) as f:
+            for line in f:
+                yield memoryview(line.removesuffix(b"\n").removesuffix(b"\r"))
+        return
+    with map_file(filename) as mapped:
+        view = memoryview(mapped)
+        start = 0
+        while start < len(mapped):
+            stop = mapped.find(b"\n", start)
+            if stop == -1:
+                stop = len(mapped)
+            end = stop - 1 if stop > start and mapped[stop - 1] == ord("\r") else stop
+            yield view[start:end]
+            start = stop + 1
+
+
+def uses_windows_line_breaks(data: bytes | memoryview | mmap.mmap) -> bool:
+    """Whether the lines of `data` end with `\\r\\n`, going by the first one."""
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # lines are short, so the first line break is looked for in growing prefixes
+    size = 256
+    while True:
+        line_ends = np.flatnonzero(raw[:size] == ord("\n"))
+        if len(line_ends) or size >= len(raw):
+            break
+        size *= 16
+    return bool(len(line_ends) and line_ends[0] and raw[line_ends[0] - 1] == ord("\r"))
+
+
+@overload
+def normalize_line_breaks(data: bytes | mmap.mmap) -> bytes | mmap.mmap:
+    ...
+
+
+@overload
+def normalize_line_breaks(data: memoryview) -> bytes | memoryview:
+    ...
+
+
+def normalize_line_breaks(
+    data: bytes | memoryview | mmap.mmap,
+) -> bytes | memoryview | mmap.mmap:
+    """
+    `data` with `\\n` line breaks, for parsers that split lines on them. Only data
+    with Windows line breaks gets copied, without the `\\r`s.
+    """
+    if not uses_windows_line_breaks(data):
+        return data
+    return bytes(data).replace(b"\r\n", b"\n").removesuffix(b"\r")
+
+
+def iter_chunk_bounds(
+    data: bytes | mmap.mmap,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: bytes = b"\n",
+) -> Iterator[tuple[int, int]]:
+    """
+    Start and stop offsets of consecutive chunks of `data` of about `chunk_size`,
+    each ending right after a `delimiter` (or at the end of `data`). The line
+    breaks of the delimiter match Windows line breaks as well, if `data` has them.
+    """
+    if uses_windows_line_breaks(data):
+        delimiter = delimiter.replace(b"\n", b"\r\n")
+    start = 0
+    while start < len(data):
+        found = data.rfind(delimiter, start, start + chunk_size)
+        if found == -1:
+            # a single record longer than the chunk size
+            found = data.find(delimiter, start + chunk_size - len(delimiter) + 1)
+        stop = len(data) if found == -1 else found + len(delimiter)
+        yield start, stop
+        start = stop
+
+
+def iter_line_group_bounds(
+    data: bytes | mmap.mmap,
+    lines_per_group: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[int, int]]:
+    """
+    Start and stop offsets of consecutive chunks of `data` of about `chunk_size`,
+    each holding whole groups of `lines_per_group` lines (but maybe the last one).
+    """
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    start = 0
+    while start < len(data):
+        stop = start + chunk_size
+        if stop >= len(data):
+            yield start, len(data)
+            return
+        lines = int(np.count_nonzero(raw[start:stop] == ord("\n")))
+        if lines < lines_per_group:
+            # a single group longer than the chunk size
+            stop = start
+            for _ in range(lines_per_group):
+                stop = data.find(b"\n", stop) + 1
+                if not stop:
+                    stop = len(data)
+                    break
+        else:
+            # back off the partial line and the lines of the last partial group
+            for _ in range(lines % lines_per_group + 1):
+                stop = data.rfind(b"\n", start, stop)
+            stop += 1
+        yield start, stop
+        start = stop
+
+
+def iter_chunks(
+    filename: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: bytes = b"\n"
+) -> Iterator[memoryview]:
+    """
+    Zero-copy views of consecutive chunks of whole lines of the file.
+
+    Only the chunk being processed has to fit in memory, so this works for inputs
+    larger than RAM. Streams are read incrementally, a chunk at a time. Records
+    of several lines stay whole with a `delimiter` such as `b"\\n\\n"`, which
+    matches `b"\\r\\n\\r\\n"` in files with Windows line breaks.
+    """
+    if is_stream(filename):
+        yield from _iter_stream_chunks(filename, chunk_size, delimiter)
+        return
+    with map_file(filename) as mapped:
+        view = memoryview(mapped)
+        for start, stop in iter_chunk_bounds(mapped, chunk_size, delimiter):
+            yield view[start:stop]
+
+
+def _iter_stream_chunks(
+    filename: Path, chunk_size: int, delimiter: bytes
+) -> Iterator[memoryview]:
+    rest = b""
+    line_breaks_seen = False
+    with open_input(filename) as f:
+        while block := f.read(chunk_size):
+            data = rest + block
+            if not line_breaks_seen and b"\n" in data:
+                line_breaks_seen = True
+                if uses_windows_line_breaks(data):
+                    delimiter = delimiter.replace(b"\n", b"\r\n")
+            stop = data.rfind(delimiter) + len(delimiter)
+            if stop < len(delimiter):
+                stop = 0
+            # the last, incomplete record is carried over to the next chunk
+            rest = data[stop:]
+            if stop:
+                yield memoryview(data)[:stop]
+    if rest:
+        yield memoryview(rest)
+
+
+def iter_line_group_chunks(
+    filename: Path,
+    lines_per_group: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[memoryview]:
+    """
+    Views of consecutive chunks of the file, each holding whole groups of
+    `lines_per_group` lines (but maybe the last one). Streams are read
+    incrementally, like with `iter_chunks`.
+    """
+    if not is_stream(filename):
+        with map_file(filename) as mapped:
+            view = memoryview(mapped)
+            for start, stop in iter_line_group_bounds(
+                mapped, lines_per_group, chunk_size
+            ):
+                yield view[start:stop]
+        return
+    rest = b""
+    for chunk in _iter_stream_chunks(filename, chunk_size, b"\n"):
+        data = rest + chunk
+        stop = len(data)
+        if data.endswith(b"\n"):
+            # the lines of the last partial group are carried over to the next chunk
+            for _ in range(data.count(b"\n") % lines_per_group):
+                stop = data.rfind(b"\n", 0, stop - 1) + 1
+        rest = data[stop:]
+        if stop:
+            yield memoryview(data)[:stop]
+    if rest:
+        yield memoryview(rest)
+
+
+def split_lines(chunk: bytes | memoryview) -> list[str]:
+    """Lines of a chunk of whole lines, without their line breaks."""
+    # Windows line breaks read like the text mode of `open` would read them
+    text = codecs.decode(chunk).replace("\r\n", "\n")
+    if text.endswith(("\n", "\r")):
+        text = text[:-1]
+    return text.split("\n")
 
 
 def get_stripped_lines(filename: Path) -> Iterable[str]:
-    with filename.open() as f:
-        for line in f:
-            yield line.rstrip("\n")
+    for chunk in iter_chunks(filename):
+        yield from split_lines(chunk)
+
+
+def parse_ints(
+    data: bytes | memoryview | mmap.mmap, *, signed: bool = False
+) -> npt.NDArray[np.int64]:
+    """
+    All the decimal integers in `data`, in order.
+
+    Anything but digits separates numbers. With `signed`, a minus sign right before
+    a number negates it, otherwise it is a separator like in `2-4`. The numbers
+    have to fit in an int64.
+    """
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    digits = raw - np.uint8(ord("0"))
+    is_digit = digits <= 9
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    lengths = stops - starts
+    assert lengths.max(initial=0) < 19, "numbers do not fit in an int64"
+    # weight every digit by the power of ten of its place in its number and sum the
+    # weights of each number as differences of a running total, which stay right
+    # even if the running total itself overflows
+    positions = np.flatnonzero(is_digit)
+    places = np.repeat(stops - 1, lengths) - positions
+    weighted = (
+        digits[positions] * (np.int64(10) ** np.arange(19, dtype=np.int64))[places]
+    )
+    totals = np.cumsum(weighted)[np.cumsum(lengths) - 1]
+    values = np.diff(totals, prepend=np.int64(0))
+    if signed:
+        negative = starts > 0
+        negative[negative] = raw[starts[negative] - 1] == ord("-")
+        values[negative] *= -1
+    return values
+
+
+def read_ints(
+    filename: Path, *, per_line: int | None = None, signed: bool = False
+) -> npt.NDArray[np.int64]:
+    """
+    All the integers in the file, as a `(lines, per_line)` array if given.
+
+    Lines without any numbers are skipped.
+    """
+    import numpy as np
+
+    with map_file(filename) as mapped:
+        view = memoryview(mapped)
+        values: npt.NDArray[np.int64] = np.concatenate(
+            [
+                np.empty(0, dtype=np.int64),
+                *(
+                    parse_ints(view[start:stop], signed=signed)
+                    for start, stop in iter_chunk_bounds(mapped, PARSE_BLOCK_SIZE)
+                ),
+            ]
+        )
+    if per_line is None:
+        return values
+    assert len(values) % per_line == 0, (len(values), per_line)
+    return values.reshape(-1, per_line)
+
+
+def read_char_grid(filename: Path) -> npt.NDArray[np.uint8]:
+    """Bytes of a file of equally long lines as a `(lines, width)` array."""
+    import numpy as np
+
+    with map_file(filename) as mapped:
+        data: bytes | mmap.mmap = mapped
+        width = data.find(b"\n")
+        if width > 0 and data[width - 1] == ord("\r"):
+            # only files with Windows line breaks get copied, without the `\r`s
+            data = bytes(data).replace(b"\r\n", b"\n").removesuffix(b"\r")
+            width -= 1
+        raw = np.frombuffer(data, dtype=np.uint8)
+        size = len(raw)
+        if size and raw[-1] == ord("\n"):
+            size -= 1
+        if width == -1:
+            width = size
+        assert (size + 1) % (width + 1) == 0, "lines are not equally long"
+        grid = np.empty((size + 1) // (width + 1) * (width + 1), dtype=np.uint8)
+        grid[:size] = raw[:size]
+        grid[size:] = ord("\n")
+        del raw
+    grid = grid.reshape(-1, width + 1)
+    assert (grid[:, width] == ord("\n")).all(), "lines are not equally long"
+    return grid[:, :width]
@@ -1,8 +1,13 @@
 import logging
+import os
 import sys
 
 from . import __name__ as package_name
 
+# Hot loops guard their traces with `if TRACING:`, so that they cost a single
+# global lookup unless ADVENT_TRACE=1 was set before the solvers got imported.
+TRACING = os.environ.get("ADVENT_TRACE", "") not in {"", "0"}
+
 
 def setup_logging(package_log_level: int = logging.DEBUG) -> None:
     logging.basicConfig(
@@ -10,6 +15,9 @@ def setup_logging(package_log_level: int = logging.DEBUG) -> None:
         format="[%(asctime)s][%(levelname)8s][%(name)s] %(message)s",
         stream=sys.stdout,
     )
+    if TRACING:
+        # traces are logged at DEBUG level
+        package_log_level = logging.DEBUG
     for logger_name, level in {
         package_name: package_log_level,
         "__main__": package_log_level,
@@ -0,0 +1,187 @@
+import collections
+import os
+import resource
+import sys
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple, Sized, TextIO
+
+# Set (to a file collecting the cache sizes) while a run is reported on, and
+# inherited by its worker processes.
+RECORDS_VARIABLE = "ADVENT_MEMORY_RECORDS"
+
+# How often the traced memory of a reported run is sampled, and by how much it has
+# to grow past the fullest snapshot so far for a new one to be taken (snapshots
+# are too slow to be taken at every sample).
+SAMPLE_INTERVAL = 0.01
+SAMPLE_GROWTH = 1.1
+
+package_root = Path(__file__).parent.parent
+
+# the process that reports, and the fullest of its memory snapshots so far
+_reporting_pid: int | None = None
+_fullest: tuple[int, tracemalloc.Snapshot] | None = None
+_lock = threading.Lock()
+
+
+class CacheSize(NamedTuple):
+    name: str
+    records: int
+    # of the fullest record
+    entries: int
+    size: int
+
+
+def _checkpoint(growth: float = 1.0) -> None:
+    global _fullest
+    if _reporting_pid != os.getpid() or not tracemalloc.is_tracing():
+        return
+    with _lock:
+        current, _ = tracemalloc.get_traced_memory()
+        if _fullest is None or current > _fullest[0] * growth:
+            _fullest = current, tracemalloc.take_snapshot()
+
+
+def _sample(stopped: threading.Event) -> None:
+    while not stopped.wait(SAMPLE_INTERVAL):
+        _checkpoint(SAMPLE_GROWTH)
+
+
+def _stop_tracing_in_child() -> None:
+    # worker processes only record cache sizes, tracing would just slow them down
+    if _reporting_pid is not None and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+os.register_at_fork(after_in_child=_stop_tracing_in_child)
+
+
+def record_cache(name: str, cache: Sized) -> None:
+    """
+    Note the size of a solver cache, for the memory report of runs with `--memory`.
+
+    Call it once the cache is at its fullest, e.g. right before it is dropped, which
+    also snapshots the allocations at that point. Works from worker processes as
+    well.
+    """
+    path = os.environ.get(RECORDS_VARIABLE)
+    if not path:
+        return
+    with open(path, "a") as f:
+        f.write(f"{name}\t{len(cache)}\t{sys.getsizeof(cache)}\n")
+    _checkpoint()
+
+
+def get_peak_rss() -> tuple[int, int]:
+    """Peak resident set size in bytes of this process and of its children."""
+    # kilobytes on Linux, bytes on macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    )
+
+
+def _relative(filename: str) -> str:
+    path = Path(filename)
+    if path.is_relative_to(package_root):
+        return str(path.relative_to(package_root))
+    return filename
+
+
+class MemoryReport:
+    """
+    Collects the memory use of a run: peak RSS, the top allocation sites at the
+    fullest point of the run and the recorded cache sizes (see `record_cache`).
+
+    The fullest point is found by sampling the traced memory while the run goes
+    on, so it may miss short-lived peaks and be up to `SAMPLE_GROWTH` below
+    the peak traced.
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        self.top = top
+        self.records_path: Path | None = None
+        self.caches: list[CacheSize] = []
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.peak_traced = 0
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(
+            target=_sample, args=(self._stopped,), name="memory-sampler", daemon=True
+        )
+
+    def __enter__(self) -> "MemoryReport":
+        global _reporting_pid, _fullest
+        fd, name = tempfile.mkstemp(prefix="advent-memory-", suffix=".tsv")
+        os.close(fd)
+        self.records_path = Path(name)
+        os.environ[RECORDS_VARIABLE] = name
+        _reporting_pid = os.getpid()
+        _fullest = None
+        tracemalloc.start()
+        self._sampler.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        global _reporting_pid
+        assert self.records_path is not None
+        self._stopped.set()
+        self._sampler.join()
+        _checkpoint()
+        assert _fullest is not None
+        _, self.snapshot = _fullest
+        _, self.peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _reporting_pid = None
+        del os.environ[RECORDS_VARIABLE]
+        self.caches = self.read_records(self.records_path)
+        self.records_path.unlink()
+
+    @staticmethod
+    def read_records(path: Path) -> list[CacheSize]:
+        records: dict[str, list[tuple[int, int]]] = collections.defaultdict(list)
+        for line in path.read_text().splitlines():
+            name, entries, size = line.rsplit("\t", 2)
+            records[name].append((int(entries), int(size)))
+        return [
+            CacheSize(name, len(sizes), *max(sizes))
+            for name, sizes in sorted(records.items())
+        ]
+
+    def write(self, output: TextIO) -> None:
+        rss, children_rss = get_peak_rss()
+        output.write(
+            f"peak RSS: {rss / 2**20:.1f}MiB, "
+            f"of child processes: {children_rss / 2**20:.1f}MiB, "
+            f"peak traced: {self.peak_traced / 2**20:.1f}MiB\n"
+        )
+        if self.snapshot is not None:
+            snapshot = self.snapshot.filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+                ]
+            )
+            output.write("top allocation sites at the fullest sample:\n")
+            for statistic in snapshot.statistics("lineno")[: self.top]:
+                frame = statistic.traceback[0]
+                output.write(
+                    f"{statistic.size / 1024:>12.1f}KiB {statistic.count:>9} blocks"
+                    f"  {_relative(frame.filename)}:{frame.lineno}\n"
+                )
+        for cache in self.caches:
+            output.write(
+                f"cache {cache.name}: {cache.entries} entries "
+                f"({cache.size / 1024:.1f}KiB table)"
+                + (f", fullest of {cache.records} records" if cache.records > 1 else "")
+                + "\n"
+            )
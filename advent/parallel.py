@@ -0,0 +1,101 @@
+import itertools as it
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+from .io_utils import map_file
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_map_chunksize(items: int, workers: int) -> int:
+    """
+    Items handed to a worker at a time by `executor.map`: a few at a time, but
+    still enough batches to keep all the workers busy.
+    """
+    return max(1, items // (workers * 4))
+
+
+def map_in_window(
+    executor: Executor,
+    func: Callable[..., R],
+    items: Iterable[T],
+    *args: Any,
+    window: int,
+) -> Iterator[R]:
+    """
+    `func(item, *args)` of every item in order, like `executor.map`, but with at
+    most `window` items submitted ahead of the results taken.
+
+    Unlike `executor.map`, `items` is consumed only as fast as the results are,
+    so that a stream too large for memory can be handed out in chunks.
+    """
+    pending: deque[Future[R]] = deque()
+    for item in items:
+        if len(pending) == window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, item, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _call_on_file_chunk(
+    func: Callable[..., R], filename: Path, start: int, stop: int, *args: Any
+) -> R:
+    # workers map the file themselves, only the offsets of the chunk get sent over
+    with map_file(filename) as mapped:
+        return func(memoryview(mapped)[start:stop], *args)
+
+
+def map_file_chunks(
+    func: Callable[..., R],
+    filename: Path,
+    bounds: Sequence[tuple[int, int]],
+    *args: Any,
+    workers: int,
+) -> Iterable[R]:
+    """
+    `func(chunk, *args)` of the chunks of the file between the `(start, stop)`
+    offsets of `bounds`, in order, spread over `workers` processes.
+    """
+    if workers == 1 or len(bounds) <= 1:
+        return (
+            _call_on_file_chunk(func, filename, start, stop, *args)
+            for start, stop in bounds
+        )
+    starts, stops = zip(*bounds)
+    workers = min(workers, len(bounds))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _call_on_file_chunk,
+                it.repeat(func),
+                it.repeat(filename),
+                starts,
+                stops,
+                *(it.repeat(arg) for arg in args),
+                chunksize=get_map_chunksize(len(bounds), workers),
+            )
+        )
+
+
+def map_stream_chunks(
+    func: Callable[..., R],
+    chunks: Iterable[bytes | memoryview],
+    *args: Any,
+    workers: int,
+) -> Iterator[R]:
+    """
+    `func(chunk, *args)` of the chunks of a stream, in order, spread over
+    `workers` processes. The stream cannot be read again by the workers, so they
+    get sent the chunks, read only as fast as they take them.
+    """
+    if workers == 1:
+        yield from (func(chunk, *args) for chunk in chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from map_in_window(
+            executor, func, map(bytes, chunks), *args, window=2 * workers
+        )
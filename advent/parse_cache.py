@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "advent-of-code-2022"
+DEFAULT_CACHE_SIZE = 256 * 2**20
+
+
+def get_cache_dir() -> Path:
+    return Path(os.environ.get("ADVENT_CACHE_DIR", DEFAULT_CACHE_DIR)) / "parsed"
+
+
+def get_cache_size() -> int:
+    return int(os.environ.get("ADVENT_PARSE_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+
+
+def hash_file(filename: Path) -> str:
+    digest = hashlib.sha256()
+    with filename.open("rb") as f:
+        while chunk := f.read(2**20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    Parsed inputs keyed by the content of the input file and the parser version.
+
+    NumPy arrays (and tuples of them) are stored as `.npy`/`.npz` files, anything
+    else is pickled. Least recently used entries are evicted once the directory
+    grows beyond `max_size` bytes.
+    """
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+    def get_key(
+        self,
+        func: Callable[..., Any],
+        version: int,
+        filename: Path,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        digest = hashlib.sha256()
+        digest.update(hash_file(filename).encode())
+        digest.update(f"{func.__module__}.{func.__qualname__}:{version}".encode())
+        digest.update(repr((args, sorted(kwargs.items()))).encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        for path in self.directory.glob(f"{key}.*"):
+            try:
+                value = self._read(path)
+            except FileNotFoundError:
+                # evicted by another process since the lookup
+                continue
+            except Exception:
+                # e.g. pickled by a module run as __main__
+                logger.warning("Dropping unreadable cache entry %s", path.name)
+                path.unlink(missing_ok=True)
+                continue
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                # just evicted by another process, the value is still good
+                pass
+            return True, value
+        return False, None
+
+    def store(self, key: str, value: Any, *, lazy: bool = False) -> None:
+        """Store `value`, `lazy` values are loaded back as iterators."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        format = "iter.pickle" if lazy else self._get_format(value)
+        path = self.directory / f"{key}.{format}"
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        self._write(tmp_path, format, value)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self.directory.iterdir():
+            if entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # evicted by another process sharing the directory
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+
+    @staticmethod
+    def _get_format(value: Any) -> str:
+        # numpy is only around if some parser already imported it
+        np = sys.modules.get("numpy")
+        if np is not None:
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                return "npy"
+            if (
+                isinstance(value, tuple)
+                and value
+                and all(
+                    isinstance(item, np.ndarray) and item.dtype != object
+                    for item in value
+                )
+            ):
+                return "npz"
+        return "pickle"
+
+    @staticmethod
+    def _write(path: Path, format: str, value: Any) -> None:
+        with path.open("wb") as f:
+            match format:
+                case "npy":
+                    sys.modules["numpy"].save(f, value)
+                case "npz":
+                    sys.modules["numpy"].savez(f, *value)
+                case _:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read(path: Path) -> Any:
+        if path.suffix in {".npy", ".npz"}:
+            import numpy as np
+
+            if path.suffix == ".npy":
+                return np.load(path)
+            with np.load(path) as arrays:
+                return tuple(arrays[f"arr_{idx}"] for idx in range(len(arrays)))
+        with path.open("rb") as f:
+            value = pickle.load(f)
+        if path.name.endswith(".iter.pickle"):
+            return iter(value)
+        return value
+
+
+def get_cache() -> ParseCache:
+    return ParseCache(get_cache_dir(), get_cache_size())
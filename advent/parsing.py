@@ -0,0 +1,144 @@
+import contextlib
+import functools
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, ParamSpec, TypeVar, cast, overload
+
+from .io_utils import STDIN
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class ParseStats:
+    calls: int = 0
+    duration: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.duration = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+stats = ParseStats()
+_depth = 0
+
+# How the parse time of lazy parsers (returning iterators) is accounted for:
+# `stream` leaves them alone, their time ends up in the solve phase, `timed` counts
+# the time spent in the iterator while the solver consumes it and `drain` reads
+# them whole within the parse phase (so that it is timed in isolation).
+LAZY_MODES = ("stream", "timed", "drain")
+_lazy_mode = "stream"
+
+
+@contextlib.contextmanager
+def lazy_parses(mode: str) -> Iterator[None]:
+    """Account for lazy parses in the given mode (see `LAZY_MODES`) meanwhile."""
+    global _lazy_mode
+    assert mode in LAZY_MODES, mode
+    previous, _lazy_mode = _lazy_mode, mode
+    try:
+        yield
+    finally:
+        _lazy_mode = previous
+
+
+def _time_lazily(items: Iterator[T]) -> Iterator[T]:
+    global _depth
+    while True:
+        # parsers called by the iterator are part of its time already
+        _depth += 1
+        start = time.perf_counter()
+        try:
+            item = next(items)
+        except StopIteration:
+            return
+        finally:
+            _depth -= 1
+            stats.duration += time.perf_counter() - start
+        yield item
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("ADVENT_PARSE_CACHE", "") not in {"", "0"}
+
+
+def _call(func: Callable[P, T], version: int, *args: P.args, **kwargs: P.kwargs) -> T:
+    if not (cache_enabled() and args and isinstance(args[0], Path)):
+        return func(*args, **kwargs)
+    if args[0] == STDIN:
+        # the standard input can only be read once, so it cannot be hashed
+        return func(*args, **kwargs)
+    # only runs that use the cache pay for importing it
+    from .parse_cache import get_cache
+
+    cache = get_cache()
+    key = cache.get_key(func, version, args[0], args[1:], kwargs)
+    hit, value = cache.load(key)
+    if hit:
+        stats.cache_hits += 1
+        return cast(T, value)
+    stats.cache_misses += 1
+    result = func(*args, **kwargs)
+    if isinstance(result, Iterator):
+        items = list(result)
+        cache.store(key, items, lazy=True)
+        return cast(T, iter(items))
+    cache.store(key, result)
+    return result
+
+
+@overload
+def parser(func: Callable[P, T], /) -> Callable[P, T]:
+    ...
+
+
+@overload
+def parser(*, version: int = 1) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    ...
+
+
+def parser(
+    func: Callable[P, T] | None = None, /, *, version: int = 1
+) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Mark `func` as the parse phase of a solver.
+
+    Time spent in (outermost) parsers is accumulated in `stats`, so that the time
+    of a solver run can be split into parsing and solving. Lazy parsers keep
+    streaming, unless `lazy_parses` asks for their time to be accounted for.
+
+    Parsers of input files (with a `Path` as their first argument) can be cached
+    on disk by setting `ADVENT_PARSE_CACHE=1`. Bump `version` whenever the parsed
+    structure changes.
+    """
+    if func is None:
+        return functools.partial(parser, version=version)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        global _depth
+        assert func is not None
+        if _depth:
+            return func(*args, **kwargs)
+        _depth += 1
+        start = time.perf_counter()
+        try:
+            result = _call(func, version, *args, **kwargs)
+            if isinstance(result, Iterator) and _lazy_mode == "drain":
+                result = cast(T, iter(list(result)))
+            elif isinstance(result, Iterator) and _lazy_mode == "timed":
+                result = cast(T, _time_lazily(result))
+            return result
+        finally:
+            _depth -= 1
+            stats.calls += 1
+            stats.duration += time.perf_counter() - start
+
+    return wrapper
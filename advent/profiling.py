@@ -0,0 +1,185 @@
+import bisect
+import collections
+import cProfile
+import pstats
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable, NamedTuple, TextIO, TypeVar
+
+T = TypeVar("T")
+
+# Sampling interval of the call stacks, in seconds. The sampling thread cannot
+# run more often than the interpreter switches threads anyway.
+SAMPLE_INTERVAL = 0.005
+
+package_root = Path(__file__).parent.parent
+
+
+class FunctionStats(NamedTuple):
+    name: str
+    calls: int
+    cumulative: float
+    own: float
+    blocks: int
+    size: int
+
+
+def describe_location(filename: str, lineno: int, name: str) -> str:
+    path = Path(filename)
+    if path.is_relative_to(package_root):
+        filename = str(path.relative_to(package_root))
+    elif path.is_absolute():
+        filename = path.name
+    if filename == "~":
+        # built-in functions
+        return name
+    return f"{filename}:{lineno}({name})"
+
+
+def describe_code(code: CodeType) -> str:
+    # qualified names of code objects are new in Python 3.11
+    name = getattr(code, "co_qualname", code.co_name)
+    return describe_location(code.co_filename, code.co_firstlineno, name)
+
+
+class StackSampler(threading.Thread):
+    """Counts the call stacks of a thread, from `root` down, at regular intervals."""
+
+    def __init__(self, thread_id: int, root: CodeType) -> None:
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.stacks: collections.Counter[str] = collections.Counter()
+        self.stopped = threading.Event()
+
+    def sample(self, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None:
+            stack.append(describe_code(frame.f_code))
+            if frame.f_code is self.root:
+                self.stacks[";".join(reversed(stack))] += 1
+                return
+            frame = frame.f_back
+
+    def run(self) -> None:
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            self.sample(sys._current_frames().get(self.thread_id))
+
+
+class Profiler:
+    """
+    Profiles a single call of a function.
+
+    Call counts and times come from `cProfile` and the call stacks from sampling.
+    The memory columns come from `tracemalloc`, which only knows the blocks that
+    are alive: they count the blocks each function allocated during the call and
+    that were still alive at its end, not every allocation the function made.
+    """
+
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+        # blocks already alive before the call, if tracing was on already
+        self.before: tracemalloc.Snapshot | None = None
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.peak = 0
+        self.stacks: collections.Counter[str] = collections.Counter()
+
+    def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        sampler = StackSampler(threading.get_ident(), getattr(func, "__code__"))
+        sampler.start()
+        # leave the tracing of an enclosing `--memory` report running
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            self.before = tracemalloc.take_snapshot()
+        else:
+            tracemalloc.start()
+        try:
+            return self.profile.runcall(func, *args, **kwargs)
+        finally:
+            self.snapshot = tracemalloc.take_snapshot()
+            _, self.peak = tracemalloc.get_traced_memory()
+            if not tracing:
+                tracemalloc.stop()
+            sampler.stopped.set()
+            sampler.join()
+            self.stacks = sampler.stacks
+
+    def get_allocations(self) -> dict[tuple[str, int, str], tuple[int, int]]:
+        """
+        Memory blocks allocated during the call and still alive at its end, and
+        their size, per function by their `pstats` key.
+        """
+        assert self.snapshot is not None
+        stats: dict[tuple[str, int, str], Any] = getattr(
+            pstats.Stats(self.profile), "stats"
+        )
+        # a line belongs to the closest function starting above it
+        functions: dict[str, list[tuple[int, str]]] = collections.defaultdict(list)
+        for filename, lineno, name in stats:
+            functions[filename].append((lineno, name))
+        for starts in functions.values():
+            starts.sort()
+        allocations: dict[tuple[str, int, str], tuple[int, int]] = {}
+        if self.before is None:
+            statistics = [
+                (statistic.traceback, statistic.count, statistic.size)
+                for statistic in self.snapshot.statistics("lineno")
+            ]
+        else:
+            statistics = [
+                (statistic.traceback, statistic.count_diff, statistic.size_diff)
+                for statistic in self.snapshot.compare_to(self.before, "lineno")
+                if statistic.count_diff > 0
+            ]
+        for traceback, count, size in statistics:
+            frame = traceback[0]
+            starts = functions.get(frame.filename, [])
+            index = bisect.bisect_right(starts, frame.lineno, key=lambda s: s[0]) - 1
+            if index < 0:
+                continue
+            key = (frame.filename, *starts[index])
+            total_count, total_size = allocations.get(key, (0, 0))
+            allocations[key] = total_count + count, total_size + size
+        return allocations
+
+    def get_stats(self) -> list[FunctionStats]:
+        """Per function statistics, by descending cumulative time."""
+        stats: dict[tuple[str, int, str], Any] = getattr(
+            pstats.Stats(self.profile), "stats"
+        )
+        allocations = self.get_allocations()
+        result = [
+            FunctionStats(
+                describe_location(*key),
+                calls,
+                cumulative,
+                own,
+                *allocations.get(key, (0, 0)),
+            )
+            for key, (_, calls, own, cumulative, _) in stats.items()
+        ]
+        result.sort(key=lambda function: function.cumulative, reverse=True)
+        return result
+
+    def write_table(self, output: TextIO, limit: int = 30) -> None:
+        output.write(
+            f"{'calls':>10} {'cumulative':>11} {'own':>11} {'per call':>11} "
+            f"{'live blocks':>11} {'live KiB':>9}  function\n"
+        )
+        for function in self.get_stats()[:limit]:
+            per_call = function.cumulative / function.calls
+            output.write(
+                f"{function.calls:>10} {function.cumulative:>10.3f}s "
+                f"{function.own:>10.3f}s {per_call * 1e3:>9.3f}ms "
+                f"{function.blocks:>11} {function.size / 1024:>9.1f}  "
+                f"{function.name}\n"
+            )
+        output.write(f"peak traced memory: {self.peak / 2**20:.1f}MiB\n")
+
+    def write_collapsed_stacks(self, output: TextIO) -> None:
+        """Sampled call stacks in the collapsed format read by flamegraph.pl."""
+        for stack, count in sorted(self.stacks.items()):
+            output.write(f"{stack} {count}\n")
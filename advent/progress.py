@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+from types import TracebackType
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Backend of the progress reports: `none`, `log` (rate limited lines) or
+# `tqdm`. Read whenever a loop starts, and inherited by worker processes.
+BACKEND_VARIABLE = "ADVENT_PROGRESS"
+BACKENDS = ("none", "log", "tqdm")
+
+# seconds between two lines of the `log` backend
+LOG_INTERVAL = 5.0
+
+
+def get_backend() -> str:
+    """The configured backend, by default `tqdm` on a terminal and `none` otherwise."""
+    backend = os.environ.get(BACKEND_VARIABLE)
+    if backend is None:
+        return "tqdm" if sys.stderr.isatty() else "none"
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"{BACKEND_VARIABLE} must be one of {', '.join(BACKENDS)}, got {backend!r}"
+        )
+    return backend
+
+
+def set_backend(backend: str) -> None:
+    assert backend in BACKENDS, backend
+    os.environ[BACKEND_VARIABLE] = backend
+
+
+class Progress:
+    """Progress of a loop of `total` steps. This one reports nothing."""
+
+    def __init__(self, total: int | None = None, desc: str | None = None) -> None:
+        self.total = total
+        self.desc = desc
+
+    def update(self, n: int = 1) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class LogProgress(Progress):
+    """Writes the progress to stderr at most every `interval` seconds."""
+
+    def __init__(
+        self,
+        total: int | None = None,
+        desc: str | None = None,
+        interval: float = LOG_INTERVAL,
+    ) -> None:
+        super().__init__(total, desc)
+        self.interval = interval
+        self.count = 0
+        self.start = self.last_report = time.monotonic()
+        # the clock is only read every `check_every` steps
+        self.next_check = 1
+        self.check_every = 1
+
+    def update(self, n: int = 1) -> None:
+        self.count += n
+        if self.count < self.next_check:
+            return
+        now = time.monotonic()
+        elapsed = now - self.last_report
+        if elapsed >= self.interval:
+            self.report(now)
+            self.last_report = now
+        # aim for about ten clock reads per interval
+        rate = self.count / max(now - self.start, 1e-9)
+        self.check_every = max(1, int(rate * self.interval / 10))
+        self.next_check = self.count + self.check_every
+
+    def report(self, now: float) -> None:
+        elapsed = now - self.start
+        rate = self.count / max(elapsed, 1e-9)
+        of_total = "" if self.total is None else f"/{self.total}"
+        sys.stderr.write(
+            f"{self.desc or 'progress'}: {self.count}{of_total} "
+            f"in {elapsed:.1f}s ({rate:.1f}/s)\n"
+        )
+
+    def close(self) -> None:
+        self.report(time.monotonic())
+
+
+class TqdmProgress(Progress):
+    def __init__(self, total: int | None = None, desc: str | None = None) -> None:
+        super().__init__(total, desc)
+        # only runs that show a progress bar pay for importing tqdm
+        import tqdm
+
+        self.bar = tqdm.tqdm(total=total, desc=desc)
+
+    def update(self, n: int = 1) -> None:
+        self.bar.update(n)
+
+    def close(self) -> None:
+        self.bar.close()
+
+
+def progress(total: int | None = None, desc: str | None = None) -> Progress:
+    """A progress report of the configured backend, to be updated by hand."""
+    backend = get_backend()
+    if backend == "tqdm":
+        return TqdmProgress(total, desc)
+    if backend == "log":
+        return LogProgress(total, desc)
+    return Progress(total, desc)
+
+
+def track(
+    iterable: Iterable[T], total: int | None = None, desc: str | None = None
+) -> Iterable[T]:
+    """
+    The items of `iterable`, reporting the progress of iterating over them.
+
+    Without a backend the iterable itself is returned, so the loop costs nothing.
+    """
+    if get_backend() == "none":
+        return iterable
+    if total is None:
+        try:
+            total = len(iterable)  # type: ignore[arg-type]
+        except TypeError:
+            pass
+    return _track(iterable, progress(total, desc))
+
+
+def _track(iterable: Iterable[T], report: Progress) -> Iterator[T]:
+    with report:
+        for item in iterable:
+            yield item
+            report.update()
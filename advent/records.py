@@ -0,0 +1,127 @@
+import datetime
+import importlib.metadata
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from . import parsing
+from .io_utils import STDIN
+from .memory import get_peak_rss
+from .parse_cache import hash_file
+
+T = TypeVar("T")
+
+
+def get_solver_name(solver: Callable[..., Any]) -> str:
+    """Module of the solver, also when it is run with `python -m`."""
+    module_name = solver.__module__
+    if module_name == "__main__":
+        spec = getattr(sys.modules["__main__"], "__spec__", None)
+        if spec is not None:
+            module_name = spec.name
+    return module_name
+
+
+def get_versions() -> dict[str, str | None]:
+    versions: dict[str, str | None] = {"python": platform.python_version()}
+    for package in ("numpy",):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+class RunRecorder:
+    """
+    Appends a JSON line describing every solver run to `path`, for dashboards.
+
+    A record holds the answer (or the error), the SHA-256 of the input file, the
+    parse and solve durations, the peak RSS and the versions and cores the run
+    had. Durations of `instrumented` runs include the instrumentation overhead.
+    """
+
+    def __init__(
+        self, solver: Callable[..., Any], path: Path, *, instrumented: bool = False
+    ) -> None:
+        self.solver_name = get_solver_name(solver)
+        self.path = path
+        self.instrumented = instrumented
+
+    def run(
+        self, func: Callable[..., T], filename: Path, *args: Any, **kwargs: Any
+    ) -> T:
+        answer: T | None = None
+        error: str | None = None
+        parsing.stats.reset()
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        start = time.perf_counter()
+        try:
+            # the time lazy parsers spend while the solver iterates is parse time
+            with parsing.lazy_parses("timed"):
+                answer = func(filename, *args, **kwargs)
+            return answer
+        except Exception as ex:
+            error = f"{type(ex).__name__}: {ex}"
+            raise
+        finally:
+            total = time.perf_counter() - start
+            self.append(
+                self.make_record(
+                    filename=filename,
+                    arguments=kwargs,
+                    answer=None if answer is None else str(answer),
+                    error=error,
+                    started_at=started_at,
+                    total=total,
+                )
+            )
+
+    def make_record(
+        self,
+        *,
+        filename: Path,
+        arguments: dict[str, Any],
+        answer: str | None,
+        error: str | None,
+        started_at: datetime.datetime,
+        total: float,
+    ) -> dict[str, Any]:
+        rss, children_rss = get_peak_rss()
+        # the standard input has been consumed by the solver, it cannot be hashed
+        stream = filename == STDIN
+        return {
+            "solver": self.solver_name,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "input": {
+                "filename": str(filename),
+                "sha256": None if stream else hash_file(filename),
+                "size": None if stream else filename.stat().st_size,
+            },
+            "arguments": arguments,
+            "answer": answer,
+            "error": error,
+            "durations": {
+                "parse": round(parsing.stats.duration, 6),
+                "solve": round(total - parsing.stats.duration, 6),
+                "total": round(total, 6),
+            },
+            "instrumented": self.instrumented,
+            "peak_rss": {"self": rss, "children": children_rss},
+            "versions": get_versions(),
+            "host": {
+                "name": platform.node(),
+                "machine": platform.machine(),
+                "cpu_count": os.cpu_count(),
+            },
+        }
+
+    def append(self, record: dict[str, Any]) -> None:
+        # a single write of a whole line, so that concurrent runs can share a log
+        line = json.dumps(record, default=str) + "\n"
+        with self.path.open("a") as f:
+            f.write(line)
@@ -0,0 +1,222 @@
+import fnmatch
+import importlib
+import os
+import pkgutil
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+import click
+
+from . import __path__ as package_path
+from . import answer_cache, progress
+from .answer_cache import AnswerCache
+from .cli_utils import get_solver
+from .io_utils import STDIN, get_data_dir
+
+# `task_1_vectorized` is a variant of `task_1`, that has to give the same answers
+module_pattern = re.compile(
+    r"^day_(?P<day>\d{2})\.task_(?P<task>\d+)(?:_(?P<variant>[a-z_]+))?$"
+)
+
+# Solvers that take more than the input file need their extra arguments spelled
+# out per data file. Variants are keyed on their own (`""` is the base task), as
+# their parameters may differ from the ones of the base task.
+EXTRA_ARGUMENTS: dict[tuple[int, int, str, str], dict[str, Any]] = {
+    (15, 1, "", "sample.txt"): {"target_y": 10},
+    (15, 1, "", "input.txt"): {"target_y": 2000000},
+    (15, 2, "", "sample.txt"): {"max_x": 20, "max_y": 20},
+    (15, 2, "", "input.txt"): {"max_x": 4000000, "max_y": 4000000},
+    (22, 2, "", "sample.txt"): {"is_input": False},
+    (22, 2, "", "input.txt"): {"is_input": True},
+}
+
+
+class Task(NamedTuple):
+    day: int
+    task: int
+    variant: str = ""
+
+    @property
+    def module_name(self) -> str:
+        suffix = f"_{self.variant}" if self.variant else ""
+        return f"{__package__}.day_{self.day:02d}.task_{self.task}{suffix}"
+
+    def __str__(self) -> str:
+        variant = f" {self.variant}" if self.variant else ""
+        return f"day {self.day:02d} task {self.task}{variant}"
+
+
+class Job(NamedTuple):
+    task: Task
+    filename: Path
+    arguments: dict[str, Any]
+
+
+class Result(NamedTuple):
+    job: Job
+    answer: str | None
+    error: str | None
+    duration: float
+    # whether the answer came from the answer cache
+    cached: bool = False
+
+
+def discover_tasks() -> Iterable[Task]:
+    for package_info in pkgutil.iter_modules(package_path):
+        if not package_info.ispkg:
+            continue
+        day_path = [os.path.join(package_path[0], package_info.name)]
+        for module_info in pkgutil.iter_modules(day_path):
+            match = module_pattern.match(f"{package_info.name}.{module_info.name}")
+            if match is not None:
+                yield Task(
+                    day=int(match["day"]),
+                    task=int(match["task"]),
+                    variant=match["variant"] or "",
+                )
+
+
+def select_tasks(days: Iterable[int], tasks: Iterable[int]) -> list[Task]:
+    """Discovered tasks filtered by day and task number, all of them by default."""
+    days = set(days)
+    tasks = set(tasks)
+    return sorted(
+        task
+        for task in discover_tasks()
+        if (not days or task.day in days) and (not tasks or task.task in tasks)
+    )
+
+
+def get_jobs(tasks: Iterable[Task], data_pattern: str) -> Iterable[Job]:
+    for task in tasks:
+        data_dir = get_data_dir(task.day)
+        for filename in sorted(data_dir.glob("*.txt")):
+            if not fnmatch.fnmatch(filename.name, data_pattern):
+                continue
+            arguments = EXTRA_ARGUMENTS.get(
+                (task.day, task.task, task.variant, filename.name), {}
+            )
+            yield Job(task=task, filename=filename, arguments=arguments)
+
+
+def run_job(job: Job) -> Result:
+    start = time.perf_counter()
+    cache: AnswerCache | None = None
+    try:
+        if answer_cache.cache_enabled() and job.filename != STDIN:
+            cache = answer_cache.get_cache()
+            key = cache.get_key(
+                job.task.day,
+                job.task.task,
+                job.task.module_name,
+                job.filename,
+                job.arguments,
+            )
+            cached_answer = cache.load(key)
+            if cached_answer is not None:
+                return Result(
+                    job=job,
+                    answer=cached_answer,
+                    error=None,
+                    duration=time.perf_counter() - start,
+                    cached=True,
+                )
+        module = importlib.import_module(job.task.module_name)
+        solver = get_solver(module.main)
+        answer = solver(job.filename, **job.arguments)
+        duration = time.perf_counter() - start
+        if cache is not None:
+            cache.store(key, answer, duration)
+    except Exception as ex:
+        return Result(
+            job=job,
+            answer=None,
+            error=f"{type(ex).__name__}: {ex}",
+            duration=time.perf_counter() - start,
+        )
+    else:
+        return Result(job=job, answer=answer, error=None, duration=duration)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def format_result(result: Result) -> str:
+    cached = ", cached" if result.cached else ""
+    header = (
+        f"{result.job.task} {result.job.filename.name} "
+        f"({result.duration:.3f}s{cached})"
+    )
+    if result.error is not None:
+        return f"{header} FAILED {result.error}"
+    assert result.answer is not None
+    if "\n" in result.answer:
+        return f"{header}:\n{result.answer.rstrip()}"
+    return f"{header}: {result.answer}"
+
+
+@click.command()
+@click.option("--day", "-d", "days", type=int, multiple=True, help="Days to run")
+@click.option("--task", "-t", "tasks", type=int, multiple=True, help="Tasks to run")
+@click.option(
+    "--data", default="*.txt", show_default=True, help="Glob for the data files"
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Size of the process pool",
+)
+@click.option(
+    "--parse-cache",
+    is_flag=True,
+    help="Cache parsed inputs on disk, same as setting ADVENT_PARSE_CACHE=1",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Solve again instead of reusing the cached answers of unchanged solvers "
+    "and inputs",
+)
+def main(
+    days: tuple[int, ...],
+    tasks: tuple[int, ...],
+    data: str,
+    workers: int,
+    parse_cache: bool,
+    no_cache: bool,
+) -> None:
+    # nobody watches the progress of the solvers, unless asked for explicitly
+    os.environ.setdefault(progress.BACKEND_VARIABLE, "none")
+    if parse_cache:
+        # inherited by the worker processes
+        os.environ["ADVENT_PARSE_CACHE"] = "1"
+    # see `python -m advent.answer_cache` to inspect or invalidate the answers
+    os.environ["ADVENT_ANSWER_CACHE"] = "0" if no_cache else "1"
+    jobs = list(get_jobs(select_tasks(days, tasks), data))
+    start = time.perf_counter()
+    failures = 0
+    hits = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(run_job, jobs):
+            click.echo(format_result(result))
+            failures += result.error is not None
+            hits += result.cached
+    wall_clock = time.perf_counter() - start
+    click.echo(
+        f"Ran {len(jobs)} jobs ({failures} failed) "
+        f"on {workers} workers in {wall_clock:.3f}s"
+    )
+    if not no_cache and jobs:
+        click.echo(f"Answer cache hits: {hits}/{len(jobs)} ({hits / len(jobs):.0%})")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import heapq
+import itertools as it
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, NamedTuple
+
+from .logs import TRACING
+
+logger = logging.getLogger(__name__)
+
+# Graphs are given by their neighbours of (integer) nodes, weighted by the cost of
+# the edge for the cost-aware searches.
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+Predicate = Callable[[int], bool]
+Heuristic = Callable[[int], int]
+
+
+@dataclass
+class SearchStats:
+    searches: int = 0
+    # nodes that were reached
+    visited: int = 0
+    # nodes whose neighbours were generated
+    expanded: int = 0
+
+    def reset(self) -> None:
+        self.searches = 0
+        self.visited = 0
+        self.expanded = 0
+
+
+stats = SearchStats()
+
+
+class Found(NamedTuple):
+    node: int
+    cost: int
+
+
+class NoPathFound(Exception):
+    pass
+
+
+def _record(name: str, distances: dict[int, int], expanded: int) -> None:
+    stats.searches += 1
+    stats.visited += len(distances)
+    stats.expanded += expanded
+    if TRACING:
+        logger.debug("%s visited %d, expanded %d nodes", name, len(distances), expanded)
+
+
+def _bfs(
+    starts: Iterable[int], neighbours: Neighbours, is_goal: Predicate | None
+) -> tuple[dict[int, int], Found | None]:
+    distances = dict.fromkeys(starts, 0)
+    to_visit = deque(distances)
+    expanded = 0
+    try:
+        if is_goal is not None:
+            for start in distances:
+                if is_goal(start):
+                    return distances, Found(start, 0)
+        while to_visit:
+            node = to_visit.popleft()
+            expanded += 1
+            cost = distances[node] + 1
+            for neighbour in neighbours(node):
+                if neighbour in distances:
+                    continue
+                distances[neighbour] = cost
+                if is_goal is not None and is_goal(neighbour):
+                    return distances, Found(neighbour, cost)
+                to_visit.append(neighbour)
+        return distances, None
+    finally:
+        _record("BFS", distances, expanded)
+
+
+def bfs_distances(starts: Iterable[int], neighbours: Neighbours) -> dict[int, int]:
+    """Number of edges from the closest of `starts` to every reachable node."""
+    distances, _ = _bfs(starts, neighbours, None)
+    return distances
+
+
+def bfs(starts: Iterable[int], neighbours: Neighbours, is_goal: Predicate) -> Found:
+    """The goal closest to any of `starts`, counting edges."""
+    _, found = _bfs(starts, neighbours, is_goal)
+    if found is None:
+        raise NoPathFound()
+    return found
+
+
+def _a_star(
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: Predicate | None,
+    heuristic: Heuristic,
+) -> tuple[dict[int, int], Found | None]:
+    distances = dict.fromkeys(starts, 0)
+    # the counter breaks ties between equal priorities in insertion order
+    counter = it.count()
+    to_visit = [(heuristic(node), next(counter), node) for node in distances]
+    heapq.heapify(to_visit)
+    expanded: set[int] = set()
+    try:
+        while to_visit:
+            _, _, node = heapq.heappop(to_visit)
+            if node in expanded:
+                # a stale entry of a node reached again more cheaply
+                continue
+            cost = distances[node]
+            if is_goal is not None and is_goal(node):
+                return distances, Found(node, cost)
+            expanded.add(node)
+            for neighbour, edge_cost in neighbours(node):
+                new_cost = cost + edge_cost
+                if new_cost < distances.get(neighbour, new_cost + 1):
+                    distances[neighbour] = new_cost
+                    priority = new_cost + heuristic(neighbour)
+                    heapq.heappush(to_visit, (priority, next(counter), neighbour))
+        return distances, None
+    finally:
+        name = "Dijkstra" if heuristic is _no_heuristic else "A*"
+        _record(name, distances, len(expanded))
+
+
+def _no_heuristic(node: int) -> int:
+    return 0
+
+
+def dijkstra_distances(
+    starts: Iterable[int], neighbours: WeightedNeighbours
+) -> dict[int, int]:
+    """Cost of the cheapest path from any of `starts` to every reachable node."""
+    distances, _ = _a_star(starts, neighbours, None, _no_heuristic)
+    return distances
+
+
+def dijkstra(
+    starts: Iterable[int], neighbours: WeightedNeighbours, is_goal: Predicate
+) -> Found:
+    """The goal reached most cheaply from any of `starts`."""
+    return a_star(starts, neighbours, is_goal)
+
+
+def a_star(
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: Predicate,
+    heuristic: Heuristic = _no_heuristic,
+) -> Found:
+    """
+    The goal reached most cheaply from any of `starts`.
+
+    `heuristic` must be consistent: it is 0 at the goals, and it never drops by more
+    than the cost of an edge along it (so it never overestimates the remaining
+    cost either). Nodes are expanded at most once, so with a heuristic that is
+    merely admissible a cheaper path found to an expanded node would be missed.
+    """
+    _, found = _a_star(starts, neighbours, is_goal, heuristic)
+    if found is None:
+        raise NoPathFound()
+    return found
+
+
+def unit_cost(neighbours: Neighbours) -> WeightedNeighbours:
+    """Weigh every edge of an unweighted graph as 1."""
+
+    def weighted(node: int) -> Iterable[tuple[int, int]]:
+        return ((neighbour, 1) for neighbour in neighbours(node))
+
+    return weighted
@@ -0,0 +1,116 @@
+import itertools as it
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from click.testing import CliRunner
+
+from . import answer_cache
+from .answer_cache import AnswerCache, get_solver_version
+from .io_utils import get_data_path
+from .runner import Job, Task, run_job
+
+SAMPLE = get_data_path(1, "sample.txt")
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AnswerCache:
+    return AnswerCache(tmp_path / "answers.sqlite3", max_entries=3)
+
+
+def test_store_and_load(cache: AnswerCache) -> None:
+    key = cache.get_key(1, 1, "advent.day_01.task_1", SAMPLE, {})
+    assert cache.load(key) is None
+    cache.store(key, "24000", 0.5)
+    assert cache.load(key) == "24000"
+    assert cache.load(key) == "24000"
+    other = cache.get_key(1, 1, "advent.day_01.task_1", SAMPLE, {"top": 3})
+    assert cache.load(other) is None
+    assert cache.get_stats() == [(1, 1, 1, 2, 1.0)]
+
+
+def test_least_recently_used_are_evicted(
+    cache: AnswerCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = it.count()
+    monkeypatch.setattr(time, "time", lambda: float(next(clock)))
+    keys = [
+        cache.get_key(1, 1, "advent.day_01.task_1", SAMPLE, {"top": top})
+        for top in range(4)
+    ]
+    for key in keys[:3]:
+        cache.store(key, "answer", 0.1)
+    # the first one is used again, so the second one goes
+    assert cache.load(keys[0]) is not None
+    cache.store(keys[3], "answer", 0.1)
+    assert [cache.load(key) is not None for key in keys] == [True, False, True, True]
+
+
+def test_invalidate(cache: AnswerCache) -> None:
+    for day, task in [(1, 1), (1, 2), (2, 1)]:
+        key = cache.get_key(day, task, "advent.day_01.task_1", SAMPLE, {})
+        cache.store(key, "answer", 0.1)
+    assert cache.invalidate(1, 2) == 1
+    assert cache.invalidate(1) == 1
+    assert cache.invalidate() == 1
+    assert cache.get_stats() == []
+
+
+@pytest.fixture
+def solver_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A solver importing helpers relatively, and a module it does not import."""
+    package = tmp_path / "cached_solvers"
+    (package / "day").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "day" / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("from . import grid\nSIZE = 1\n")
+    (package / "grid.py").write_text("WIDTH = 1\n")
+    (package / "unrelated.py").write_text("")
+    (package / "day" / "task.py").write_text(
+        "from .. import helpers\nfrom ..helpers import SIZE\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    get_solver_version.cache_clear()
+    yield package
+    # finding the specs imports the packages, which must not outlive the test
+    for name in ("cached_solvers", "cached_solvers.day"):
+        sys.modules.pop(name, None)
+    get_solver_version.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "changed, invalidates",
+    [
+        ("day/task.py", True),
+        ("helpers.py", True),
+        # imported by the imported helpers
+        ("grid.py", True),
+        ("unrelated.py", False),
+    ],
+)
+def test_solver_version(solver_package: Path, changed: str, invalidates: bool) -> None:
+    version = get_solver_version("cached_solvers.day.task")
+    with (solver_package / changed).open("a") as f:
+        f.write("# changed\n")
+    get_solver_version.cache_clear()
+    assert (get_solver_version("cached_solvers.day.task") != version) == invalidates
+
+
+def test_run_job_uses_the_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "1")
+    monkeypatch.setenv("ADVENT_CACHE_DIR", str(tmp_path))
+    job = Job(Task(1, 1), SAMPLE, {})
+    first, second = run_job(job), run_job(job)
+    assert (first.answer, first.cached) == ("24000", False)
+    assert (second.answer, second.cached) == ("24000", True)
+    runner = CliRunner()
+    result = runner.invoke(answer_cache.main, ["stats"])
+    assert result.output.startswith("day 01 task 1: 1 answers, 1 hits")
+    result = runner.invoke(answer_cache.main, ["clear", "-d", "2"])
+    assert result.output == "Dropped 0 answers\n"
+    result = runner.invoke(answer_cache.main, ["clear"])
+    assert result.output == "Dropped 1 answers\n"
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from .batch import expand_inputs, main, parse_arguments
+from .io_utils import get_data_path
+from .runner import Task
+
+
+def test_expand_inputs(tmp_path: Path) -> None:
+    for name in ("b.txt", "a.txt", ".hidden", "c.log"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "nested").mkdir()
+    assert expand_inputs([str(tmp_path)]) == [
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+        tmp_path / "c.log",
+    ]
+    assert expand_inputs([str(tmp_path / "*.txt"), "missing.txt"]) == [
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+        Path("missing.txt"),
+    ]
+
+
+def test_parse_arguments() -> None:
+    assert parse_arguments(Task(15, 1), ["target-y=10"]) == {"target_y": 10}
+    with pytest.raises(click.BadParameter):
+        parse_arguments(Task(15, 1), ["target_y"])
+    # options of `wrap_main` are no solver arguments
+    with pytest.raises(click.BadParameter):
+        parse_arguments(Task(15, 1), ["verbose=1"])
+
+
+def test_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    sample = get_data_path(1, "sample.txt")
+    result = CliRunner().invoke(main, ["1", "1", str(sample), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    (record,) = map(json.loads, result.stdout.splitlines())
+    assert record["filename"] == str(sample)
+    assert (record["answer"], record["error"]) == ("24000", None)
+    assert "Solved 1 inputs (0 failed)" in result.stderr
+
+
+def test_batch_failures(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    output = tmp_path / "results.jsonl"
+    result = CliRunner().invoke(
+        main, ["1", "1", str(tmp_path / "missing.txt"), "-j", "1", "-o", str(output)]
+    )
+    assert result.exit_code == 1
+    (record,) = map(json.loads, output.read_text().splitlines())
+    assert record["answer"] is None and record["error"] is not None
+
+
+def test_batch_unknown_task() -> None:
+    result = CliRunner().invoke(main, ["1", "1", "input.txt", "--variant", "nope"])
+    assert result.exit_code == 2
+    assert "There is no day 01 task 1 nope" in result.output
@@ -0,0 +1,113 @@
+import gc
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from .cli_utils import get_solver
+from .day_06.task_1 import find_position, read_text
+from .day_07.task_1 import construct_tree
+from .day_08.task_1 import map_matrix, parse_matrix
+from .day_13 import task_2 as day_13_task_2
+from .generators import write_input
+from .io_utils import get_stripped_lines
+
+# Growth exponents fitted from a handful of sizes are noisy, so every case gets
+# this much slack on top of its complexity class.
+TOLERANCE = 0.35
+
+Prepare = Callable[[Path], Callable[[], object]]
+
+
+def prepare_find_position(filename: Path) -> Callable[[], object]:
+    text = read_text(filename)
+    return lambda: find_position(text, 14)
+
+
+def prepare_process_dir(filename: Path) -> Callable[[], object]:
+    lines = list(get_stripped_lines(filename))
+    return lambda: construct_tree(lines)
+
+
+def prepare_map_matrix(filename: Path) -> Callable[[], object]:
+    matrix = parse_matrix(filename)
+    return lambda: map_matrix(
+        matrix,
+        lambda directions, current_height: any(
+            (direction < current_height).all() for direction in directions
+        ),
+    )
+
+
+def prepare_sort_packets(filename: Path) -> Callable[[], object]:
+    # the whole solver, as it is the sorting that dominates
+    return lambda: get_solver(day_13_task_2.main)(filename)
+
+
+# day, generated sizes, how many elements a size stands for, the expected growth
+# exponent in the number of elements and the callable to time
+TEST_CASES: list[tuple[int, list[int], Callable[[int], int], float, Prepare]] = [
+    # linear in the length of the datastream
+    (
+        6,
+        [25_000, 50_000, 100_000, 200_000],
+        lambda size: size,
+        1,
+        prepare_find_position,
+    ),
+    # linear in the number of directories
+    (7, [2_000, 4_000, 8_000, 16_000], lambda size: size, 1, prepare_process_dir),
+    # at most quadratic in the number of trees of the `size` x `size` grid
+    (8, [16, 24, 32, 48, 64], lambda size: size**2, 2, prepare_map_matrix),
+    # near-linear (n log n) in the number of packets
+    (13, [250, 500, 1_000, 2_000], lambda size: size, 1, prepare_sort_packets),
+]
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> float:
+    durations = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(durations)
+
+
+def fit_exponent(sizes: list[int], durations: list[float]) -> float:
+    """Slope of the log-log fit of `durations ~ sizes ** exponent`."""
+    exponent, _ = np.polyfit(np.log(sizes), np.log(durations), 1)
+    return float(exponent)
+
+
+def test_fit_exponent() -> None:
+    sizes = [10, 20, 40, 80]
+    assert fit_exponent(sizes, [size**2 * 0.1 for size in sizes]) == pytest.approx(2)
+    assert fit_exponent(sizes, [size * 3.0 for size in sizes]) == pytest.approx(1)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "day, sizes, elements, expected_exponent, prepare",
+    TEST_CASES,
+    ids=[f"day_{case[0]:02d}" for case in TEST_CASES],
+)
+def test_growth(
+    tmp_path: Path,
+    day: int,
+    sizes: list[int],
+    elements: Callable[[int], int],
+    expected_exponent: float,
+    prepare: Prepare,
+) -> None:
+    durations = [measure(prepare(write_input(day, size, tmp_path))) for size in sizes]
+    exponent = fit_exponent([elements(size) for size in sizes], durations)
+    assert exponent <= expected_exponent + TOLERANCE, (
+        f"grows as n^{exponent:.2f}, expected at most n^{expected_exponent}",
+        dict(zip(sizes, durations)),
+    )
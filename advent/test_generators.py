@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from . import benchmark, generators
+from .benchmark import get_generated_jobs
+from .generators import SIZE_LIMITS, generate, write_input
+from .runner import Task, discover_tasks, run_job
+
+# sizes the solvers are quick at, tiny jet patterns take the day 17 one ages
+SOLVER_SIZES = {17: 40, 19: 1}
+# takes a minute even for a single blueprint, and parses like task 1
+SLOW_TASKS = {Task(19, 2)}
+TASKS = sorted(
+    task for task in discover_tasks() if not task.variant and task not in SLOW_TASKS
+)
+
+
+@pytest.mark.parametrize("day", sorted(SIZE_LIMITS))
+def test_size_limits(day: int) -> None:
+    low, high = SIZE_LIMITS[day]
+    runner = CliRunner()
+    result = runner.invoke(generators.main, [str(day), str(low - 1)])
+    assert result.exit_code == 2
+    assert "Invalid value for" in result.output
+    for size in (low, high):
+        if size is not None:
+            assert generate(day, size)
+    if high is not None:
+        result = runner.invoke(generators.main, [str(day), str(high + 1)])
+        assert result.exit_code == 2
+
+
+def test_generate_cli() -> None:
+    result = CliRunner().invoke(generators.main, ["2", "3", "--seed", "1"])
+    assert result.exit_code == 0
+    assert result.output == generate(2, 3, seed=1)
+
+
+def test_write_input(tmp_path: Path) -> None:
+    path = write_input(2, 3, tmp_path, seed=1)
+    assert path.read_text() == generate(2, 3, seed=1)
+    # nothing left aside
+    assert list(path.parent.iterdir()) == [path]
+    assert write_input(2, 3, tmp_path, seed=1) == path
+
+
+def test_benchmark_rejects_sizes() -> None:
+    result = CliRunner().invoke(benchmark.main, ["-d", "12", "-g", "5"])
+    assert result.exit_code == 2
+    assert "Invalid value for --generate: day 12" in result.output
+
+
+@pytest.mark.parametrize("task", TASKS, ids=map(str, TASKS))
+def test_solvers_read_generated_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, task: Task
+) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    size = SOLVER_SIZES.get(task.day, max(SIZE_LIMITS.get(task.day, (1, None))[0], 5))
+    (job,) = get_generated_jobs([task], [size], 0, tmp_path)
+    result = run_job(job)
+    assert result.error is None
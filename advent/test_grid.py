@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from .grid import (
+    ALL_DIRECTIONS,
+    EAST,
+    NORTH,
+    NORTH_WEST,
+    ORTHOGONAL,
+    SOUTH,
+    SOUTH_EAST,
+    WEST,
+    Grid,
+    neighbour_mask,
+    shift,
+)
+
+CELLS = np.arange(1, 13, dtype=np.int64).reshape(3, 4)
+
+
+@pytest.mark.parametrize("border", [1, 2])
+def test_border(border: int) -> None:
+    grid = Grid(CELLS, border=border, fill=-1)
+    assert grid.padded.shape == (3 + 2 * border, 4 + 2 * border)
+    assert grid.size == grid.padded.size
+    assert np.array_equal(grid.cells, CELLS)
+    assert (grid.flat[~grid.inside] == -1).all()
+    assert np.array_equal(np.sort(grid.flat[grid.inside]), CELLS.reshape(-1))
+
+
+@pytest.mark.parametrize("border", [1, 2])
+def test_indexing(border: int) -> None:
+    grid = Grid(CELLS, border=border)
+    for y, x in np.ndindex(CELLS.shape):
+        index = grid.index(y, x)
+        assert grid.flat[index] == CELLS[y, x]
+        assert grid.position(index) == (y, x)
+        assert grid.inside[index]
+    mask = CELLS % 5 == 0
+    assert grid.flat[grid.indices(mask)].tolist() == [5, 10]
+
+
+def test_neighbours() -> None:
+    grid = Grid(CELLS, fill=0)
+    corner = grid.index(0, 0)
+    neighbours = [grid.flat[corner + offset] for offset in grid.offsets(ALL_DIRECTIONS)]
+    # north west, north, north east, west, east, south west, south, south east
+    assert neighbours == [0, 0, 0, 0, 2, 0, 5, 6]
+    index = grid.index(1, 2)
+    neighbours = [grid.flat[index + offset] for offset in grid.offsets(ORTHOGONAL)]
+    # north, south, west, east
+    assert neighbours == [3, 11, 6, 8]
+    assert grid.offset(SOUTH_EAST) == grid.stride + 1
+    assert grid.manhattan_distance(grid.index(0, 0), grid.index(2, 3)) == 5
+
+
+def test_offsets_must_fit_in_the_border() -> None:
+    grid = Grid(CELLS, border=1)
+    with pytest.raises(AssertionError):
+        grid.offsets(((2, 0),))
+
+
+def test_full() -> None:
+    grid = Grid(CELLS)
+    costs = grid.full(np.inf, dtype=np.float64)
+    assert costs.shape == grid.flat.shape and (costs == np.inf).all()
+    assert grid.full(0).dtype == grid.flat.dtype
+
+
+def test_shift() -> None:
+    assert shift(CELLS, EAST)[:, 0].tolist() == [0, 0, 0]
+    assert shift(CELLS, EAST)[:, 1].tolist() == [1, 5, 9]
+    assert shift(CELLS, SOUTH, fill=-1)[0].tolist() == [-1] * 4
+    assert np.array_equal(shift(CELLS, NORTH_WEST)[:2, :3], CELLS[1:, 1:])
+
+
+def test_neighbour_mask() -> None:
+    # the neighbour to the west of every cell
+    assert neighbour_mask(CELLS, WEST)[0].tolist() == [0, 1, 2, 3]
+    assert neighbour_mask(CELLS, NORTH)[1].tolist() == [1, 2, 3, 4]
@@ -0,0 +1,51 @@
+from click.testing import CliRunner
+
+from .importtime import Report, get_dependencies, main, measure, parse_imports
+from .runner import Task
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:        10 |         10 |     org.python.core
+import time:       100 |        110 |   copy
+import time:        50 |        160 | dataclasses
+import time:         5 |          5 | advent
+import time:        20 |         20 |     numpy.core
+import time:       300 |        320 |   numpy
+import time:        40 |         40 |   advent.io_utils
+import time:        25 |        385 | advent.day_01.task_1
+"""
+
+
+def test_parse_imports() -> None:
+    entries = parse_imports(OUTPUT)
+    assert [entry.name for entry in entries] == [
+        "dataclasses",
+        "advent",
+        "advent.day_01.task_1",
+    ]
+    task = entries[-1]
+    assert task.cumulative == 385
+    assert [child.name for child in task.children] == ["numpy", "advent.io_utils"]
+    assert task.children[0].children[0].name == "numpy.core"
+
+
+def test_get_dependencies() -> None:
+    task = parse_imports(OUTPUT)[-1]
+    assert [entry.name for entry in get_dependencies(task)] == ["numpy"]
+
+
+def test_measure() -> None:
+    report = measure(Task(1, 1))
+    assert isinstance(report, Report)
+    assert report.total > 0
+    assert "click" in report.dependencies
+
+
+def test_limit() -> None:
+    runner = CliRunner()
+    result = runner.invoke(main, ["-d", "1", "-t", "1", "-r", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("day 01 task 1:")
+    result = runner.invoke(main, ["-d", "1", "-t", "1", "-r", "1", "--limit", "0"])
+    assert result.exit_code == 1
+    assert "entry points import too slowly" in result.output
@@ -0,0 +1,213 @@
+import io
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .io_utils import (
+    PARSE_BLOCK_SIZE,
+    STDIN,
+    get_stripped_lines,
+    is_stream,
+    iter_chunk_bounds,
+    iter_chunks,
+    iter_line_group_bounds,
+    iter_line_group_chunks,
+    iter_line_slices,
+    map_file,
+    normalize_line_breaks,
+    parse_ints,
+    read_char_grid,
+    read_ints,
+)
+
+
+def write(tmp_path: Path, data: bytes) -> Path:
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(data)
+    return filename
+
+
+@pytest.mark.parametrize(
+    "data, lines",
+    [
+        (b"1000\n2000\n\n3000\n", ["1000", "2000", "", "3000"]),
+        (b"1000\r\n2000\r\n\r\n3000\r\n", ["1000", "2000", "", "3000"]),
+        (b"1000\n2000", ["1000", "2000"]),
+        (b"1000\r\n2000\r", ["1000", "2000"]),
+        (b"\n", [""]),
+        (b"", []),
+    ],
+)
+def test_stripped_lines(tmp_path: Path, data: bytes, lines: list[str]) -> None:
+    filename = write(tmp_path, data)
+    assert list(get_stripped_lines(filename)) == lines
+    assert [bytes(line).decode() for line in iter_line_slices(filename)] == lines
+
+
+@pytest.mark.parametrize(
+    "data, normalized",
+    [
+        (b"A Y\r\nB X\r\n", b"A Y\nB X\n"),
+        (b"\r\nA Y\r\nB X\r", b"\nA Y\nB X"),
+        (b"A Y\nB X\n", b"A Y\nB X\n"),
+        (b"x" * 1000 + b"\r\n", b"x" * 1000 + b"\n"),
+        (b"A Y", b"A Y"),
+        (b"", b""),
+    ],
+)
+def test_normalize_line_breaks(data: bytes, normalized: bytes) -> None:
+    assert normalize_line_breaks(data) == normalized
+    assert bytes(normalize_line_breaks(memoryview(data))) == normalized
+    # unchanged data is not copied
+    if data == normalized:
+        assert normalize_line_breaks(data) is data
+
+
+@pytest.mark.parametrize("delimiter", [b"\n", b"\n\n"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 10_000])
+def test_chunk_bounds(delimiter: bytes, chunk_size: int) -> None:
+    rng = random.Random(chunk_size)
+    data = b"".join(
+        rng.choice([b"1", b"22", b"333\n", b"\n", b"4444\n\n"]) for _ in range(200)
+    )
+    bounds = list(iter_chunk_bounds(data, chunk_size, delimiter))
+    assert [start for start, _ in bounds] == [0] + [stop for _, stop in bounds[:-1]]
+    assert bounds[-1][1] == len(data)
+    for start, stop in bounds[:-1]:
+        assert data[start:stop].endswith(delimiter)
+        # chunks only outgrow the chunk size to hold a whole record
+        assert stop - start <= chunk_size or delimiter not in data[start:stop][:-1]
+
+
+def test_chunk_bounds_without_delimiter() -> None:
+    assert list(iter_chunk_bounds(b"123", 1)) == [(0, 3)]
+    assert list(iter_chunk_bounds(b"", 1)) == []
+
+
+@pytest.mark.parametrize("lines_per_group", [1, 3])
+@pytest.mark.parametrize("chunk_size", [1, 7, 100])
+def test_line_group_bounds(lines_per_group: int, chunk_size: int) -> None:
+    data = b"".join(b"x" * (idx % 5 + 1) + b"\n" for idx in range(30))
+    bounds = list(iter_line_group_bounds(data, lines_per_group, chunk_size))
+    assert b"".join(data[start:stop] for start, stop in bounds) == data
+    for start, stop in bounds:
+        assert data[start:stop].count(b"\n") % lines_per_group == 0
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 100])
+def test_line_group_chunks(tmp_path: Path, suffix: str, chunk_size: int) -> None:
+    data = b"".join(b"x" * (idx % 5 + 1) + b"\n" for idx in range(30))
+    filename = write(tmp_path, data)
+    if suffix:
+        filename = compress(filename, suffix)
+    chunks = list(map(bytes, iter_line_group_chunks(filename, 3, chunk_size)))
+    assert b"".join(chunks) == data
+    assert all(chunk.count(b"\n") % 3 == 0 for chunk in chunks)
+
+
+def test_chunks(tmp_path: Path) -> None:
+    data = b"".join(b"%d\n" % idx for idx in range(1000))
+    chunks = list(iter_chunks(write(tmp_path, data), 100))
+    assert len(chunks) > 1
+    assert all(bytes(chunk).endswith(b"\n") for chunk in chunks)
+    assert b"".join(chunks) == data
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+def test_chunks_of_windows_records(tmp_path: Path, suffix: str) -> None:
+    data = b"".join(b"%d\r\n%d\r\n\r\n" % (idx, idx) for idx in range(300))
+    filename = write(tmp_path, data)
+    if suffix:
+        filename = compress(filename, suffix)
+    chunks = list(map(bytes, iter_chunks(filename, 100, b"\n\n")))
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\r\n\r\n") for chunk in chunks)
+    assert b"".join(chunks) == data
+
+
+@pytest.mark.parametrize(
+    "data, signed, values",
+    [
+        (b"2-4,6-8\n", False, [2, 4, 6, 8]),
+        (b"x=-3, y=12\n", True, [-3, 12]),
+        (b"x=-3, y=12\n", False, [3, 12]),
+        (b"-", True, []),
+        (b"", False, []),
+        (b"007 123456789012345678", False, [7, 123456789012345678]),
+    ],
+)
+def test_parse_ints(data: bytes, signed: bool, values: list[int]) -> None:
+    assert parse_ints(data, signed=signed).tolist() == values
+
+
+def test_parse_ints_overflow() -> None:
+    with pytest.raises(AssertionError):
+        parse_ints(b"1234567890123456789")
+
+
+def test_read_ints_across_blocks(tmp_path: Path) -> None:
+    rng = random.Random(0)
+    values = [
+        rng.randint(-(10**12), 10**12) for _ in range(4 * PARSE_BLOCK_SIZE // 10)
+    ]
+    data = "".join(f"{a},{b}\n" for a, b in zip(values[::2], values[1::2]))
+    filename = write(tmp_path, data.encode())
+    read = read_ints(filename, per_line=2, signed=True)
+    assert read.tolist() == [list(pair) for pair in zip(values[::2], values[1::2])]
+
+
+@pytest.mark.parametrize(
+    "data", [b"ab\ncd\n", b"ab\r\ncd\r\n", b"ab\r\ncd\r", b"ab\ncd"]
+)
+def test_char_grid(tmp_path: Path, data: bytes) -> None:
+    grid = read_char_grid(write(tmp_path, data))
+    assert np.array_equal(grid, np.frombuffer(b"abcd", dtype=np.uint8).reshape(2, 2))
+
+
+def test_char_grid_of_unequal_lines(tmp_path: Path) -> None:
+    with pytest.raises(AssertionError):
+        read_char_grid(write(tmp_path, b"ab\ncde\n"))
+
+
+def compress(filename: Path, suffix: str) -> Path:
+    data = filename.read_bytes()
+    compressed = filename.with_name(filename.name + suffix)
+    if suffix == ".gz":
+        import gzip
+
+        compressed.write_bytes(gzip.compress(data))
+    elif suffix == ".xz":
+        import lzma
+
+        compressed.write_bytes(lzma.compress(data))
+    else:
+        zstandard = pytest.importorskip("zstandard")
+        compressed.write_bytes(zstandard.ZstdCompressor().compress(data))
+    return compressed
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".zst"])
+def test_compressed_inputs(tmp_path: Path, suffix: str) -> None:
+    data = b"".join(b"%d\r\n" % idx for idx in range(1000))
+    filename = compress(write(tmp_path, data), suffix)
+    assert is_stream(filename)
+    with map_file(filename) as mapped:
+        assert mapped == data
+    chunks = list(iter_chunks(filename, 100))
+    assert len(chunks) > 1 and b"".join(chunks) == data
+    assert list(get_stripped_lines(filename)) == [str(idx) for idx in range(1000)]
+    assert read_ints(filename).tolist() == list(range(1000))
+
+
+def test_standard_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = b"".join(b"%d\n" % idx for idx in range(1000))
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert is_stream(STDIN)
+    chunks = list(iter_chunks(STDIN, 100))
+    assert len(chunks) > 1 and b"".join(chunks) == data
+    # the standard input can only be read once
+    assert list(get_stripped_lines(STDIN)) == []
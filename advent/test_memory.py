@@ -0,0 +1,44 @@
+import io
+import os
+import time
+
+from . import memory
+from .memory import CacheSize, MemoryReport, record_cache
+
+
+def hold_blocks() -> int:
+    blocks = [bytearray(1024) for _ in range(10_000)]
+    # long enough to be sampled, but freed before the report is collected
+    time.sleep(20 * memory.SAMPLE_INTERVAL)
+    return len(blocks)
+
+
+def test_allocations_are_sampled_while_running() -> None:
+    with MemoryReport(top=1) as report:
+        hold_blocks()
+    assert report.peak_traced > 10_000 * 1024
+    output = io.StringIO()
+    report.write(output)
+    _, heading, top_site = output.getvalue().splitlines()
+    assert heading == "top allocation sites at the fullest sample:"
+    line = hold_blocks.__code__.co_firstlineno + 1
+    assert top_site.endswith(f"blocks  advent/test_memory.py:{line}")
+
+
+def test_cache_sizes() -> None:
+    with MemoryReport() as report:
+        record_cache("small", [1])
+        record_cache("large", list(range(10)))
+        record_cache("large", list(range(100)))
+    assert [cache[:3] for cache in report.caches] == [
+        ("large", 2, 100),
+        ("small", 1, 1),
+    ]
+    assert all(isinstance(cache, CacheSize) for cache in report.caches)
+    assert memory.RECORDS_VARIABLE not in os.environ
+
+
+def test_record_cache_without_report() -> None:
+    # nothing to record to, and no snapshots taken
+    record_cache("unreported", [1, 2, 3])
+    assert memory.RECORDS_VARIABLE not in os.environ
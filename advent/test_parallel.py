@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from .io_utils import iter_chunk_bounds
+from .parallel import (
+    get_map_chunksize,
+    map_file_chunks,
+    map_in_window,
+    map_stream_chunks,
+)
+
+DATA = b"".join(b"%d\n" % idx for idx in range(100))
+
+
+def first_line(chunk: bytes | memoryview, suffix: bytes) -> bytes:
+    return bytes(chunk).split(b"\n", 1)[0] + suffix
+
+
+def test_map_chunksize() -> None:
+    assert get_map_chunksize(1, 4) == 1
+    assert get_map_chunksize(100, 4) == 6
+
+
+def test_map_in_window() -> None:
+    taken = 0
+
+    def items() -> Iterator[int]:
+        nonlocal taken
+        for item in range(20):
+            taken += 1
+            yield item
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = map_in_window(executor, pow, items(), 2, window=3)
+        assert next(results) == 0
+        # the window is full, and one more item was taken to be submitted
+        assert taken == 4
+        assert list(results) == [item**2 for item in range(1, 20)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_file_chunks(tmp_path: Path, workers: int) -> None:
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(DATA)
+    bounds = list(iter_chunk_bounds(DATA, 50))
+    expected = [first_line(DATA[start:stop], b"!") for start, stop in bounds]
+    assert (
+        list(map_file_chunks(first_line, filename, bounds, b"!", workers=workers))
+        == expected
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_stream_chunks(workers: int) -> None:
+    chunks = [
+        memoryview(DATA)[start:stop] for start, stop in iter_chunk_bounds(DATA, 50)
+    ]
+    expected = [first_line(chunk, b"?") for chunk in chunks]
+    assert (
+        list(map_stream_chunks(first_line, iter(chunks), b"?", workers=workers))
+        == expected
+    )
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from .parse_cache import ParseCache
+
+
+def parse(filename: Path) -> str:
+    return filename.read_text()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ParseCache:
+    return ParseCache(tmp_path / "cache", max_size=2**20)
+
+
+@pytest.fixture
+def filename(tmp_path: Path) -> Path:
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n")
+    return path
+
+
+@pytest.mark.parametrize(
+    "value, format",
+    [
+        (np.arange(6).reshape(2, 3), "npy"),
+        ((np.arange(3), np.ones((2, 2), dtype=bool)), "npz"),
+        ({"a": [1, 2], "b": (3,)}, "pickle"),
+        (np.array([[1], [2, 3]], dtype=object), "pickle"),
+    ],
+)
+def test_round_trip(cache: ParseCache, value: Any, format: str) -> None:
+    cache.store("key", value)
+    assert [path.name for path in cache.directory.iterdir()] == [f"key.{format}"]
+    hit, loaded = cache.load("key")
+    assert hit
+    if isinstance(value, tuple):
+        assert all(np.array_equal(a, b) for a, b in zip(loaded, value, strict=True))
+    elif isinstance(value, np.ndarray):
+        assert np.array_equal(loaded, value)
+    else:
+        assert loaded == value
+
+
+def test_lazy_round_trip(cache: ParseCache) -> None:
+    cache.store("key", [1, 2, 3], lazy=True)
+    hit, loaded = cache.load("key")
+    assert hit and not isinstance(loaded, list)
+    assert list(loaded) == [1, 2, 3]
+
+
+def test_miss(cache: ParseCache) -> None:
+    assert cache.load("key") == (False, None)
+
+
+def test_key_invalidation(cache: ParseCache, filename: Path) -> None:
+    key = cache.get_key(parse, 1, filename, (), {})
+    assert cache.get_key(parse, 1, filename, (), {}) == key
+    assert cache.get_key(parse, 2, filename, (), {}) != key
+    assert cache.get_key(parse, 1, filename, (4,), {}) != key
+    assert cache.get_key(parse, 1, filename, (), {"per_line": 4}) != key
+    filename.write_text("1\n3\n")
+    assert cache.get_key(parse, 1, filename, (), {}) != key
+
+
+def test_lru_eviction(cache: ParseCache) -> None:
+    value = np.zeros(1000, dtype=np.uint8)
+    for idx, key in enumerate(["a", "b", "c"]):
+        cache.store(key, value)
+        os.utime(cache.directory / f"{key}.npy", (idx, idx))
+    entry_size = (cache.directory / "a.npy").stat().st_size
+    # loading refreshes an entry, so `b` is the least recently used one now
+    assert cache.load("a")[0]
+    cache.max_size = 3 * entry_size
+    cache.store("d", value)
+    assert sorted(path.stem for path in cache.directory.iterdir()) == ["a", "c", "d"]
+
+
+def test_entries_evicted_by_other_processes(
+    cache: ParseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache.store("key", 42)
+
+    def evicted(*args: Any) -> None:
+        raise FileNotFoundError
+
+    monkeypatch.setattr(os, "utime", evicted)
+    assert cache.load("key") == (True, 42)
+    monkeypatch.setattr(Path, "stat", evicted)
+    cache.evict()
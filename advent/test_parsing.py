@@ -0,0 +1,63 @@
+import time
+from typing import Iterator
+
+import pytest
+
+from . import parsing
+from .parsing import lazy_parses, parser
+
+DELAY = 0.01
+
+
+@parser
+def parse_numbers(count: int) -> Iterator[int]:
+    for number in range(count):
+        time.sleep(DELAY)
+        yield parse_number(number)
+
+
+@parser
+def parse_number(number: int) -> int:
+    return number
+
+
+@pytest.fixture(autouse=True)
+def reset_stats() -> None:
+    parsing.stats.reset()
+
+
+def test_lazy_parsers_keep_streaming() -> None:
+    numbers = parse_numbers(3)
+    assert not isinstance(numbers, type(iter([])))
+    assert next(numbers) == 0
+    # nothing has been parsed before it was asked for
+    assert parsing.stats.duration < DELAY
+
+
+def test_drain() -> None:
+    with lazy_parses("drain"):
+        numbers = parse_numbers(3)
+    assert parsing.stats.duration >= 3 * DELAY
+    assert list(numbers) == [0, 1, 2]
+    assert parsing.stats.calls == 1
+
+
+def test_timed() -> None:
+    with lazy_parses("timed"):
+        numbers = parse_numbers(3)
+        assert parsing.stats.duration < DELAY
+        for number in numbers:
+            # time the solver spends on the items is not parse time
+            time.sleep(DELAY * 5)
+    # the nested parser is part of the outer one, it is not counted twice
+    assert 3 * DELAY <= parsing.stats.duration < 3 * DELAY * 5
+    assert parsing.stats.calls == 1
+
+
+def test_lazy_modes_are_restored() -> None:
+    with pytest.raises(AssertionError):
+        with lazy_parses("eager"):
+            pass
+    with lazy_parses("drain"):
+        pass
+    assert not isinstance(parse_numbers(0), type(iter([])))
@@ -0,0 +1,103 @@
+import io
+import time
+import tracemalloc
+from types import CodeType, SimpleNamespace
+from typing import cast
+
+import pytest
+
+from .profiling import Profiler, describe_code, describe_location, package_root
+
+kept: list[bytes] = []
+
+
+def allocate(count: int) -> int:
+    dropped = []
+    for idx in range(count):
+        kept.append(b"x" * 1000 + bytes([idx % 256]))
+        # freed before the end of the call, so not alive anymore
+        dropped.append(b"y" * 1000 + bytes([idx % 256]))
+    return len(dropped)
+
+
+def solve() -> int:
+    time.sleep(0.05)
+    return sum(allocate(100) for _ in range(3))
+
+
+SOLVE = f"advent/test_profiling.py:{solve.__code__.co_firstlineno}(solve)"
+
+
+@pytest.fixture(autouse=True)
+def clear_kept() -> None:
+    kept.clear()
+
+
+@pytest.mark.parametrize("enclosing_trace", [False, True])
+def test_stats(enclosing_trace: bool) -> None:
+    if enclosing_trace:
+        tracemalloc.start()
+        # blocks alive before the call do not count
+        kept.extend(b"z" * 1000 + bytes([idx]) for idx in range(100))
+    try:
+        profiler = Profiler()
+        assert profiler.run(solve) == 300
+        # an enclosing trace is left running
+        assert tracemalloc.is_tracing() == enclosing_trace
+    finally:
+        if enclosing_trace:
+            tracemalloc.stop()
+    stats = {
+        function.name.rpartition("(")[2]: function for function in profiler.get_stats()
+    }
+    assert stats["solve)"].calls == 1
+    assert stats["allocate)"].calls == 3
+    assert stats["solve)"].cumulative >= 0.05
+    assert 300 <= stats["allocate)"].blocks < 400
+    assert 300_000 <= stats["allocate)"].size < 400_000
+
+
+def test_write_table() -> None:
+    profiler = Profiler()
+    profiler.run(solve)
+    output = io.StringIO()
+    profiler.write_table(output, limit=3)
+    header, *rows, peak = output.getvalue().splitlines()
+    assert header.split() == [
+        "calls", "cumulative", "own", "per", "call", "live", "blocks", "live",
+        "KiB", "function",
+    ]  # fmt: skip
+    assert len(rows) == 3
+    assert rows[0].endswith(SOLVE)
+    assert peak.startswith("peak traced memory: ")
+
+
+def test_collapsed_stacks() -> None:
+    profiler = Profiler()
+    profiler.run(solve)
+    output = io.StringIO()
+    profiler.write_collapsed_stacks(output)
+    lines = output.getvalue().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith(SOLVE)
+        assert int(count) > 0
+
+
+def test_describe_location() -> None:
+    filename = str(package_root / "advent" / "grid.py")
+    assert describe_location(filename, 3, "f") == "advent/grid.py:3(f)"
+    assert describe_location("/usr/lib/python/json.py", 1, "g") == "json.py:1(g)"
+    assert describe_location("~", 0, "<built-in method len>") == "<built-in method len>"
+
+
+def test_describe_code() -> None:
+    code = Profiler.run.__code__
+    line = code.co_firstlineno
+    assert describe_code(code) == f"advent/profiling.py:{line}(Profiler.run)"
+    # code objects of Python 3.10 have no qualified names
+    old_code = SimpleNamespace(
+        co_filename=code.co_filename, co_firstlineno=line, co_name="run"
+    )
+    assert describe_code(cast(CodeType, old_code)) == f"advent/profiling.py:{line}(run)"
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from . import progress
+from .progress import (
+    BACKEND_VARIABLE,
+    LogProgress,
+    Progress,
+    get_backend,
+    set_backend,
+    track,
+)
+
+
+def test_default_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(BACKEND_VARIABLE, raising=False)
+    # pytest captures stderr, which is no terminal then
+    assert get_backend() == "none"
+    monkeypatch.setenv(BACKEND_VARIABLE, "fancy")
+    with pytest.raises(ValueError, match="must be one of none, log, tqdm"):
+        get_backend()
+
+
+def test_none(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # restored by monkeypatch after the test
+    monkeypatch.setenv(BACKEND_VARIABLE, "log")
+    set_backend("none")
+    items = [1, 2, 3]
+    # the loop is left alone
+    assert track(items) is items
+    with progress.progress(3) as report:
+        assert type(report) is Progress
+        report.update()
+    assert capsys.readouterr().err == ""
+
+
+def test_log(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv(BACKEND_VARIABLE, "log")
+    assert list(track(range(5), desc="elves")) == list(range(5))
+    assert capsys.readouterr().err.startswith("elves: 5/5 in ")
+
+
+def test_log_is_rate_limited(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    now = 0.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    report = LogProgress(100, interval=5.0)
+    for _ in range(100):
+        now += 0.1
+        report.update()
+    report.close()
+    # a step every 0.1s, reported once after 5s (give or take the steps between
+    # two reads of the clock) and on closing
+    first, last = capsys.readouterr().err.splitlines()
+    assert 50 <= int(first.split()[1].split("/")[0]) < 60
+    assert last.startswith("progress: 100/100 in 10.0s")
+
+
+def test_tqdm(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    pytest.importorskip("tqdm")
+    monkeypatch.setenv(BACKEND_VARIABLE, "tqdm")
+    assert list(track([1, 2, 3], desc="rocks")) == [1, 2, 3]
+    assert "rocks: 100%" in capsys.readouterr().err
@@ -0,0 +1,70 @@
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from .cli_utils import get_solver
+from .day_01 import task_1
+from .io_utils import STDIN, get_data_path
+from .records import RunRecorder, get_solver_name
+
+
+def read_records(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_records_are_appended(tmp_path: Path) -> None:
+    path = tmp_path / "runs.jsonl"
+    sample = get_data_path(1, "sample.txt")
+    for _ in range(2):
+        result = CliRunner().invoke(task_1.main, [str(sample), "--record", str(path)])
+        assert result.exit_code == 0, result.output
+    records = read_records(path)
+    assert len(records) == 2
+    record = records[0]
+    assert record["solver"] == "advent.day_01.task_1"
+    assert record["input"] == {
+        "filename": str(sample),
+        "sha256": hashlib.sha256(sample.read_bytes()).hexdigest(),
+        "size": sample.stat().st_size,
+    }
+    assert (record["answer"], record["error"]) == ("24000", None)
+    assert record["instrumented"] is False
+    durations = record["durations"]
+    assert isinstance(durations, dict)
+    # the lazy parser is timed while the solver consumes it
+    assert durations["parse"] > 0
+    assert durations["parse"] + durations["solve"] == pytest.approx(
+        durations["total"], abs=1e-5
+    )
+    assert set(record) >= {"started_at", "peak_rss", "versions", "host"}
+
+
+def test_errors_are_recorded(tmp_path: Path) -> None:
+    def fail(filename: Path, *, top: int) -> str:
+        raise ValueError("no elves")
+
+    recorder = RunRecorder(fail, tmp_path / "runs.jsonl", instrumented=True)
+    with pytest.raises(ValueError):
+        recorder.run(fail, get_data_path(1, "sample.txt"), top=3)
+    (record,) = read_records(recorder.path)
+    assert record["solver"] == get_solver_name(fail) == __name__
+    assert (record["answer"], record["error"]) == (None, "ValueError: no elves")
+    assert record["arguments"] == {"top": 3}
+    assert record["instrumented"] is True
+
+
+def test_standard_input(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sample = get_data_path(1, "sample.txt")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(sample.read_bytes())))
+    solver = get_solver(task_1.main)
+    recorder = RunRecorder(solver, tmp_path / "runs.jsonl")
+    assert recorder.run(solver, STDIN) == "24000"
+    (record,) = read_records(recorder.path)
+    # the consumed standard input cannot be hashed
+    assert record["input"] == {"filename": "-", "sha256": None, "size": None}
+    assert record["answer"] == "24000"
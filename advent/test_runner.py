@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from . import runner
+from .cli_utils import get_solver
+from .day_01 import task_2_parallel
+from .day_15 import task_1
+from .io_utils import get_data_path
+from .runner import Job, Task, discover_tasks, get_jobs, run_job
+
+
+def test_discover_variants() -> None:
+    tasks = set(discover_tasks())
+    assert Task(1, 1) in tasks
+    assert Task(1, 2, "parallel") in tasks
+    assert Task(3, 2, "bitmask") in tasks
+    # helper modules of a day are no tasks
+    assert not any(task.variant in {"summary", "strategies"} for task in tasks)
+
+
+def test_task_names() -> None:
+    task = Task(3, 2, "bitmask")
+    assert task.module_name == "advent.day_03.task_2_bitmask"
+    assert str(task) == "day 03 task 2 bitmask"
+    assert Task(3, 2).module_name == "advent.day_03.task_2"
+
+
+def test_get_solver() -> None:
+    solver = get_solver(task_2_parallel.main)
+    assert solver.__name__ == "main"
+    filename = get_data_path(1, "sample.txt")
+    assert solver(filename, top=1, workers=1) == "24000"
+
+
+def test_extra_arguments_per_variant(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(
+        runner.EXTRA_ARGUMENTS, (1, 2, "parallel", "sample.txt"), {"top": 1}
+    )
+    jobs = {
+        job.task: job.arguments
+        for job in get_jobs([Task(1, 2), Task(1, 2, "parallel")], "sample.txt")
+    }
+    assert jobs == {Task(1, 2): {}, Task(1, 2, "parallel"): {"top": 1}}
+
+
+def test_run_job_forwards_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    (job,) = get_jobs([Task(15, 1)], "sample.txt")
+    assert job.arguments == {"target_y": 10}
+    expected = get_solver(task_1.main)(job.filename, target_y=10)
+    result = run_job(job)
+    assert (result.answer, result.error, result.cached) == (expected, None, False)
+
+
+def test_run_job_reports_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    job = Job(Task(15, 1), get_data_path(15, "sample.txt"), {})
+    result = run_job(job)
+    assert result.answer is None
+    assert result.error is not None and result.error.startswith("TypeError")
+
+
+def test_run_job_missing_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADVENT_ANSWER_CACHE", "0")
+    result = run_job(Job(Task(1, 1), Path("missing.txt"), {}))
+    assert result.error is not None
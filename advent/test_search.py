@@ -0,0 +1,94 @@
+from typing import Callable, Iterable
+
+import pytest
+
+from . import search
+from .search import (
+    Found,
+    NoPathFound,
+    a_star,
+    bfs,
+    bfs_distances,
+    dijkstra,
+    dijkstra_distances,
+    unit_cost,
+)
+
+# 0 - 1 - 2 - 3, with a costly shortcut 0 - 3, and 4 - 5 on their own
+EDGES: dict[int, dict[int, int]] = {
+    0: {1: 1, 3: 5},
+    1: {0: 1, 2: 1},
+    2: {1: 1, 3: 1},
+    3: {2: 1, 0: 5},
+    4: {5: 1},
+    5: {4: 1},
+}
+
+
+def neighbours(node: int) -> Iterable[int]:
+    return EDGES[node]
+
+
+def weighted(node: int) -> Iterable[tuple[int, int]]:
+    return EDGES[node].items()
+
+
+@pytest.fixture(autouse=True)
+def reset_stats() -> None:
+    search.stats.reset()
+
+
+def test_bfs() -> None:
+    # the shortcut is a single edge
+    assert bfs([0], neighbours, lambda node: node == 3) == Found(3, 1)
+    assert bfs([1, 3], neighbours, lambda node: node == 3) == Found(3, 0)
+    assert bfs_distances([0], neighbours) == {0: 0, 1: 1, 3: 1, 2: 2}
+    assert search.stats.searches == 3
+
+
+def test_dijkstra() -> None:
+    assert dijkstra([0], weighted, lambda node: node == 3) == Found(3, 3)
+    assert dijkstra_distances([0], weighted) == {0: 0, 1: 1, 2: 2, 3: 3}
+    assert dijkstra_distances([0, 3], weighted) == {0: 0, 1: 1, 2: 1, 3: 0}
+
+
+@pytest.mark.parametrize(
+    "heuristic",
+    [lambda node: 0, lambda node: 3 - node if node < 4 else 0],
+    ids=["zero", "admissible"],
+)
+def test_a_star(heuristic: search.Heuristic) -> None:
+    assert a_star([0], weighted, lambda node: node == 3, heuristic) == Found(3, 3)
+
+
+def test_a_star_expands_less_with_a_heuristic() -> None:
+    line = {node: {node - 1: 1, node + 1: 1} for node in range(-100, 101)}
+
+    def line_neighbours(node: int) -> Iterable[tuple[int, int]]:
+        return line.get(node, {}).items()
+
+    a_star([0], line_neighbours, lambda node: node == 50)
+    expanded_without = search.stats.expanded
+    search.stats.reset()
+    a_star([0], line_neighbours, lambda node: node == 50, lambda node: abs(50 - node))
+    assert search.stats.expanded < expanded_without
+
+
+@pytest.mark.parametrize(
+    "find",
+    [
+        lambda is_goal: bfs([0], neighbours, is_goal),
+        lambda is_goal: dijkstra([0], weighted, is_goal),
+        lambda is_goal: a_star([0], weighted, is_goal, lambda node: 0),
+    ],
+    ids=["bfs", "dijkstra", "a_star"],
+)
+def test_unreachable(find: Callable[[search.Predicate], Found]) -> None:
+    with pytest.raises(NoPathFound):
+        find(lambda node: node == 5)
+    assert search.stats.visited == 4
+
+
+def test_unit_cost() -> None:
+    assert sorted(unit_cost(neighbours)(0)) == [(1, 1), (3, 1)]
+    assert dijkstra([0], unit_cost(neighbours), lambda node: node == 2).cost == 2
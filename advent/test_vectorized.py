@@ -0,0 +1,45 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from .cli_utils import get_solver
+from .generators import write_input
+from .runner import Task, discover_tasks
+
+VARIANTS = sorted(task for task in discover_tasks() if task.variant)
+
+
+def solve(task: Task, filename: Path) -> str:
+    module = importlib.import_module(task.module_name)
+    return get_solver(module.main)(filename)
+
+
+@pytest.mark.parametrize("task", VARIANTS, ids=map(str, VARIANTS))
+# the larger input spans several of the blocks some variants parse at a time
+@pytest.mark.parametrize("seed, size", [(0, 300), (1, 300), (0, 10_000)])
+def test_variant_answers(tmp_path: Path, task: Task, seed: int, size: int) -> None:
+    filename = write_input(task.day, size, tmp_path, seed=seed)
+    original = task._replace(variant="")
+    assert solve(task, filename) == solve(original, filename)
+
+
+@pytest.mark.parametrize("task", VARIANTS, ids=map(str, VARIANTS))
+def test_variant_without_final_line_break(tmp_path: Path, task: Task) -> None:
+    filename = write_input(task.day, 30, tmp_path)
+    stripped = tmp_path / "stripped.txt"
+    stripped.write_text(filename.read_text().rstrip("\n"))
+    original = task._replace(variant="")
+    assert solve(task, stripped) == solve(original, stripped)
+
+
+@pytest.mark.parametrize("task", VARIANTS, ids=map(str, VARIANTS))
+@pytest.mark.parametrize("size", [30, 10_000])
+def test_variant_with_windows_line_breaks(
+    tmp_path: Path, task: Task, size: int
+) -> None:
+    filename = write_input(task.day, size, tmp_path)
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(filename.read_bytes().replace(b"\n", b"\r\n"))
+    original = task._replace(variant="")
+    assert solve(task, crlf) == solve(original, crlf) == solve(original, filename)